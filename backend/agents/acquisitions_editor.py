@@ -3,12 +3,17 @@ Acquisitions Editor - Market Assessment & Editorial Vision
 First stage in professional publishing workflow
 """
 
+import re
 from typing import List, Dict
 from agents.base import Agent
 from core.style_sheet import StyleSheet
 from core.llm_client import LLMClient
 
 
+# <thinking>...</thinking> blocks, or an unclosed <thinking>... to end of text
+_THINKING_RE = re.compile(r'<thinking>.*?(?:</thinking>|$)', re.DOTALL)
+
+
 class AcquisitionsEditor(Agent):
     """
     Acquisitions Editor - Market Assessment & Vision
@@ -85,8 +90,7 @@ MANUSCRIPT DETAILS:
 - Genre: {style_sheet.genre or "Unknown"}
 - Word Count: {style_sheet.word_count:,} words
 
-MANUSCRIPT TEXT:
-{text}
+MANUSCRIPT TEXT: see above
 
 STRUCTURE:
 1. **The Hook & Market Appeal**: What makes this book special? Why will it sell?
@@ -96,7 +100,7 @@ STRUCTURE:
 
 TONE: Professional, encouraging but honest, industry-focused.
 """
-        return self.generate(prompt, max_tokens=6000, temperature=0.7)
+        return self.generate(prompt, max_tokens=6000, temperature=0.7, shared_context=f"MANUSCRIPT:\n{text}")
 
     def _generate_marketing_blurb(self, text: str, style_sheet: StyleSheet) -> str:
         """Generate a catchy marketing blurb (back cover copy)"""
@@ -135,8 +139,7 @@ MANUSCRIPT DETAILS:
 - Genre: {style_sheet.genre or "Unknown"}
 - Word Count: {style_sheet.word_count:,} words
 
-MANUSCRIPT TEXT:
-{text}
+MANUSCRIPT TEXT: see above
 
 ***CRITICAL REQUIREMENTS (READ CAREFULLY):***
 1. **NO INTERNAL MONOLOGUE**: Do NOT output <thinking> tags or any internal reasoning. Start directly with the synopsis content.
@@ -170,12 +173,10 @@ Use Markdown headers for sections:
 [Detailed summary of the ending, INCLUDING SPOILERS]
 """
         
-        response = self.generate(prompt, max_tokens=8000, temperature=0.4)
+        response = self.generate(prompt, max_tokens=8000, temperature=0.4, shared_context=f"MANUSCRIPT:\n{text}")
         
         # Clean up any <thinking> blocks if the model included them (handling unclosed tags)
-        import re
-        # Remove <thinking>...</thinking> OR <thinking>... (end of string)
-        response = re.sub(r'<thinking>.*?(?:</thinking>|$)', '', response, flags=re.DOTALL).strip()
+        response = _THINKING_RE.sub('', response).strip()
         
         return response
     
@@ -191,8 +192,7 @@ MANUSCRIPT:
 - Word Count: {style_sheet.word_count:,}
 - Target Audience: {style_sheet.target_audience or "TBD"}
 
-SAMPLE TEXT:
-{text[:5000]}
+SAMPLE TEXT: see above
 
 Provide estimates in JSON format:
 {{
@@ -211,7 +211,7 @@ Provide estimates in JSON format:
 Be realistic based on current market conditions.
 """
         
-        response = self.generate(prompt, max_tokens=1000, temperature=0.3)
+        response = self.generate(prompt, max_tokens=1000, temperature=0.3, shared_context=f"MANUSCRIPT:\n{text[:5000]}")
         
         try:
             return self.parse_json_response(response)
@@ -228,8 +228,7 @@ Identify 5 comparable titles (comps) for this manuscript.
 MANUSCRIPT:
 - Genre: {style_sheet.genre or "Unknown"}
 
-SAMPLE:
-{text[:5000]}
+SAMPLE: see above
 
 Return JSON array of comps:
 [
@@ -246,7 +245,7 @@ Return JSON array of comps:
 Choose recent bestsellers (last 10 years) that readers of THIS book would also enjoy.
 """
         
-        response = self.generate(prompt, max_tokens=1500, temperature=0.5)
+        response = self.generate(prompt, max_tokens=1500, temperature=0.5, shared_context=f"MANUSCRIPT:\n{text[:5000]}")
         
         try:
             return self.parse_json_response(response)
@@ -263,8 +262,7 @@ Define the target audience for this manuscript.
 MANUSCRIPT:
 - Genre: {style_sheet.genre or "Unknown"}
 
-SAMPLE:
-{text[:5000]}
+SAMPLE: see above
 
 Return JSON:
 {{
@@ -285,7 +283,7 @@ Return JSON:
 }}
 """
         
-        response = self.generate(prompt, max_tokens=1000, temperature=0.5)
+        response = self.generate(prompt, max_tokens=1000, temperature=0.5, shared_context=f"MANUSCRIPT:\n{text[:5000]}")
         
         try:
             return self.parse_json_response(response)
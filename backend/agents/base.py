@@ -2,11 +2,19 @@
 Base Agent class for all EditScribe agents
 """
 
+import asyncio
+import json
+import re
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Callable
 from core.llm_client import LLMClient
 
 
+# Opening and closing markdown code fences around an LLM's JSON
+_OPEN_FENCE_RE = re.compile(r'^```(?:json)?\s*\n')
+_CLOSE_FENCE_RE = re.compile(r'\n```\s*$')
+
+
 class Agent(ABC):
     """Base class for all review and editing agents"""
     
@@ -31,7 +39,28 @@ class Agent(ABC):
         """Execute the agent's main function"""
         pass
     
-    def generate(self, prompt: str, max_tokens: int = 4000, temperature: float = 0.7) -> str:
+    async def aexecute(self, *args, **kwargs) -> Any:
+        """
+        Async version of execute.
+        
+        Runs execute in a worker thread; agents override this with a native
+        coroutine (using agenerate) so their LLM calls don't hold a thread.
+        """
+        return await asyncio.to_thread(self.execute, *args, **kwargs)
+    
+    async def astream_execute(self, *args, **kwargs) -> AsyncIterator[Any]:
+        """
+        Async version of execute that yields results (e.g. Issues) one at a
+        time, as soon as each is available.
+        
+        Yields aexecute's results once it finishes; agents override this to
+        stream their LLM response and yield each result as it's parsed.
+        """
+        for result in await self.aexecute(*args, **kwargs):
+            yield result
+    
+    def generate(self, prompt: str, max_tokens: int = 4000, temperature: float = 0.7,
+                 shared_context: str = None) -> str:
         """
         Generate content using the appropriate LLM for this agent.
         
@@ -39,6 +68,8 @@ class Agent(ABC):
             prompt: The prompt to send
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            shared_context: Text several prompts share (e.g. the manuscript
+                chunk), sent first so the provider can cache it
             
         Returns:
             Generated text
@@ -48,9 +79,115 @@ class Agent(ABC):
             prompt=prompt,
             max_tokens=max_tokens,
             temperature=temperature,
-            context_id=self.context_id
+            context_id=self.context_id,
+            shared_context=shared_context
+        )
+    
+    async def agenerate(self, prompt: str, max_tokens: int = 4000, temperature: float = 0.7,
+                        shared_context: str = None) -> str:
+        """Async version of generate, using the LLM client's async SDK client"""
+        return await self.llm_client.agenerate_content(
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            context_id=self.context_id,
+            shared_context=shared_context
+        )
+    
+    def agenerate_stream(self, prompt: str, max_tokens: int = 4000, temperature: float = 0.7,
+                         shared_context: str = None) -> AsyncIterator[str]:
+        """Stream generated text in chunks, as the LLM produces it"""
+        return self.llm_client.astream(
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            context_id=self.context_id,
+            shared_context=shared_context
         )
     
+    async def aiter_json_items(self, chunks: AsyncIterator[str]) -> AsyncIterator[Any]:
+        """
+        Incrementally parse a streamed JSON array response.
+        
+        Each array element is yielded as soon as it has been received in
+        full. Text before the opening bracket (e.g. a code fence) is skipped.
+        
+        Args:
+            chunks: Response text chunks
+            
+        Yields:
+            Parsed array elements, in order
+        """
+        decoder = json.JSONDecoder()
+        buffer = ""
+        pos = None  # Parse position, once the opening "[" has been seen
+        async for chunk in chunks:
+            buffer += chunk
+            if pos is None:
+                start = buffer.find('[')
+                if start < 0:
+                    continue
+                pos = start + 1
+            while True:
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                    pos += 1
+                if pos >= len(buffer) or buffer[pos] == ']':
+                    break
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Element not complete yet
+                    break
+                if end >= len(buffer):
+                    # A number at the end of the buffer may continue in the
+                    # next chunk; a complete element is followed by "," or "]"
+                    break
+                pos = end
+                yield item
+            # Drop what's been parsed so the buffer only holds the pending element
+            buffer = buffer[pos:]
+            pos = 0
+    
+    def chunk_manuscript(self, manuscript_text: str, chunk_size: int = 50000) -> List[str]:
+        """Split a manuscript into chunks small enough for one prompt"""
+        return [manuscript_text[i:i+chunk_size] for i in range(0, len(manuscript_text), chunk_size)]
+    
+    def run_check(self, prompt: str, text: str, to_results: Callable[[list], list],
+                  temperature: float, action: str) -> list:
+        """
+        Run one check prompt over a manuscript chunk and convert its JSON
+        array reply.
+        
+        Args:
+            prompt: The check's instructions
+            text: Manuscript chunk, sent as the shared (cacheable) context
+            to_results: Turns the parsed JSON array into results (e.g. Issues)
+            temperature: Sampling temperature
+            action: What the check does, for the failure message
+                (e.g. "check grammar")
+            
+        Returns:
+            to_results' results, or [] if the call or parsing failed
+        """
+        try:
+            response = self.generate(prompt, max_tokens=4000, temperature=temperature,
+                                     shared_context=f"MANUSCRIPT:\n{text}")
+            return to_results(self.parse_json_response(response))
+        except Exception as e:
+            print(f"⚠️  Failed to {action}: {e}")
+            return []
+    
+    async def arun_check(self, prompt: str, text: str, to_results: Callable[[list], list],
+                         temperature: float, action: str) -> list:
+        """Async version of run_check"""
+        try:
+            response = await self.agenerate(prompt, max_tokens=4000, temperature=temperature,
+                                            shared_context=f"MANUSCRIPT:\n{text}")
+            return to_results(self.parse_json_response(response))
+        except Exception as e:
+            print(f"⚠️  Failed to {action}: {e}")
+            return []
+    
     def parse_json_response(self, response: str):
         """
         Parse JSON from LLM response, stripping markdown code fences if present.
@@ -61,16 +198,19 @@ class Agent(ABC):
         Returns:
             Parsed JSON object
         """
-        import json
-        import re
+        from core.io import loads_json
         
         # Strip markdown code fences if present
         # Matches: ```json\n...\n``` or ```\n...\n```
         response = response.strip()
         if response.startswith('```'):
             # Remove opening fence
-            response = re.sub(r'^```(?:json)?\s*\n', '', response)
+            response = _OPEN_FENCE_RE.sub('', response)
             # Remove closing fence
-            response = re.sub(r'\n```\s*$', '', response)
+            response = _CLOSE_FENCE_RE.sub('', response)
         
-        return json.loads(response)
+        try:
+            return loads_json(response)
+        except ValueError:
+            # orjson is stricter than json (e.g. NaN), so retry with the stdlib
+            return json.loads(response)
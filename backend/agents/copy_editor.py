@@ -4,9 +4,11 @@ Fourth stage in professional publishing workflow
 Merges old Consistency Agent + Grammar Agent
 """
 
-from typing import List
+import asyncio
+import functools
+from typing import Callable, List, Tuple
 from agents.base import Agent
-from core.style_sheet import StyleSheet
+from core.style_sheet import StyleSheet, CharacterStyle
 from core.issue import Issue
 from core.llm_client import LLMClient
 
@@ -48,40 +50,65 @@ class CopyEditor(Agent):
         print(f"📝 Copy Editor: Checking grammar and consistency...")
         
         issues = []
+        chunks = self.chunk_manuscript(manuscript_text)
+        print(f"   Processing {len(chunks)} chunks...")
+        
+        for i, chunk in enumerate(chunks):
+            print(f"   - Chunk {i+1}/{len(chunks)}")
+            for action, prompt, to_issues in self._checks(style_sheet):
+                issues.extend(self.run_check(prompt, chunk, to_issues, 0.1, action))
+        
+        print(f"✅ Copy Editor: Found {len(issues)} mechanical issues")
         
-        # Chunk the manuscript
-        chunk_size = 50000
-        chunks = [manuscript_text[i:i+chunk_size] for i in range(0, len(manuscript_text), chunk_size)]
+        return issues
+    
+    async def aexecute(self, manuscript_text: str, style_sheet: StyleSheet) -> List[Issue]:
+        """Async version of execute, running each chunk's checks concurrently"""
+        print(f"📝 Copy Editor: Checking grammar and consistency...")
         
+        issues = []
+        chunks = self.chunk_manuscript(manuscript_text)
         print(f"   Processing {len(chunks)} chunks...")
         
         for i, chunk in enumerate(chunks):
             print(f"   - Chunk {i+1}/{len(chunks)}")
-            
-            # Grammar and punctuation
-            issues.extend(self._check_grammar(chunk))
-            
-            # Timeline consistency
-            issues.extend(self._check_timeline(chunk, style_sheet))
-            
-            # Character consistency
-            issues.extend(self._check_character_consistency(chunk, style_sheet))
-            
-            # House style compliance
-            issues.extend(self._check_house_style(chunk, style_sheet))
+            results = await asyncio.gather(*[
+                self.arun_check(prompt, chunk, to_issues, 0.1, action)
+                for action, prompt, to_issues in self._checks(style_sheet)
+            ])
+            for found in results:
+                issues.extend(found)
         
         print(f"✅ Copy Editor: Found {len(issues)} mechanical issues")
         
         return issues
     
-    def _check_grammar(self, text: str) -> List[Issue]:
-        """Check grammar and punctuation"""
-        issues = []
+    def _checks(self, style_sheet: StyleSheet) -> List[Tuple[str, str, Callable[[list], List[Issue]]]]:
+        """(action, prompt, issue builder) for each check run on every chunk, in report order"""
+        # Grammar and punctuation
+        checks = [("check grammar", self._grammar_prompt(), self._grammar_issues)]
+        
+        # Timeline consistency
+        if style_sheet.timeline:
+            checks.append(("check timeline", self._timeline_prompt(style_sheet), self._timeline_issues))
+        
+        # Character consistency
+        for char in style_sheet.characters[:5]:  # Top 5 characters
+            checks.append((
+                f"check {char.name}",
+                self._character_prompt(char),
+                functools.partial(self._character_issues, char.name)
+            ))
         
-        prompt = f"""You are a Copy Editor checking GRAMMAR and PUNCTUATION.
+        # House style compliance
+        checks.append(("check house style", self._house_style_prompt(style_sheet), self._house_style_issues))
+        return checks
+    
+    def _grammar_prompt(self) -> str:
+        """Prompt for the grammar and punctuation check"""
+        return f"""You are a Copy Editor checking GRAMMAR and PUNCTUATION.
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 Identify errors:
 - Subject-verb agreement
@@ -105,46 +132,36 @@ CRITICAL RULES:
 2. Include the CORRECTED version in "suggestion"
 3. If no errors found, return: []
 """
-        
-        try:
-            response = self.generate(prompt, max_tokens=4000, temperature=0.1)
-            grammar_issues = self.parse_json_response(response)
-            
-            for issue_data in grammar_issues:
-                self.issue_counter += 1
-                issues.append(Issue(
-                    id=self.issue_counter,
-                    stage="copy",
-                    severity="minor",
-                    category="grammar",
-                    location=issue_data.get("location", "Unknown"),
-                    original_text=issue_data.get("quote", ""),
-                    description=issue_data.get("description", "Grammar error"),
-                    suggestion=issue_data.get("suggestion", "Fix grammar"),
-                    bible_conflict=False
-                ))
-        except Exception as e:
-            print(f"⚠️  Failed to check grammar: {e}")
-        
-        return issues
     
-    def _check_timeline(self, text: str, style_sheet: StyleSheet) -> List[Issue]:
-        """Check timeline consistency"""
+    def _grammar_issues(self, issues_data: list) -> List[Issue]:
+        """Grammar issues from the grammar check's JSON reply"""
         issues = []
-        
-        if not style_sheet.timeline:
-            return issues
-        
+        for issue_data in issues_data:
+            self.issue_counter += 1
+            issues.append(Issue(
+                id=self.issue_counter,
+                stage="copy",
+                severity="minor",
+                category="grammar",
+                location=issue_data.get("location", "Unknown"),
+                original_text=issue_data.get("quote", ""),
+                description=issue_data.get("description", "Grammar error"),
+                suggestion=issue_data.get("suggestion", "Fix grammar"),
+                bible_conflict=False
+            ))
+        return issues
+    
+    def _timeline_prompt(self, style_sheet: StyleSheet) -> str:
+        """Prompt for the timeline check against the Style Sheet timeline"""
         timeline_str = "\n".join([f"- {e.date} ({e.day_of_week}): {e.event}" 
                                   for e in style_sheet.timeline[:10]])
         
-        prompt = f"""You are a Copy Editor checking TIMELINE CONSISTENCY.
+        return f"""You are a Copy Editor checking TIMELINE CONSISTENCY.
 
 STYLE SHEET TIMELINE:
 {timeline_str}
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 Find timeline errors:
 - Wrong day of week for a date
@@ -167,43 +184,35 @@ CRITICAL RULES:
 2. Reference the Style Sheet timeline
 3. If no errors found, return: []
 """
-        
-        try:
-            response = self.generate(prompt, max_tokens=4000, temperature=0.1)
-            timeline_issues = self.parse_json_response(response)
-            
-            for issue_data in timeline_issues:
-                self.issue_counter += 1
-                issues.append(Issue(
-                    id=self.issue_counter,
-                    stage="copy",
-                    severity="major",
-                    category="timeline",
-                    location=issue_data.get("location", "Unknown"),
-                    original_text=issue_data.get("quote", ""),
-                    description=issue_data.get("description", "Timeline inconsistency"),
-                    suggestion=issue_data.get("suggestion", "Fix timeline"),
-                    bible_conflict=True
-                ))
-        except Exception as e:
-            print(f"⚠️  Failed to check timeline: {e}")
-        
-        return issues
     
-    def _check_character_consistency(self, text: str, style_sheet: StyleSheet) -> List[Issue]:
-        """Check character consistency"""
+    def _timeline_issues(self, issues_data: list) -> List[Issue]:
+        """Timeline issues from the timeline check's JSON reply"""
         issues = []
-        
-        for char in style_sheet.characters[:5]:  # Top 5 characters
-            prompt = f"""You are a Copy Editor checking CHARACTER CONSISTENCY.
+        for issue_data in issues_data:
+            self.issue_counter += 1
+            issues.append(Issue(
+                id=self.issue_counter,
+                stage="copy",
+                severity="major",
+                category="timeline",
+                location=issue_data.get("location", "Unknown"),
+                original_text=issue_data.get("quote", ""),
+                description=issue_data.get("description", "Timeline inconsistency"),
+                suggestion=issue_data.get("suggestion", "Fix timeline"),
+                bible_conflict=True
+            ))
+        return issues
+    
+    def _character_prompt(self, char: CharacterStyle) -> str:
+        """Prompt for one character's consistency check"""
+        return f"""You are a Copy Editor checking CHARACTER CONSISTENCY.
 
 CHARACTER: {char.name}
 - Physical: {char.physical_description}
 - Age: {char.age}
 - Occupation: {char.occupation}
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 Find contradictions where the manuscript describes {char.name} differently.
 
@@ -222,36 +231,30 @@ CRITICAL RULES:
 2. Reference the Style Sheet entry
 3. If no errors found, return: []
 """
-            
-            try:
-                response = self.generate(prompt, max_tokens=4000, temperature=0.1)
-                char_issues = self.parse_json_response(response)
-                
-                for issue_data in char_issues:
-                    self.issue_counter += 1
-                    issues.append(Issue(
-                        id=self.issue_counter,
-                        stage="copy",
-                        severity="major",
-                        category="consistency",
-                        location=issue_data.get("location", "Unknown"),
-                        original_text=issue_data.get("quote", ""),
-                        description=f"Character '{char.name}': {issue_data.get('description', 'Inconsistency')}",
-                        suggestion=issue_data.get("suggestion", "Fix inconsistency"),
-                        bible_conflict=True
-                    ))
-            except Exception as e:
-                print(f"⚠️  Failed to check {char.name}: {e}")
-        
-        return issues
     
-    def _check_house_style(self, text: str, style_sheet: StyleSheet) -> List[Issue]:
-        """Check house style compliance"""
+    def _character_issues(self, char_name: str, issues_data: list) -> List[Issue]:
+        """Character issues from one character check's JSON reply"""
         issues = []
-        
+        for issue_data in issues_data:
+            self.issue_counter += 1
+            issues.append(Issue(
+                id=self.issue_counter,
+                stage="copy",
+                severity="major",
+                category="consistency",
+                location=issue_data.get("location", "Unknown"),
+                original_text=issue_data.get("quote", ""),
+                description=f"Character '{char_name}': {issue_data.get('description', 'Inconsistency')}",
+                suggestion=issue_data.get("suggestion", "Fix inconsistency"),
+                bible_conflict=True
+            ))
+        return issues
+    
+    def _house_style_prompt(self, style_sheet: StyleSheet) -> str:
+        """Prompt for the house style check"""
         rules = style_sheet.custom_rules
         
-        prompt = f"""You are a Copy Editor checking HOUSE STYLE compliance.
+        return f"""You are a Copy Editor checking HOUSE STYLE compliance.
 
 HOUSE STYLE RULES:
 - Oxford comma: {"Required" if rules.oxford_comma else "Not used"}
@@ -259,8 +262,7 @@ HOUSE STYLE RULES:
 - Time format: {rules.time_format}
 - Quote style: {rules.quote_style} quotes
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 Find house style violations.
 
@@ -279,25 +281,21 @@ CRITICAL RULES:
 2. Show the CORRECTED version
 3. If no violations found, return: []
 """
-        
-        try:
-            response = self.generate(prompt, max_tokens=4000, temperature=0.1)
-            style_issues = self.parse_json_response(response)
-            
-            for issue_data in style_issues:
-                self.issue_counter += 1
-                issues.append(Issue(
-                    id=self.issue_counter,
-                    stage="copy",
-                    severity="minor",
-                    category="house_style",
-                    location=issue_data.get("location", "Unknown"),
-                    original_text=issue_data.get("quote", ""),
-                    description=issue_data.get("description", "House style violation"),
-                    suggestion=issue_data.get("suggestion", "Apply house style"),
-                    bible_conflict=False
-                ))
-        except Exception as e:
-            print(f"⚠️  Failed to check house style: {e}")
-        
+    
+    def _house_style_issues(self, issues_data: list) -> List[Issue]:
+        """House style issues from the house style check's JSON reply"""
+        issues = []
+        for issue_data in issues_data:
+            self.issue_counter += 1
+            issues.append(Issue(
+                id=self.issue_counter,
+                stage="copy",
+                severity="minor",
+                category="house_style",
+                location=issue_data.get("location", "Unknown"),
+                original_text=issue_data.get("quote", ""),
+                description=issue_data.get("description", "House style violation"),
+                suggestion=issue_data.get("suggestion", "Apply house style"),
+                bible_conflict=False
+            ))
         return issues
@@ -3,7 +3,7 @@ Developmental Review Agent - checks plot, character arcs, pacing
 Uses Claude Sonnet 4.5 for complex story analysis
 """
 
-from typing import List
+from typing import AsyncIterator, List, Optional
 from agents.base import Agent
 from core.style_sheet import StyleSheet
 from core.issue import Issue
@@ -24,29 +24,51 @@ class DevelopmentalEditor(Agent):
         super().__init__("developmental", llm_client)
         self.issue_counter = 0
     
-    def execute(self, manuscript_text: str, style_sheet: StyleSheet) -> List[Issue]:
+    def execute(self, manuscript_text: str, style_sheet: StyleSheet, bible_prompt: Optional[str] = None) -> List[Issue]:
         """
         Review manuscript for developmental issues.
         
         Args:
             manuscript_text: Full manuscript
             style_sheet: Style Sheet for context
+            bible_prompt: Pre-rendered render_bible_prompt(style_sheet), so
+                callers reviewing many chunks render it once
             
         Returns:
             List of developmental issues
         """
         print(f"📖 Running developmental review...")
+        response = self.generate(self.build_prompt(manuscript_text, style_sheet, bible_prompt), max_tokens=4000, temperature=0.3)
+        return self.parse_response(response)
+    
+    async def aexecute(self, manuscript_text: str, style_sheet: StyleSheet, bible_prompt: Optional[str] = None) -> List[Issue]:
+        """Async version of execute"""
+        print(f"📖 Running developmental review...")
+        response = await self.agenerate(self.build_prompt(manuscript_text, style_sheet, bible_prompt), max_tokens=4000, temperature=0.3)
+        return self.parse_response(response)
+    
+    async def astream_execute(self, manuscript_text: str, style_sheet: StyleSheet, bible_prompt: Optional[str] = None) -> AsyncIterator[Issue]:
+        """Streaming version of aexecute, yielding each issue as it's parsed"""
+        print(f"📖 Running developmental review...")
+        chunks = self.agenerate_stream(self.build_prompt(manuscript_text, style_sheet, bible_prompt), max_tokens=4000, temperature=0.3)
+        count = 0
+        async for issue_data in self.aiter_json_items(chunks):
+            if isinstance(issue_data, dict):
+                count += 1
+                yield self._issue_from_data(issue_data)
+        print(f"✅ Found {count} developmental issues")
+    
+    def build_prompt(self, manuscript_text: str, style_sheet: StyleSheet, bible_prompt: Optional[str] = None) -> str:
+        """
+        Build the developmental review prompt. execute makes this one call,
+        so with parse_response the prompt can also go in a batch job.
+        """
+        if bible_prompt is None:
+            bible_prompt = self.render_bible_prompt(style_sheet)
         
-        # Build character context from Style Sheet
-        char_context = "\n".join([
-            f"- {c.name}: {c.occupation}, {c.personality_traits}"
-            for c in style_sheet.characters
-        ])
-        
-        prompt = f"""You are a professional developmental editor. Review this manuscript for BIG-PICTURE issues.
+        return f"""You are a professional developmental editor. Review this manuscript for BIG-PICTURE issues.
 
-CHARACTERS (from Style Sheet):
-{char_context}
+{bible_prompt}
 
 MANUSCRIPT:
 {manuscript_text}
@@ -70,28 +92,40 @@ Return ONLY a JSON array of issues:
 ]
 
 Focus on MAJOR issues only. Return [] if none found."""
-
-        response = self.generate(prompt, max_tokens=4000, temperature=0.3)
-        
+    
+    def render_bible_prompt(self, style_sheet: StyleSheet) -> str:
+        """Render the Style Sheet context the prompt embeds (the character list)"""
+        char_context = "\n".join([
+            f"- {c.name}: {c.occupation}, {c.personality_traits}"
+            for c in style_sheet.characters
+        ])
+        return f"CHARACTERS (from Style Sheet):\n{char_context}"
+    
+    def parse_response(self, response: str) -> List[Issue]:
+        """Turn the LLM response into Issues"""
         issues = []
         try:
             issues_data = self.parse_json_response(response)
             
             for issue_data in issues_data:
-                self.issue_counter += 1
-                issues.append(Issue(
-                    id=self.issue_counter,
-                    stage="developmental",
-                    severity=issue_data.get("severity", "major"),
-                    category=issue_data.get("category", "plot"),
-                    location=issue_data.get("location", "Unknown"),
-                    original_text=issue_data.get("quote", ""),
-                    description=issue_data.get("description", ""),
-                    suggestion=issue_data.get("suggestion", ""),
-                    bible_conflict=False
-                ))
+                issues.append(self._issue_from_data(issue_data))
         except:
             pass
         
         print(f"✅ Found {len(issues)} developmental issues")
         return issues
+    
+    def _issue_from_data(self, issue_data: dict) -> Issue:
+        """Build an Issue from one element of the LLM's JSON array"""
+        self.issue_counter += 1
+        return Issue(
+            id=self.issue_counter,
+            stage="developmental",
+            severity=issue_data.get("severity", "major"),
+            category=issue_data.get("category", "plot"),
+            location=issue_data.get("location", "Unknown"),
+            original_text=issue_data.get("quote", ""),
+            description=issue_data.get("description", ""),
+            suggestion=issue_data.get("suggestion", ""),
+            bible_conflict=False
+        )
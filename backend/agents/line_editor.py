@@ -3,7 +3,8 @@ Line Editor - Prose Polishing
 Third stage in professional publishing workflow
 """
 
-from typing import List
+import asyncio
+from typing import Callable, List, Tuple
 from agents.base import Agent
 from core.style_sheet import StyleSheet
 from core.issue import Issue
@@ -47,43 +48,58 @@ class LineEditor(Agent):
         print(f"   Manuscript length: {len(manuscript_text)} characters")
         
         issues = []
-        
-        # Chunk the manuscript to handle large texts
-        chunk_size = 50000
-        chunks = [manuscript_text[i:i+chunk_size] for i in range(0, len(manuscript_text), chunk_size)]
-        
+        chunks = self.chunk_manuscript(manuscript_text)
         print(f"   Processing {len(chunks)} chunks...")
         
         for i, chunk in enumerate(chunks):
             print(f"   - Chunk {i+1}/{len(chunks)} ({len(chunk)} chars)")
-            
-            # Analyze voice and tone
-            voice_issues = self._analyze_voice(chunk)
-            print(f"      Voice issues found: {len(voice_issues)}")
-            issues.extend(voice_issues)
-            
-            # Find wordiness
-            word_issues = self._find_wordiness(chunk)
-            print(f"      Wordiness issues found: {len(word_issues)}")
-            issues.extend(word_issues)
-            
-            # Find awkward phrasing
-            awkward_issues = self._find_awkward_phrasing(chunk)
-            print(f"      Awkward phrasing issues found: {len(awkward_issues)}")
-            issues.extend(awkward_issues)
+            for name, prompt, to_issues in self._checks():
+                print(f"      🔍 Calling LLM for {name} analysis...")
+                found = self.run_check(prompt, chunk, to_issues, 0.3, f"analyze {name}")
+                print(f"      {name.capitalize()} issues found: {len(found)}")
+                issues.extend(found)
         
         print(f"✅ Line Editor: Found {len(issues)} prose issues TOTAL")
         
         return issues
     
-    def _analyze_voice(self, text: str) -> List[Issue]:
-        """Analyze voice consistency"""
+    async def aexecute(self, manuscript_text: str, style_sheet: StyleSheet) -> List[Issue]:
+        """Async version of execute, running each chunk's checks concurrently"""
+        print(f"✍️  Line Editor: Polishing prose...")
+        print(f"   Manuscript length: {len(manuscript_text)} characters")
+        
         issues = []
+        chunks = self.chunk_manuscript(manuscript_text)
+        print(f"   Processing {len(chunks)} chunks...")
+        
+        for i, chunk in enumerate(chunks):
+            print(f"   - Chunk {i+1}/{len(chunks)} ({len(chunk)} chars)")
+            checks = self._checks()
+            results = await asyncio.gather(*[
+                self.arun_check(prompt, chunk, to_issues, 0.3, f"analyze {name}")
+                for name, prompt, to_issues in checks
+            ])
+            for (name, _, _), found in zip(checks, results):
+                print(f"      {name.capitalize()} issues found: {len(found)}")
+                issues.extend(found)
         
-        prompt = f"""You are a Line Editor analyzing VOICE and TONE.
+        print(f"✅ Line Editor: Found {len(issues)} prose issues TOTAL")
+        
+        return issues
+    
+    def _checks(self) -> List[Tuple[str, str, Callable[[list], List[Issue]]]]:
+        """(name, prompt, issue builder) for each check run on every chunk"""
+        return [
+            ("voice", self._voice_prompt(), self._voice_issues),
+            ("wordiness", self._wordiness_prompt(), self._wordiness_issues),
+            ("awkward phrasing", self._awkward_phrasing_prompt(), self._awkward_phrasing_issues),
+        ]
+    
+    def _voice_prompt(self) -> str:
+        """Prompt for the voice and tone check"""
+        return f"""You are a Line Editor analyzing VOICE and TONE.
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 Identify voice/tone problems:
 - Inconsistent narrative voice
@@ -108,44 +124,30 @@ CRITICAL RULES:
 3. Include actual "suggestion" text with how to fix it
 4. If no issues found, return: []
 """
-        
-        try:
-            print(f"      🔍 Calling LLM for voice analysis...")
-            response = self.generate(prompt, max_tokens=4000, temperature=0.3)
-            print(f"      📝 LLM Response length: {len(response)} chars")
-            print(f"      📝 LLM Response (first 300 chars): {response[:300]}")
-            
-            voice_issues = self.parse_json_response(response)
-            print(f"      ✅ Parsed {len(voice_issues)} voice issues from JSON")
-            
-            for issue_data in voice_issues:
-                self.issue_counter += 1
-                issues.append(Issue(
-                    id=self.issue_counter,
-                    stage="line",
-                    severity=issue_data.get("severity", "minor"),
-                    category="voice",
-                    location=issue_data.get("location", "Unknown"),
-                    original_text=issue_data.get("quote", ""),
-                    description=issue_data.get("description", "Voice/tone issue"),
-                    suggestion=issue_data.get("suggestion", "Review and revise"),
-                    bible_conflict=False
-                ))
-        except Exception as e:
-            print(f"      ⚠️  Failed to analyze voice: {e}")
-            import traceback
-            traceback.print_exc()
-        
-        return issues
     
-    def _find_wordiness(self, text: str) -> List[Issue]:
-        """Find wordy passages"""
+    def _voice_issues(self, issues_data: list) -> List[Issue]:
+        """Voice/tone issues from the voice check's JSON reply"""
         issues = []
-        
-        prompt = f"""You are a Line Editor finding WORDINESS.
+        for issue_data in issues_data:
+            self.issue_counter += 1
+            issues.append(Issue(
+                id=self.issue_counter,
+                stage="line",
+                severity=issue_data.get("severity", "minor"),
+                category="voice",
+                location=issue_data.get("location", "Unknown"),
+                original_text=issue_data.get("quote", ""),
+                description=issue_data.get("description", "Voice/tone issue"),
+                suggestion=issue_data.get("suggestion", "Review and revise"),
+                bible_conflict=False
+            ))
+        return issues
+    
+    def _wordiness_prompt(self) -> str:
+        """Prompt for the wordiness check"""
+        return f"""You are a Line Editor finding WORDINESS.
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 Identify wordy passages:
 - Redundant phrases ("past history", "future plans")
@@ -168,43 +170,30 @@ CRITICAL RULES:
 2. Include the REWRITTEN tighter version in "suggestion"
 3. If no issues found, return: []
 """
-        
-        try:
-            print(f"      🔍 Calling LLM for wordiness analysis...")
-            response = self.generate(prompt, max_tokens=4000, temperature=0.3)
-            print(f"      📝 LLM Response length: {len(response)} chars")
-            
-            wordiness_issues = self.parse_json_response(response)
-            print(f"      ✅ Parsed {len(wordiness_issues)} wordiness issues from JSON")
-            
-            for issue_data in wordiness_issues:
-                self.issue_counter += 1
-                issues.append(Issue(
-                    id=self.issue_counter,
-                    stage="line",
-                    severity="minor",
-                    category="wordiness",
-                    location=issue_data.get("location", "Unknown"),
-                    original_text=issue_data.get("quote", ""),
-                    description=issue_data.get("description", "Wordy passage"),
-                    suggestion=issue_data.get("suggestion", "Tighten prose"),
-                    bible_conflict=False
-                ))
-        except Exception as e:
-            print(f"      ⚠️  Failed to find wordiness: {e}")
-            import traceback
-            traceback.print_exc()
-        
-        return issues
     
-    def _find_awkward_phrasing(self, text: str) -> List[Issue]:
-        """Find awkward phrasing"""
+    def _wordiness_issues(self, issues_data: list) -> List[Issue]:
+        """Wordy passages from the wordiness check's JSON reply"""
         issues = []
-        
-        prompt = f"""You are a Line Editor finding AWKWARD PHRASING.
+        for issue_data in issues_data:
+            self.issue_counter += 1
+            issues.append(Issue(
+                id=self.issue_counter,
+                stage="line",
+                severity="minor",
+                category="wordiness",
+                location=issue_data.get("location", "Unknown"),
+                original_text=issue_data.get("quote", ""),
+                description=issue_data.get("description", "Wordy passage"),
+                suggestion=issue_data.get("suggestion", "Tighten prose"),
+                bible_conflict=False
+            ))
+        return issues
+    
+    def _awkward_phrasing_prompt(self) -> str:
+        """Prompt for the awkward phrasing check"""
+        return f"""You are a Line Editor finding AWKWARD PHRASING.
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 Identify awkward sentences:
 - Unclear syntax
@@ -227,31 +216,21 @@ CRITICAL RULES:
 2. Include the REVISED smoother version in "suggestion"
 3. If no issues found, return: []
 """
-        
-        try:
-            print(f"      🔍 Calling LLM for awkward phrasing analysis...")
-            response = self.generate(prompt, max_tokens=4000, temperature=0.3)
-            print(f"      📝 LLM Response length: {len(response)} chars")
-            
-            awkward_issues = self.parse_json_response(response)
-            print(f"      ✅ Parsed {len(awkward_issues)} awkward phrasing issues from JSON")
-            
-            for issue_data in awkward_issues:
-                self.issue_counter += 1
-                issues.append(Issue(
-                    id=self.issue_counter,
-                    stage="line",
-                    severity="minor",
-                    category="syntax",
-                    location=issue_data.get("location", "Unknown"),
-                    original_text=issue_data.get("quote", ""),
-                    description=issue_data.get("description", "Awkward phrasing"),
-                    suggestion=issue_data.get("suggestion", "Revise for clarity"),
-                    bible_conflict=False
-                ))
-        except Exception as e:
-            print(f"      ⚠️  Failed to find awkward phrasing: {e}")
-            import traceback
-            traceback.print_exc()
-        
+    
+    def _awkward_phrasing_issues(self, issues_data: list) -> List[Issue]:
+        """Awkward phrasing issues from the awkward phrasing check's JSON reply"""
+        issues = []
+        for issue_data in issues_data:
+            self.issue_counter += 1
+            issues.append(Issue(
+                id=self.issue_counter,
+                stage="line",
+                severity="minor",
+                category="syntax",
+                location=issue_data.get("location", "Unknown"),
+                original_text=issue_data.get("quote", ""),
+                description=issue_data.get("description", "Awkward phrasing"),
+                suggestion=issue_data.get("suggestion", "Revise for clarity"),
+                bible_conflict=False
+            ))
         return issues
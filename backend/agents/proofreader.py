@@ -3,7 +3,8 @@ Proofreader - Final Quality Control
 Fifth stage in professional publishing workflow
 """
 
-from typing import List
+import asyncio
+from typing import Callable, List, Tuple
 from agents.base import Agent
 from core.style_sheet import StyleSheet
 from core.issue import Issue
@@ -46,34 +47,51 @@ class Proofreader(Agent):
         print(f"🔍 Proofreader: Final quality check...")
         
         issues = []
-        
-        # Chunk the manuscript
-        chunk_size = 50000
-        chunks = [manuscript_text[i:i+chunk_size] for i in range(0, len(manuscript_text), chunk_size)]
-        
+        chunks = self.chunk_manuscript(manuscript_text)
         print(f"   Processing {len(chunks)} chunks...")
         
         for i, chunk in enumerate(chunks):
             print(f"   - Chunk {i+1}/{len(chunks)}")
-            
-            # Find typos
-            issues.extend(self._find_typos(chunk))
-            
-            # Check formatting
-            issues.extend(self._check_formatting(chunk))
+            for action, prompt, to_issues in self._checks():
+                issues.extend(self.run_check(prompt, chunk, to_issues, 0.1, action))
         
         print(f"✅ Proofreader: Found {len(issues)} final issues")
         
         return issues
     
-    def _find_typos(self, text: str) -> List[Issue]:
-        """Find typos and spelling errors"""
+    async def aexecute(self, manuscript_text: str, style_sheet: StyleSheet) -> List[Issue]:
+        """Async version of execute, running each chunk's checks concurrently"""
+        print(f"🔍 Proofreader: Final quality check...")
+        
         issues = []
+        chunks = self.chunk_manuscript(manuscript_text)
+        print(f"   Processing {len(chunks)} chunks...")
         
-        prompt = f"""You are a Proofreader doing final TYPO CHECK.
+        for i, chunk in enumerate(chunks):
+            print(f"   - Chunk {i+1}/{len(chunks)}")
+            results = await asyncio.gather(*[
+                self.arun_check(prompt, chunk, to_issues, 0.1, action)
+                for action, prompt, to_issues in self._checks()
+            ])
+            for found in results:
+                issues.extend(found)
+        
+        print(f"✅ Proofreader: Found {len(issues)} final issues")
+        
+        return issues
+    
+    def _checks(self) -> List[Tuple[str, str, Callable[[list], List[Issue]]]]:
+        """(action, prompt, issue builder) for each check run on every chunk"""
+        return [
+            ("find typos", self._typos_prompt(), self._typo_issues),
+            ("check formatting", self._formatting_prompt(), self._formatting_issues),
+        ]
+    
+    def _typos_prompt(self) -> str:
+        """Prompt for the typo check"""
+        return f"""You are a Proofreader doing final TYPO CHECK.
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 Find:
 - Misspellings
@@ -97,37 +115,30 @@ CRITICAL RULES:
 2. Show the CORRECT spelling
 3. If no typos found, return: []
 """
-        
-        try:
-            response = self.generate(prompt, max_tokens=4000, temperature=0.1)
-            typo_issues = self.parse_json_response(response)
-            
-            for issue_data in typo_issues:
-                self.issue_counter += 1
-                issues.append(Issue(
-                    id=self.issue_counter,
-                    stage="proof",
-                    severity="minor",
-                    category="typo",
-                    location=issue_data.get("location", "Unknown"),
-                    original_text=issue_data.get("quote", ""),
-                    description=issue_data.get("description", "Typo"),
-                    suggestion=issue_data.get("suggestion", "Fix typo"),
-                    bible_conflict=False
-                ))
-        except Exception as e:
-            print(f"⚠️  Failed to find typos: {e}")
-        
-        return issues
     
-    def _check_formatting(self, text: str) -> List[Issue]:
-        """Check formatting consistency"""
+    def _typo_issues(self, issues_data: list) -> List[Issue]:
+        """Typos from the typo check's JSON reply"""
         issues = []
-        
-        prompt = f"""You are a Proofreader checking FORMATTING.
+        for issue_data in issues_data:
+            self.issue_counter += 1
+            issues.append(Issue(
+                id=self.issue_counter,
+                stage="proof",
+                severity="minor",
+                category="typo",
+                location=issue_data.get("location", "Unknown"),
+                original_text=issue_data.get("quote", ""),
+                description=issue_data.get("description", "Typo"),
+                suggestion=issue_data.get("suggestion", "Fix typo"),
+                bible_conflict=False
+            ))
+        return issues
+    
+    def _formatting_prompt(self) -> str:
+        """Prompt for the formatting check"""
+        return f"""You are a Proofreader checking FORMATTING.
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 Find formatting issues:
 - Inconsistent paragraph spacing
@@ -150,25 +161,21 @@ CRITICAL RULES:
 2. Provide CONCRETE fix
 3. If no issues found, return: []
 """
-        
-        try:
-            response = self.generate(prompt, max_tokens=4000, temperature=0.1)
-            format_issues = self.parse_json_response(response)
-            
-            for issue_data in format_issues:
-                self.issue_counter += 1
-                issues.append(Issue(
-                    id=self.issue_counter,
-                    stage="proof",
-                    severity="minor",
-                    category="formatting",
-                    location=issue_data.get("location", "Unknown"),
-                    original_text=issue_data.get("quote", ""),
-                    description=issue_data.get("description", "Formatting issue"),
-                    suggestion=issue_data.get("suggestion", "Fix formatting"),
-                    bible_conflict=False
-                ))
-        except Exception as e:
-            print(f"⚠️  Failed to check formatting: {e}")
-        
+    
+    def _formatting_issues(self, issues_data: list) -> List[Issue]:
+        """Formatting issues from the formatting check's JSON reply"""
+        issues = []
+        for issue_data in issues_data:
+            self.issue_counter += 1
+            issues.append(Issue(
+                id=self.issue_counter,
+                stage="proof",
+                severity="minor",
+                category="formatting",
+                location=issue_data.get("location", "Unknown"),
+                original_text=issue_data.get("quote", ""),
+                description=issue_data.get("description", "Formatting issue"),
+                suggestion=issue_data.get("suggestion", "Fix formatting"),
+                bible_conflict=False
+            ))
         return issues
@@ -72,8 +72,7 @@ For each character, identify:
 - First appearance (which chapter)
 - Relationships (to other characters)
 
-Manuscript:
-{text[:15000]}  # First 15k chars for context
+Manuscript: see above
 
 Return ONLY a JSON array of characters in this exact format:
 [
@@ -92,7 +91,7 @@ Return ONLY a JSON array of characters in this exact format:
 
 Return ONLY the JSON array, no other text."""
 
-        response = self.generate(prompt, max_tokens=3000, temperature=0.3)
+        response = self.generate(prompt, max_tokens=3000, temperature=0.3, shared_context=f"MANUSCRIPT:\n{text[:15000]}")
         
         try:
             # Parse JSON
@@ -134,8 +133,7 @@ For each location, identify:
 - Description (brief)
 - First appearance (which chapter)
 
-Manuscript:
-{text[:15000]}
+Manuscript: see above
 
 Return ONLY a JSON array of locations:
 [
@@ -149,7 +147,7 @@ Return ONLY a JSON array of locations:
 
 Return ONLY the JSON array, no other text."""
 
-        response = self.generate(prompt, max_tokens=2000, temperature=0.3)
+        response = self.generate(prompt, max_tokens=2000, temperature=0.3, shared_context=f"MANUSCRIPT:\n{text[:15000]}")
         
         try:
             locations_data = json.loads(response)
@@ -172,8 +170,7 @@ For each date/event, identify:
 - Events that happened on that day
 - Which chapter
 
-Manuscript:
-{text[:15000]}
+Manuscript: see above
 
 Return ONLY a JSON array of timeline events:
 [
@@ -187,7 +184,7 @@ Return ONLY a JSON array of timeline events:
 
 Return ONLY the JSON array, no other text."""
 
-        response = self.generate(prompt, max_tokens=2000, temperature=0.3)
+        response = self.generate(prompt, max_tokens=2000, temperature=0.3, shared_context=f"MANUSCRIPT:\n{text[:15000]}")
         
         try:
             timeline_data = json.loads(response)
@@ -210,8 +207,7 @@ For each object, identify:
 - Color (if mentioned)
 - First appearance (which chapter)
 
-Manuscript:
-{text[:15000]}
+Manuscript: see above
 
 Return ONLY a JSON array of objects:
 [
@@ -225,7 +221,7 @@ Return ONLY a JSON array of objects:
 
 Return ONLY the JSON array, no other text."""
 
-        response = self.generate(prompt, max_tokens=1500, temperature=0.3)
+        response = self.generate(prompt, max_tokens=1500, temperature=0.3, shared_context=f"MANUSCRIPT:\n{text[:15000]}")
         
         try:
             objects_data = json.loads(response)
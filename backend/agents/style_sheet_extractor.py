@@ -79,6 +79,32 @@ class StyleSheetExtractor:
         
         return style_sheet
 
+    async def extract_many(
+        self,
+        texts: List[str],
+        style_sheet: StyleSheet,
+        max_concurrency: int = 8
+    ) -> List[StyleSheet]:
+        """
+        Run extract_world_building over several texts, a few at a time.
+        
+        Args:
+            texts: Texts to extract from
+            style_sheet: Starting Style Sheet; each text gets its own copy
+            max_concurrency: Maximum extractions running at once (each
+                makes its four LLM calls in turn)
+            
+        Returns:
+            One populated Style Sheet per text, in the order of texts
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def extract_one(text: str) -> StyleSheet:
+            async with semaphore:
+                return await self.extract_world_building(text, style_sheet.model_copy(deep=True))
+        
+        return await asyncio.gather(*(extract_one(text) for text in texts))
+
     async def generate_synopsis(self, manuscript_text: str, style_sheet: StyleSheet) -> StyleSheet:
         """Generate only the synopsis"""
         print("Style Sheet Extractor: Generating Synopsis...")
@@ -107,14 +133,13 @@ REQUIREMENTS:
 3. Detail the major plot points, twists, and character turning points.
 4. Be objective and clear.
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 PROFESSIONAL SYNOPSIS:
 """
         try:
             # Use async generation with high token limit
-            response = await self.llm.agenerate_content(prompt, max_tokens=4000)
+            response = await self.llm.agenerate_content(prompt, max_tokens=4000, shared_context=f"MANUSCRIPT:\n{text}")
             return response.strip()
         except Exception as e:
             print(f"   Synopsis generation failed: {e}")
@@ -174,8 +199,7 @@ For each character, provide:
 - speech_patterns (how they talk, dialect, catchphrases)
 - arc_notes (brief character development notes)
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 RESPONSE FORMAT:
 Return ONLY a raw JSON array. Do not use markdown formatting.
@@ -193,7 +217,7 @@ Return ONLY a raw JSON array. Do not use markdown formatting.
 """
         
         try:
-            response = await self.llm.agenerate_content(prompt, max_tokens=4000)
+            response = await self.llm.agenerate_content(prompt, max_tokens=4000, shared_context=f"MANUSCRIPT:\n{text}")
             cleaned_response = self._clean_json_response(response)
             characters_data = json.loads(cleaned_response)
             
@@ -223,8 +247,7 @@ For each location, provide:
 - atmosphere (mood, feeling of the place)
 - key_features (list of strings)
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 RESPONSE FORMAT:
 Return ONLY a raw JSON array. Do not use markdown formatting.
@@ -239,7 +262,7 @@ Return ONLY a raw JSON array. Do not use markdown formatting.
 """
         
         try:
-            response = await self.llm.agenerate_content(prompt, max_tokens=4000)
+            response = await self.llm.agenerate_content(prompt, max_tokens=4000, shared_context=f"MANUSCRIPT:\n{text}")
             cleaned_response = self._clean_json_response(response)
             locations_data = json.loads(cleaned_response)
             
@@ -269,8 +292,7 @@ For each event, provide:
 - event (what happens)
 - chapter_reference (e.g. "Chapter 1")
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 RESPONSE FORMAT:
 Return ONLY a raw JSON array. Do not use markdown formatting.
@@ -285,7 +307,7 @@ Return ONLY a raw JSON array. Do not use markdown formatting.
 """
         
         try:
-            response = await self.llm.agenerate_content(prompt, max_tokens=4000)
+            response = await self.llm.agenerate_content(prompt, max_tokens=4000, shared_context=f"MANUSCRIPT:\n{text}")
             cleaned_response = self._clean_json_response(response)
             timeline_data = json.loads(cleaned_response)
             
@@ -311,8 +333,7 @@ For each object, provide:
 - color (string or null)
 - significance (why it matters)
 
-MANUSCRIPT:
-{text}
+MANUSCRIPT: see above
 
 RESPONSE FORMAT:
 Return ONLY a raw JSON array. Do not use markdown formatting.
@@ -327,7 +348,7 @@ Return ONLY a raw JSON array. Do not use markdown formatting.
 """
         
         try:
-            response = await self.llm.agenerate_content(prompt, max_tokens=4000)
+            response = await self.llm.agenerate_content(prompt, max_tokens=4000, shared_context=f"MANUSCRIPT:\n{text}")
             cleaned_response = self._clean_json_response(response)
             objects_data = json.loads(cleaned_response)
             
@@ -5,9 +5,15 @@ Follows industry-standard linear editing (big to small)
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+import asyncio
+import json
+import logging
 import uuid
 import tempfile
 import os
+import time
+from collections import OrderedDict
 
 import sys
 if 'core.llm_client' in sys.modules:
@@ -25,8 +31,9 @@ if not hasattr(LLMClient, 'generate'):
 from core.document_parser import DocumentParser
 from core.style_sheet import StyleSheet
 from core.managing_editor import ManagingEditor, EditingStage
-from core.issue import Issue
+from core.issue import Issue, issues_from_dicts
 from core.project_manager import ProjectManager
+from core.review_manager import MultiStageReviewManager
 from core.cancellation import cancellation_manager
 
 # Import professional agents
@@ -38,7 +45,20 @@ from agents.proofreader import Proofreader
 from agents.cold_reader import ColdReader
 from agents.selective_editor_agent import SelectiveEditorAgent
 
-app = FastAPI(title="EditScribe API - Professional Workflow", version="2.0.0")
+logger = logging.getLogger(__name__)
+
+# Serialize JSON responses with orjson when it's installed
+try:
+    import orjson  # noqa: F401
+    default_response_class = ORJSONResponse
+except ImportError:
+    default_response_class = JSONResponse
+
+app = FastAPI(
+    title="EditScribe API - Professional Workflow",
+    version="2.0.0",
+    default_response_class=default_response_class
+)
 
 # CORS middleware
 app.add_middleware(
@@ -65,6 +85,27 @@ style_sheets_storage = {}
 stage_results_storage = {}
 tasks_storage = {}
 
+# Open /tasks/{task_id}/stream connections, woken on every task state change
+task_listeners = {}
+
+
+def _notify_task(task_id: str):
+    """Wake the task's stream listeners"""
+    for event in task_listeners.get(task_id, ()):
+        event.set()
+
+
+def _set_task(task_id: str, state: dict):
+    """Replace a task's state and notify stream listeners"""
+    tasks_storage[task_id] = state
+    _notify_task(task_id)
+
+
+def _update_task(task_id: str, **fields):
+    """Update fields of a task's state and notify stream listeners"""
+    tasks_storage[task_id].update(fields)
+    _notify_task(task_id)
+
 @app.get("/")
 async def root():
     """Health check"""
@@ -133,36 +174,36 @@ async def upload_manuscript(file: UploadFile = File(...)):
     temp_dir = tempfile.gettempdir()
     temp_path = os.path.join(temp_dir, f"{manuscript_id}_{file.filename}")
     
-    print(f"DEBUG: Received upload request for {file.filename}")
+    logger.debug(f"Received upload request for {file.filename}")
     try:
         with open(temp_path, "wb") as f:
             content = await file.read()
             f.write(content)
-        print(f"DEBUG: File saved to {temp_path}")
+        logger.debug(f"File saved to {temp_path}")
     except Exception as e:
-        print(f"DEBUG: Error saving file: {e}")
+        logger.debug(f"Error saving file: {e}")
         raise HTTPException(status_code=500, detail=f"Error saving file: {str(e)}")
     
     try:
-        print("DEBUG: Parsing document...")
+        logger.debug("Parsing document...")
         text = DocumentParser.parse(temp_path)
-        print(f"DEBUG: Document parsed. Length: {len(text)}")
+        logger.debug(f"Document parsed. Length: {len(text)}")
         manuscripts_storage[manuscript_id] = text
         
         style_sheet = StyleSheet(
             manuscript_id=manuscript_id,
             title=file.filename.replace(".docx", ""),
-            word_count=len(text.split())
+            word_count=DocumentParser.get_word_count(text)
         )
         style_sheets_storage[manuscript_id] = style_sheet
-        print("DEBUG: Style sheet created")
+        logger.debug("Style sheet created")
         
         # Create project structure on disk
         project_manager.create_project(manuscript_id, file.filename.replace(".docx", ""), text)
-        print("DEBUG: Project structure created")
+        logger.debug("Project structure created")
         
         workflow = managing_editor.start_workflow(manuscript_id)
-        print("DEBUG: Workflow started")
+        logger.debug("Workflow started")
         
         return {
             "manuscript_id": manuscript_id,
@@ -177,6 +218,27 @@ async def upload_manuscript(file: UploadFile = File(...)):
 
 from core.managing_editor import WorkflowState
 
+# Recent disk loads per manuscript, so a burst of requests for a project that
+# can't be fully restored (missing on disk, no workflow yet) hits disk once.
+# IDs come straight from URLs, so only the most recent loads are kept
+PROJECT_LOAD_TTL_SECONDS = 5.0
+PROJECT_LOAD_CACHE_SIZE = 256
+recent_project_loads: "OrderedDict[str, float]" = OrderedDict()
+
+
+def _record_project_load(manuscript_id: str):
+    """Note a disk load, dropping the oldest once the memo is full"""
+    recent_project_loads.pop(manuscript_id, None)
+    recent_project_loads[manuscript_id] = time.monotonic()
+    while len(recent_project_loads) > PROJECT_LOAD_CACHE_SIZE:
+        recent_project_loads.popitem(last=False)
+
+
+def invalidate_project_load(manuscript_id: str):
+    """Forget a recent disk load so the next request re-reads the project"""
+    recent_project_loads.pop(manuscript_id, None)
+
+
 def ensure_project_loaded(manuscript_id: str):
     """Ensure project data is loaded from disk into memory"""
     try:
@@ -186,11 +248,17 @@ def ensure_project_loaded(manuscript_id: str):
             manuscript_id in managing_editor.workflows):
             return
 
-        print(f"DEBUG: Loading project {manuscript_id} from disk...")
+        # Skip if we already went to disk for this project moments ago
+        loaded_at = recent_project_loads.get(manuscript_id)
+        if loaded_at is not None and time.monotonic() - loaded_at < PROJECT_LOAD_TTL_SECONDS:
+            return
+
+        logger.debug(f"Loading project {manuscript_id} from disk...")
         project_data = project_manager.load_project(manuscript_id)
+        _record_project_load(manuscript_id)
         
         if not project_data:
-            print(f"DEBUG: Project {manuscript_id} not found on disk")
+            logger.debug(f"Project {manuscript_id} not found on disk")
             return
 
         # Restore manuscript text
@@ -204,7 +272,7 @@ def ensure_project_loaded(manuscript_id: str):
         else:
             # Create fallback style sheet from metadata if none exists
             metadata = project_data.get("metadata", {})
-            print(f"DEBUG: No style sheet found, creating fallback from metadata")
+            logger.debug("No style sheet found, creating fallback from metadata")
             style_sheets_storage[manuscript_id] = StyleSheet(
                 manuscript_id=manuscript_id,
                 title=metadata.get("title", "Untitled"),
@@ -252,11 +320,12 @@ def ensure_project_loaded(manuscript_id: str):
                 total_fixes_applied=workflow_data.get("total_fixes_applied", 0)
             )
             managing_editor.workflows[manuscript_id] = workflow
-            print(f"DEBUG: Workflow state restored for {manuscript_id}")
-            print(f"DEBUG: Acquisitions status: {workflow.acquisitions_status}")
+            logger.debug(f"Workflow state restored for {manuscript_id}")
+            logger.debug(f"Acquisitions status: {workflow.acquisitions_status}")
             
     except Exception as e:
         print(f"ERROR in ensure_project_loaded: {e}")
+        invalidate_project_load(manuscript_id)
         import traceback
         traceback.print_exc()
 
@@ -271,14 +340,13 @@ async def _run_entity_extraction_task(task_id: str, manuscript_id: str):
         
         # Define progress callback
         async def update_progress(message: str, percent: int):
-            tasks_storage[task_id]["progress"] = percent
-            tasks_storage[task_id]["message"] = message
+            _update_task(task_id, progress=percent, message=message)
             
         # Extract entities using LLM
         extractor = StyleSheetExtractor(llm_client)
-        print(f"DEBUG: Starting entity extraction for {manuscript_id}")
+        logger.debug(f"Starting entity extraction for {manuscript_id}")
         style_sheet = await extractor.extract_world_building(manuscript_text, style_sheet, on_progress=update_progress)
-        print("DEBUG: Entity extraction finished")
+        logger.debug("Entity extraction finished")
         
         # Update storage
         style_sheets_storage[manuscript_id] = style_sheet
@@ -286,7 +354,7 @@ async def _run_entity_extraction_task(task_id: str, manuscript_id: str):
         # Save to disk
         project_manager.save_style_sheet(manuscript_id, style_sheet.to_dict())
         
-        tasks_storage[task_id] = {
+        _set_task(task_id, {
             "status": "completed",
             "result": {
                 "manuscript_id": manuscript_id,
@@ -298,14 +366,14 @@ async def _run_entity_extraction_task(task_id: str, manuscript_id: str):
                     "objects": len(style_sheet.objects)
                 }
             }
-        }
+        })
     except Exception as e:
         import traceback
         traceback.print_exc()
-        tasks_storage[task_id] = {
+        _set_task(task_id, {
             "status": "failed",
             "error": str(e)
-        }
+        })
 
 async def _run_synopsis_task(task_id: str, manuscript_id: str):
     """Background task for synopsis generation"""
@@ -316,9 +384,9 @@ async def _run_synopsis_task(task_id: str, manuscript_id: str):
         style_sheet = style_sheets_storage[manuscript_id]
         
         extractor = StyleSheetExtractor(llm_client)
-        print(f"DEBUG: Starting synopsis generation for {manuscript_id}")
+        logger.debug(f"Starting synopsis generation for {manuscript_id}")
         style_sheet = await extractor.generate_synopsis(manuscript_text, style_sheet)
-        print("DEBUG: Synopsis generation finished")
+        logger.debug("Synopsis generation finished")
         
         # Update storage
         style_sheets_storage[manuscript_id] = style_sheet
@@ -326,21 +394,48 @@ async def _run_synopsis_task(task_id: str, manuscript_id: str):
         # Save to disk
         project_manager.save_style_sheet(manuscript_id, style_sheet.to_dict())
         
-        tasks_storage[task_id] = {
+        _set_task(task_id, {
             "status": "completed",
             "result": {
                 "manuscript_id": manuscript_id,
                 "bible": style_sheet.to_dict(),
                 "synopsis": style_sheet.synopsis
             }
-        }
+        })
     except Exception as e:
         import traceback
         traceback.print_exc()
-        tasks_storage[task_id] = {
+        _set_task(task_id, {
             "status": "failed",
             "error": str(e)
-        }
+        })
+
+async def _run_review_task(task_id: str, manuscript_id: str):
+    """Background task for the multi-stage review"""
+    try:
+        manuscript_text = manuscripts_storage[manuscript_id]
+        style_sheet = style_sheets_storage[manuscript_id]
+        
+        async def update_progress(message: str, percent: int):
+            _update_task(task_id, progress=percent, message=message)
+        
+        logger.debug(f"Starting multi-stage review for {manuscript_id}")
+        result = await MultiStageReviewManager(llm_client).review_manuscript(
+            manuscript_text, style_sheet, manuscript_id, on_progress=update_progress
+        )
+        logger.debug("Multi-stage review finished")
+        
+        _set_task(task_id, {
+            "status": "completed",
+            "result": result
+        })
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        _set_task(task_id, {
+            "status": "failed",
+            "error": str(e)
+        })
 
 @app.post("/bible/extract/entities/{manuscript_id}")
 async def extract_entities(manuscript_id: str, background_tasks: BackgroundTasks):
@@ -352,7 +447,7 @@ async def extract_entities(manuscript_id: str, background_tasks: BackgroundTasks
         raise HTTPException(status_code=404, detail="Style Sheet not found")
     
     task_id = str(uuid.uuid4())
-    tasks_storage[task_id] = {"status": "running", "progress": 0, "message": "Initializing..."}
+    _set_task(task_id, {"status": "running", "progress": 0, "message": "Initializing..."})
     
     background_tasks.add_task(_run_entity_extraction_task, task_id, manuscript_id)
     
@@ -368,12 +463,28 @@ async def extract_synopsis(manuscript_id: str, background_tasks: BackgroundTasks
         raise HTTPException(status_code=404, detail="Style Sheet not found")
     
     task_id = str(uuid.uuid4())
-    tasks_storage[task_id] = {"status": "running", "progress": 0, "message": "Generating Synopsis..."}
+    _set_task(task_id, {"status": "running", "progress": 0, "message": "Generating Synopsis..."})
     
     background_tasks.add_task(_run_synopsis_task, task_id, manuscript_id)
     
     return {"task_id": task_id, "status": "running"}
 
+@app.post("/review/{manuscript_id}", status_code=202)
+async def start_review(manuscript_id: str, background_tasks: BackgroundTasks):
+    """Start asynchronous multi-stage review; poll /tasks/{task_id} for the result"""
+    ensure_project_loaded(manuscript_id)
+    if manuscript_id not in manuscripts_storage:
+        raise HTTPException(status_code=404, detail="Manuscript not found")
+    if manuscript_id not in style_sheets_storage:
+        raise HTTPException(status_code=404, detail="Style Sheet not found")
+    
+    task_id = str(uuid.uuid4())
+    _set_task(task_id, {"status": "running", "progress": 0, "message": "Starting review..."})
+    
+    background_tasks.add_task(_run_review_task, task_id, manuscript_id)
+    
+    return {"task_id": task_id, "status": "running"}
+
 @app.get("/tasks/{task_id}")
 async def get_task_status(task_id: str):
     """Get status of a background task"""
@@ -382,6 +493,43 @@ async def get_task_status(task_id: str):
     
     return tasks_storage[task_id]
 
+@app.get("/tasks/{task_id}/stream")
+async def stream_task_status(task_id: str):
+    """
+    Stream a background task's status as Server-Sent Events.
+    
+    Sends the current state, then the new state after every change, and
+    closes once the task has completed or failed.
+    """
+    if task_id not in tasks_storage:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    async def event_stream():
+        event = asyncio.Event()
+        task_listeners.setdefault(task_id, set()).add(event)
+        try:
+            while True:
+                # Cleared before reading, so a change made while this state
+                # is being sent still wakes the wait below
+                event.clear()
+                state = tasks_storage[task_id]
+                yield f"data: {json.dumps(state, default=str)}\n\n"
+                if state.get("status") in ("completed", "failed"):
+                    return
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=15)
+                except asyncio.TimeoutError:
+                    # Comment line, keeps proxies from closing an idle stream
+                    yield ": keepalive\n\n"
+        finally:
+            listeners = task_listeners.get(task_id)
+            if listeners is not None:
+                listeners.discard(event)
+                if not listeners:
+                    del task_listeners[task_id]
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 
 @app.post("/workflow/{manuscript_id}/acquisitions")
 async def run_acquisitions(manuscript_id: str):
@@ -814,7 +962,7 @@ async def get_manuscript_version(manuscript_id: str, version_name: str):
             "manuscript_id": manuscript_id,
             "version": version_name,
             "text": text,
-            "word_count": len(text.split())
+            "word_count": DocumentParser.get_word_count(text)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to read version: {str(e)}")
@@ -825,7 +973,7 @@ async def get_version_diff(manuscript_id: str, v1: str = "original", v2: str = "
     """Compare two versions of a manuscript"""
     try:
         ensure_project_loaded(manuscript_id)
-        changes = project_manager.compare_versions(manuscript_id, v1, v2)
+        changes = await asyncio.to_thread(project_manager.compare_versions, manuscript_id, v1, v2)
         return {
             "manuscript_id": manuscript_id,
             "v1": v1,
@@ -881,7 +1029,7 @@ async def list_versions(manuscript_id: str):
     """List manuscript versions"""
     ensure_project_loaded(manuscript_id)
     versions = project_manager.list_versions(manuscript_id)
-    return {"versions": versions}
+    return {"versions": [version._asdict() for version in versions]}
 
 
 @app.post("/workflow/{manuscript_id}/restore")
@@ -891,6 +1039,7 @@ async def restore_version(manuscript_id: str, version: str):
     success = project_manager.restore_version(manuscript_id, version)
     if not success:
         raise HTTPException(status_code=404, detail="Version not found")
+    invalidate_project_load(manuscript_id)
     
     # Reload into memory
     try:
@@ -923,14 +1072,17 @@ async def update_style_sheet(manuscript_id: str, updates: dict):
     style_sheet = style_sheets_storage[manuscript_id]
     
     # Update fields
-    for key, value in updates.items():
-        if hasattr(style_sheet, key):
-            setattr(style_sheet, key, value)
+    changed = [key for key in updates if key in StyleSheet.model_fields]
+    for key in changed:
+        setattr(style_sheet, key, updates[key])
     
-    # Save to disk
-    project_manager.save_style_sheet(manuscript_id, style_sheet.to_dict())
+    # Save to disk, logging just the changed fields when a saved sheet exists
+    style_sheet_dict = style_sheet.to_dict()
+    patch = {key: style_sheet_dict[key] for key in changed}
+    if not (patch and project_manager.save_style_sheet_patch(manuscript_id, patch)):
+        project_manager.save_style_sheet(manuscript_id, style_sheet_dict)
     
-    return style_sheet.to_dict()
+    return style_sheet_dict
 
 
 @app.get("/project/{manuscript_id}/status")
@@ -957,9 +1109,7 @@ async def get_project_status(manuscript_id: str):
 @app.get("/workflow/{manuscript_id}/{stage}/result")
 async def get_stage_result(manuscript_id: str, stage: str):
     """Get result of a completed stage"""
-    print(f"DEBUG: get_stage_result called for {manuscript_id}, stage={stage}")
-    with open("debug_output_5.txt", "a") as f:
-        f.write(f"get_stage_result called: id={manuscript_id}, stage='{stage}'\n")
+    logger.debug("get_stage_result called for %s, stage=%s", manuscript_id, stage)
     ensure_project_loaded(manuscript_id)
     try:
         result = {"stage": stage, "status": "complete"}
@@ -972,7 +1122,7 @@ async def get_stage_result(manuscript_id: str, stage: str):
                 raise HTTPException(status_code=404, detail="Report not found")
         elif stage == "cold_read":
             # Cold read has both reader_report and issues
-            stage_data = project_manager.load_stage_report(manuscript_id, stage)
+            stage_data = await project_manager.load_stage_report_async(manuscript_id, stage)
             if stage_data:
                 result["reader_report"] = stage_data.get("reader_report", "")
                 result["issues"] = stage_data.get("issues", [])
@@ -981,7 +1131,7 @@ async def get_stage_result(manuscript_id: str, stage: str):
                 raise HTTPException(status_code=404, detail="Cold read report not found")
         else:
             # Issue-based stages
-            stage_data = project_manager.load_stage_report(manuscript_id, stage)
+            stage_data = await project_manager.load_stage_report_async(manuscript_id, stage)
             if stage_data and "issues" in stage_data:
                 result["issues"] = stage_data["issues"]
                 result["total_issues"] = len(result["issues"])
@@ -1005,7 +1155,7 @@ async def list_projects():
 @app.get("/projects/{manuscript_id}")
 async def get_project(manuscript_id: str):
     """Get complete project data"""
-    project = project_manager.load_project(manuscript_id)
+    project = await asyncio.to_thread(project_manager.load_project, manuscript_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -1029,7 +1179,7 @@ async def get_project(manuscript_id: str):
 async def delete_project(manuscript_id: str):
     """Delete a project and all its files"""
     # Delete from disk
-    success = project_manager.delete_project(manuscript_id)
+    success = await asyncio.to_thread(project_manager.delete_project, manuscript_id)
     if not success:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -1042,6 +1192,7 @@ async def delete_project(manuscript_id: str):
         del stage_results_storage[manuscript_id]
     if manuscript_id in managing_editor.workflows:
         del managing_editor.workflows[manuscript_id]
+    invalidate_project_load(manuscript_id)
     
     return {"status": "deleted", "manuscript_id": manuscript_id}
 
@@ -1049,7 +1200,7 @@ async def delete_project(manuscript_id: str):
 @app.post("/projects/{manuscript_id}/duplicate")
 async def duplicate_project(manuscript_id: str):
     """Duplicate/Backup a project"""
-    metadata = project_manager.duplicate_project(manuscript_id)
+    metadata = await asyncio.to_thread(project_manager.duplicate_project, manuscript_id)
     if not metadata:
         raise HTTPException(status_code=404, detail="Project not found or failed to duplicate")
     return metadata
@@ -1061,7 +1212,7 @@ class RenameProjectRequest(BaseModel):
 @app.put("/projects/{manuscript_id}/rename")
 async def rename_project(manuscript_id: str, request: RenameProjectRequest):
     """Rename a project"""
-    success = project_manager.rename_project(manuscript_id, request.title)
+    success = await asyncio.to_thread(project_manager.rename_project, manuscript_id, request.title)
     if not success:
         raise HTTPException(status_code=404, detail="Project not found or failed to rename")
     return {"success": True, "title": request.title}
@@ -1071,7 +1222,8 @@ async def rename_project(manuscript_id: str, request: RenameProjectRequest):
 async def get_complete_report(manuscript_id: str):
     """Generate complete editorial report"""
     try:
-        report = project_manager.generate_complete_report(manuscript_id)
+        stage_reports = await project_manager.load_all_stage_reports(manuscript_id)
+        report = await asyncio.to_thread(project_manager.generate_complete_report, manuscript_id, stage_reports)
         return {"report": report}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate report: {str(e)}")
@@ -1108,6 +1260,7 @@ async def apply_fix(manuscript_id: str, issue_data: dict):
         if result["fixes_applied"] > 0:
             # Update in-memory manuscript
             manuscripts_storage[manuscript_id] = result["edited_text"]
+            invalidate_project_load(manuscript_id)
             
             # Save to disk
             project_manager.save_manuscript_version(manuscript_id, "edited", result["edited_text"])
@@ -1118,7 +1271,7 @@ async def apply_fix(manuscript_id: str, issue_data: dict):
                 for i, existing_issue in enumerate(issues_list):
                     if existing_issue.get("id") == issue.id:
                         issues_list[i]["status"] = "applied"
-                        project_manager.save_stage_report(manuscript_id, issue.stage, issues_list)
+                        await asyncio.to_thread(project_manager.save_stage_report, manuscript_id, issue.stage, issues_list)
                         break
             
             return {
@@ -1156,21 +1309,22 @@ async def apply_batch_fixes(manuscript_id: str, batch_data: dict):
         
     try:
         manuscript_text = manuscripts_storage[manuscript_id]
-        issue_objects = []
-        
-        # Convert dicts to Issue objects
-        for data in issues_data:
-            issue_objects.append(Issue(
-                id=data.get("id", 0),
-                stage=stage,
-                severity=data.get("severity", "minor"),
-                category=data.get("category", "general"),
-                location=data.get("location", ""),
-                original_text=data.get("original_text", data.get("quote", "")),
-                description=data.get("description", data.get("issue", "")),
-                suggestion=data.get("suggestion", ""),
-                bible_conflict=data.get("bible_conflict", False)
-            ))
+        
+        # Convert dicts to Issue objects (validated as one batch)
+        issue_objects = issues_from_dicts([
+            {
+                "id": data.get("id", 0),
+                "stage": stage,
+                "severity": data.get("severity", "minor"),
+                "category": data.get("category", "general"),
+                "location": data.get("location", ""),
+                "original_text": data.get("original_text", data.get("quote", "")),
+                "description": data.get("description", data.get("issue", "")),
+                "suggestion": data.get("suggestion", ""),
+                "bible_conflict": data.get("bible_conflict", False)
+            }
+            for data in issues_data
+        ])
             
         # Apply fixes
         agent = SelectiveEditorAgent(llm_client)
@@ -1179,6 +1333,7 @@ async def apply_batch_fixes(manuscript_id: str, batch_data: dict):
         if result["fixes_applied"] > 0:
             # Update storage
             manuscripts_storage[manuscript_id] = result["edited_text"]
+            invalidate_project_load(manuscript_id)
             project_manager.save_manuscript_version(manuscript_id, "edited", result["edited_text"])
             
             # Update statuses
@@ -1190,7 +1345,7 @@ async def apply_batch_fixes(manuscript_id: str, batch_data: dict):
                     if existing.get("id") in applied_ids:
                         server_issues[i]["status"] = "applied"
                 
-                project_manager.save_stage_report(manuscript_id, stage, server_issues)
+                await asyncio.to_thread(project_manager.save_stage_report, manuscript_id, stage, server_issues)
                 
             return {
                 "success": True,
@@ -1210,6 +1365,66 @@ async def apply_batch_fixes(manuscript_id: str, batch_data: dict):
         raise HTTPException(status_code=500, detail=f"Batch apply failed: {str(e)}")
 
 
+ISSUE_STATUSES = {"open", "applied", "ignored"}
+
+
+async def _set_issue_statuses(manuscript_id: str, stage: str, statuses: dict) -> set:
+    """
+    Update the status of one or more issues in a stage report.
+    
+    Loads the report once, applies every update, and writes it back once.
+    
+    Args:
+        manuscript_id: Project ID
+        stage: Stage the issues belong to
+        statuses: Mapping of issue ID (as str) to new status
+        
+    Returns:
+        Set of issue IDs (as str) that were found and updated
+    """
+    # Load directly from disk to ensure fresh data
+    stage_report = await project_manager.load_stage_report_async(manuscript_id, stage)
+    
+    # Handle Cold Read structure
+    if stage == "cold_read":
+         issues_list = stage_report.get("issues", [])
+    elif stage_report and "issues" in stage_report:
+         issues_list = stage_report["issues"]
+    else:
+         logger.debug(f"No issues found for stage {stage}")
+         raise HTTPException(status_code=404, detail="No results found for this stage")
+    
+    updated = set()
+    
+    # Find and update (handle int/str mismatch in IDs)
+    for i, issue in enumerate(issues_list):
+        issue_id = str(issue.get("id"))
+        if issue_id in statuses:
+            issues_list[i]["status"] = statuses[issue_id]
+            updated.add(issue_id)
+    
+    if not updated:
+        return updated
+    
+    # Save updated report
+    await asyncio.to_thread(project_manager.save_stage_report, manuscript_id, stage, issues_list if stage != "cold_read" else stage_report)
+    
+    # Update cache if present
+    if manuscript_id in stage_results_storage and stage in stage_results_storage[manuscript_id]:
+         if stage == "cold_read":
+             stage_results_storage[manuscript_id][stage] = stage_report
+         else:
+             stage_results_storage[manuscript_id][stage]["issues"] = issues_list
+    
+    return updated
+
+
+async def _set_issue_status(manuscript_id: str, stage: str, issue_id, status: str) -> bool:
+    """Update the status of a single issue. Returns False if the issue was not found."""
+    updated = await _set_issue_statuses(manuscript_id, stage, {str(issue_id): status})
+    return bool(updated)
+
+
 @app.post("/workflow/{manuscript_id}/ignore-issue")
 async def ignore_issue(manuscript_id: str, issue_data: dict):
     """Mark an issue as ignored"""
@@ -1219,46 +1434,13 @@ async def ignore_issue(manuscript_id: str, issue_data: dict):
     issue_id = issue_data.get("id")
     
     if not stage or issue_id is None:
-        print(f"DEBUG: Missing stage or id. stage={stage}, id={issue_id}")
+        logger.debug(f"Missing stage or id. stage={stage}, id={issue_id}")
         raise HTTPException(status_code=400, detail="Missing stage or issue ID")
         
     try:
-        # Load directly from disk to ensure fresh data
-        stage_report = project_manager.load_stage_report(manuscript_id, stage)
-        
-        # Handle Cold Read structure
-        if stage == "cold_read":
-             issues_list = stage_report.get("issues", [])
-        elif stage_report and "issues" in stage_report:
-             issues_list = stage_report["issues"]
-        else:
-             print(f"DEBUG: No issues found for stage {stage}")
-             raise HTTPException(status_code=404, detail="No results found for this stage")
-             
-        found = False
-        
-        # Find and update
-        for i, issue in enumerate(issues_list):
-            # Handle int/str mismatch in IDs
-            if str(issue.get("id")) == str(issue_id):
-                issues_list[i]["status"] = "ignored"
-                found = True
-                break
-                
-        if not found:
-            print(f"DEBUG: Issue {issue_id} not found in {len(issues_list)} issues")
+        if not await _set_issue_status(manuscript_id, stage, issue_id, "ignored"):
+            logger.debug(f"Issue {issue_id} not found in stage {stage}")
             raise HTTPException(status_code=404, detail="Issue not found")
-            
-        # Save updated report
-        project_manager.save_stage_report(manuscript_id, stage, issues_list if stage != "cold_read" else stage_report)
-        
-        # Update cache if present
-        if manuscript_id in stage_results_storage and stage in stage_results_storage[manuscript_id]:
-             # Re-load from disk to cache to be safe, or just update cache
-             if stage == "cold_read":
-                 stage_results_storage[manuscript_id][stage] = stage_report
-             else:
-                 stage_results_storage[manuscript_id][stage]["issues"] = issues_list
         
         return {"success": True, "message": "Issue ignored"}
         
@@ -1282,40 +1464,9 @@ async def unignore_issue(manuscript_id: str, issue_data: dict):
         raise HTTPException(status_code=400, detail="Missing stage or issue ID")
         
     try:
-        # Load directly from disk to ensure fresh data
-        stage_report = project_manager.load_stage_report(manuscript_id, stage)
-        
-        # Handle Cold Read structure
-        if stage == "cold_read":
-             issues_list = stage_report.get("issues", [])
-        elif stage_report and "issues" in stage_report:
-             issues_list = stage_report["issues"]
-        else:
-             raise HTTPException(status_code=404, detail="No results found for this stage")
-             
-        found = False
-        
-        # Find and update
-        for i, issue in enumerate(issues_list):
-            if str(issue.get("id")) == str(issue_id):
-                # Restore to 'open' - or 'applied' if it was applied? 
-                # Assuming 'unignore' means 'I want to see it again to decide', so 'open'.
-                issues_list[i]["status"] = "open"
-                found = True
-                break
-                
-        if not found:
+        # 'unignore' means 'I want to see it again to decide', so restore to 'open'
+        if not await _set_issue_status(manuscript_id, stage, issue_id, "open"):
             raise HTTPException(status_code=404, detail="Issue not found")
-            
-        # Save updated report
-        project_manager.save_stage_report(manuscript_id, stage, issues_list if stage != "cold_read" else stage_report)
-        
-        # Update cache if present
-        if manuscript_id in stage_results_storage and stage in stage_results_storage[manuscript_id]:
-             if stage == "cold_read":
-                 stage_results_storage[manuscript_id][stage] = stage_report
-             else:
-                 stage_results_storage[manuscript_id][stage]["issues"] = issues_list
         
         return {"success": True, "message": "Issue un-ignored"}
         
@@ -1325,6 +1476,42 @@ async def unignore_issue(manuscript_id: str, issue_data: dict):
         raise HTTPException(status_code=500, detail=f"Failed to un-ignore issue: {str(e)}")
 
 
+@app.post("/workflow/{manuscript_id}/set-issue-statuses")
+async def set_issue_statuses(manuscript_id: str, batch_data: dict):
+    """Update the status of several issues in one stage with a single write"""
+    ensure_project_loaded(manuscript_id)
+    
+    stage = batch_data.get("stage")
+    updates = batch_data.get("updates", [])
+    
+    if not stage or not updates:
+        raise HTTPException(status_code=400, detail="Missing stage or updates")
+    
+    statuses = {}
+    for update in updates:
+        issue_id = update.get("id")
+        status = update.get("status")
+        if issue_id is None or status not in ISSUE_STATUSES:
+            raise HTTPException(status_code=400, detail=f"Invalid update: {update}")
+        statuses[str(issue_id)] = status
+    
+    try:
+        updated = await _set_issue_statuses(manuscript_id, stage, statuses)
+        
+        return {
+            "success": True,
+            "updated": len(updated),
+            "not_found": [issue_id for issue_id in statuses if issue_id not in updated]
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Failed to update issue statuses: {str(e)}")
+
+
 @app.get("/workflow/{manuscript_id}/manuscript")
 async def get_manuscript(manuscript_id: str):
     """Get the current manuscript text"""
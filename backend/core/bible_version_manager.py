@@ -2,11 +2,11 @@
 Bible Version Manager - handles versioning like LibriScribe's BackupManager
 """
 
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional
 from core.models import SeriesBible
+from core.io import read_json, write_json
 
 
 class BibleVersionManager:
@@ -31,8 +31,7 @@ class BibleVersionManager:
             "created_at": datetime.now().isoformat()
         }
         
-        with open(version_file, 'w') as f:
-            json.dump(version_data, f, indent=2)
+        write_json(version_file, version_data)
         
         return version_id
     
@@ -40,21 +39,19 @@ class BibleVersionManager:
         """List all versions"""
         versions = []
         for file in self.versions_dir.glob(f"{manuscript_id}_v_*.json"):
-            with open(file, 'r') as f:
-                data = json.load(f)
-                if "_metadata" in data:
-                    versions.append(data["_metadata"])
+            data = read_json(file)
+            if "_metadata" in data:
+                versions.append(data["_metadata"])
         versions.sort(key=lambda v: v["created_at"], reverse=True)
         return versions
     
     def load_version(self, manuscript_id: str, version_id: str) -> SeriesBible:
         """Load a specific version"""
         file = self.versions_dir / f"{manuscript_id}_{version_id}.json"
-        with open(file, 'r') as f:
-            data = json.load(f)
-            if "_metadata" in data:
-                del data["_metadata"]
-            return SeriesBible.from_dict(data)
+        data = read_json(file)
+        if "_metadata" in data:
+            del data["_metadata"]
+        return SeriesBible.from_dict(data)
     
     def restore_version(self, manuscript_id: str, version_id: str) -> SeriesBible:
         """Restore a previous version"""
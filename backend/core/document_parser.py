@@ -5,10 +5,104 @@ Supports .docx, .txt, .md, .pdf files
 
 from pathlib import Path
 from docx import Document
+import functools
 import markdown
+import os
 import re
 
 
+# PDF cleanup patterns, compiled once at import
+
+# H substituted for an apostrophe before possessive s or a contraction suffix
+_H_APOSTROPHE_RE = re.compile(r"(\w)H(s|t|m|re|ll|ve|d)\b")
+
+# "coxee" -> "coffee" and similar OCR errors, matched case-insensitively as
+# whole words. All fixes run as one alternation, so the text is scanned once;
+# each word gets its own capture group and m.lastindex picks the replacement
+_OCR_FIXES = {
+    "coxee": "coffee",
+    "Ningle": "Jingle",
+    "Rere": "Here",
+    "Rer": "Her",
+    "Loor": "floor",
+    "WHm": "I'm",
+    "sIueaky": "squeaky",
+    "mi'ing": "mixing",
+    "Angel BabyHs": "Angel Baby's",
+    "e'citing": "exciting",
+    "Nat up": "Eat up",
+    "?ook": "Look",
+}
+_OCR_RE = re.compile(
+    r"\b(?:" + "|".join(f"({re.escape(word)})" for word in _OCR_FIXES) + r")\b",
+    re.IGNORECASE
+)
+_OCR_REPLACEMENTS = list(_OCR_FIXES.values())
+
+
+def _ocr_replacement(match: re.Match) -> str:
+    return _OCR_REPLACEMENTS[match.lastindex - 1]
+
+
+# Single-character substitutions from embedded fonts. Context-dependent ones
+# (H for an apostrophe) are handled by the regexes above instead
+_CHAR_TABLE = str.maketrans({
+    '\ufffd': "'",  # Replacement character to apostrophe
+    '\uff07': "'",  # Fullwidth apostrophe
+    '\u201c': '"',  # Smart quotes
+    '\u201d': '"',
+    '\u2018': "'",
+    '\u2019': "'",
+    '\u2013': '-',  # En dash
+    '\u2014': '-',  # Em dash
+    '\x00': None,  # Null characters
+    '\ufeff': None,  # BOM
+})
+
+_MULTI_SPACE_RE = re.compile(r' +')
+
+# Characters that are neither str.isalnum() nor str.isspace() (\w also
+# matches underscore, so it's listed explicitly)
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s]|_')
+
+# ASCII bytes that count as readable, for the fast path on ASCII lines:
+# bytes.translate deletes them and whatever is left is the special chars
+_READABLE_ASCII = bytes(i for i in range(128) if chr(i).isalnum() or chr(i).isspace())
+
+# Chapter headings, e.g. "Chapter 3" or "# Chapter 3"
+_CHAPTER_RE = re.compile(r'(?i)(chapter\s+\d+|#\s+chapter\s+\d+)')
+
+# Characters of text get_word_count splits at a time
+_WORD_COUNT_CHUNK = 1 << 16
+
+
+# PDF text extractor, resolved on first use: pdfminer gives better text when
+# installed, pypdf is the fallback
+_pdf_backend = None
+_PdfReader = None
+
+
+def _extract_text_pypdf(file_path: str) -> str:
+    global _PdfReader
+    if _PdfReader is None:
+        from pypdf import PdfReader
+        _PdfReader = PdfReader
+    reader = _PdfReader(file_path)
+    return '\n'.join(page.extract_text() for page in reader.pages)
+
+
+def _get_pdf_backend():
+    """Return (name, extract_text) for the PDF backend, importing it once"""
+    global _pdf_backend
+    if _pdf_backend is None:
+        try:
+            from pdfminer.high_level import extract_text
+            _pdf_backend = ("pdfminer", extract_text)
+        except ImportError:
+            _pdf_backend = ("pypdf", _extract_text_pypdf)
+    return _pdf_backend
+
+
 class DocumentParser:
     """Parse various document formats into plain text"""
     
@@ -23,19 +117,28 @@ class DocumentParser:
         Returns:
             Plain text content
         """
+        # Re-parsing an unchanged file (same path, mtime and size) hits the cache
+        stat = os.stat(file_path)
+        return DocumentParser._parse_cached(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _parse_cached(file_path: str, mtime_ns: int, size: int) -> str:
+        """Parse a file; mtime_ns and size only key the cache"""
         ext = Path(file_path).suffix.lower()
         
         if ext == '.docx':
             doc = Document(file_path)
-            return '\n'.join([para.text for para in doc.paragraphs])
+            return '\n'.join(para.text for para in doc.paragraphs)
         
-        elif ext == '.txt':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        
-        elif ext == '.md':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+        elif ext in ('.txt', '.md'):
+            # Read raw bytes and decode once; text-mode reads decode in chunks
+            with open(file_path, 'rb') as f:
+                text = f.read().decode('utf-8')
+            # Match text mode's universal newlines
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            return text
         
         elif ext == '.pdf':
             return DocumentParser._parse_pdf(file_path)
@@ -46,29 +149,16 @@ class DocumentParser:
     @staticmethod
     def _parse_pdf(file_path: str) -> str:
         """Parse PDF with improved text extraction and cleanup"""
+        backend, extract_text = _get_pdf_backend()
         try:
-            # Try pdfminer first for better text extraction
-            from pdfminer.high_level import extract_text
             text = extract_text(file_path)
-            print(f"📄 PDF parsed with pdfminer: {len(text)} characters")
-        except ImportError:
-            # Fallback to pypdf
-            from pypdf import PdfReader
-            reader = PdfReader(file_path)
-            pages = []
-            for page in reader.pages:
-                pages.append(page.extract_text())
-            text = '\n'.join(pages)
-            print(f"📄 PDF parsed with pypdf: {len(text)} characters")
+            print(f"📄 PDF parsed with {backend}: {len(text)} characters")
         except Exception as e:
+            if backend == "pypdf":
+                raise
             print(f"⚠️ PDF parsing error: {e}")
             # Final fallback
-            from pypdf import PdfReader
-            reader = PdfReader(file_path)
-            pages = []
-            for page in reader.pages:
-                pages.append(page.extract_text())
-            text = '\n'.join(pages)
+            text = _extract_text_pypdf(file_path)
         
         # Clean up common PDF extraction issues
         text = DocumentParser._clean_pdf_text(text)
@@ -79,57 +169,18 @@ class DocumentParser:
     def _clean_pdf_text(text: str) -> str:
         """Clean up common PDF text extraction issues"""
         
-        # Fix common character substitutions from embedded fonts
-        replacements = {
-            'H': "'",  # Often H is substituted for apostrophe
-            'x': '',   # Stray x characters
-            '?': '',   # Question marks as garbage
-            'O': '',   # O used as garbage character
-            '': "'",   # Replacement character to apostrophe
-            '＇': "'",  # Fullwidth apostrophe
-            '"': '"',  # Smart quotes
-            '"': '"',
-            ''': "'",
-            ''': "'",
-            '–': '-',  # En dash
-            '—': '-',  # Em dash
-            '\x00': '', # Null characters
-            '\ufeff': '', # BOM
-        }
-        
         # Only apply H-to-apostrophe replacement in specific contexts
         # H followed by s (possessive) or t (contractions like "don't")
-        text = re.sub(r"(\w)H(s|t|m|re|ll|ve|d)\b", r"\1'\2", text)
+        text = _H_APOSTROPHE_RE.sub(r"\1'\2", text)
         
         # Fix "coxee" -> "coffee" and similar OCR errors
-        ocr_fixes = {
-            r'\bcoxee\b': 'coffee',
-            r'\bNingle\b': 'Jingle',
-            r'\bRer\b': 'Her',
-            r'\bRere\b': 'Here',
-            r'\bLoor\b': 'floor',
-            r'\bWHm\b': "I'm",
-            r'\bsIueaky\b': 'squeaky',
-            r'\bmi\'ing\b': 'mixing',
-            r"\bmi'ing\b": 'mixing',
-            r"\bAngel BabyHs\b": "Angel Baby's",
-            r'\be\'citing\b': 'exciting',
-            r'\bNat up\b': 'Eat up',
-            r'\b\?ook\b': 'Look',
-        }
-        
-        for pattern, replacement in ocr_fixes.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        
-        # Clean standard replacements
-        for old, new in replacements.items():
-            if old and old in text:  # Only for simple character replacements
-                # Be careful with single character replacements
-                if len(old) > 1:
-                    text = text.replace(old, new)
+        text = _OCR_RE.sub(_ocr_replacement, text)
+        
+        # Normalize font-substituted characters in one pass
+        text = text.translate(_CHAR_TABLE)
         
         # Remove multiple consecutive spaces
-        text = re.sub(r' +', ' ', text)
+        text = _MULTI_SPACE_RE.sub(' ', text)
         
         # Remove lines that are mostly garbage (high ratio of special chars)
         lines = text.split('\n')
@@ -138,10 +189,7 @@ class DocumentParser:
             if len(line) == 0:
                 cleaned_lines.append(line)
                 continue
-            # Count alphanumeric characters
-            alpha_count = sum(1 for c in line if c.isalnum() or c.isspace())
-            ratio = alpha_count / len(line) if len(line) > 0 else 0
-            if ratio > 0.7:  # Keep lines that are mostly readable
+            if DocumentParser._is_readable_line(line):
                 cleaned_lines.append(line)
         
         text = '\n'.join(cleaned_lines)
@@ -149,15 +197,57 @@ class DocumentParser:
         print(f"✨ PDF text cleaned: {len(text)} characters")
         return text
     
+    @staticmethod
+    def _is_readable_line(line: str) -> bool:
+        """
+        True if more than 70% of the line is alphanumeric/whitespace.
+        
+        ASCII lines are counted with a byte-table translate. Other lines stop
+        scanning as soon as enough special characters have been seen that
+        the line can no longer pass, so long garbage lines are cheap.
+        """
+        length = len(line)
+        if line.isascii():
+            special_count = len(line.encode('ascii').translate(None, _READABLE_ASCII))
+            return (length - special_count) / length > 0.7
+        
+        special_count = 0
+        for _ in _SPECIAL_CHAR_RE.finditer(line):
+            special_count += 1
+            if (length - special_count) / length <= 0.7:
+                return False
+        return (length - special_count) / length > 0.7
+    
     @staticmethod
     def get_word_count(text: str) -> int:
-        """Get word count of text"""
-        return len(text.split())
+        """
+        Get word count of text.
+        
+        Splits a chunk at a time (each ending on whitespace, so no word is
+        cut) rather than building a list of every word in the manuscript.
+        
+        Args:
+            text: Text to count
+            
+        Returns:
+            Number of whitespace-separated words
+        """
+        length = len(text)
+        if length <= _WORD_COUNT_CHUNK:
+            return len(text.split())
+        
+        count = 0
+        start = 0
+        while start < length:
+            end = min(start + _WORD_COUNT_CHUNK, length)
+            while end < length and not text[end].isspace():
+                end += 1
+            count += len(text[start:end].split())
+            start = end
+        return count
     
     @staticmethod
     def get_chapter_count(text: str) -> int:
         """Estimate chapter count (looks for chapter headings)"""
-        import re
-        chapter_pattern = r'(?i)(chapter\s+\d+|#\s+chapter\s+\d+)'
-        return len(re.findall(chapter_pattern, text))
+        return sum(1 for _ in _CHAPTER_RE.finditer(text))
 
@@ -0,0 +1,221 @@
+"""
+File I/O helpers
+Single place for reading and writing project JSON (orjson when available)
+and other atomically replaced files
+"""
+
+import os
+import json
+import asyncio
+import uuid
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import aiofiles
+import aiofiles.os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+PathLike = Union[str, Path]
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_json_line(obj: Any) -> bytes:
+    """Serialize to one line of compact JSON, newline-terminated"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _temp_path(path: Path) -> Path:
+    """Temp file next to the target, so os.replace stays on one filesystem"""
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def read_text(path: PathLike) -> str:
+    """
+    Read a UTF-8 text file with one read and one decode.
+
+    Args:
+        path: File to read
+
+    Returns:
+        File text, with line endings normalized as in text mode
+    """
+    with open(path, "rb") as f:
+        text = f.read().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_json(path: PathLike) -> Any:
+    """
+    Read a JSON file.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(path, "rb") as f:
+        return loads_json(f.read())
+
+
+def write_bytes(path: PathLike, data: bytes):
+    """
+    Write a file atomically (temp file + fsync + os.replace).
+
+    A crash leaves either the old file or the complete new one, never a
+    partial write. The file is always replaced, never rewritten in place,
+    so other hard links to the old file keep their contents.
+
+    Args:
+        path: File to write
+        data: File contents
+    """
+    path = Path(path)
+    tmp = _temp_path(path)
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def link_or_write(src: PathLike, dst: PathLike, data: Optional[bytes] = None):
+    """
+    Atomically replace dst with a hard link to src, so no bytes are copied.
+
+    Falls back to write_bytes where hard links aren't supported.
+
+    Args:
+        src: Existing file
+        dst: File to replace
+        data: src's contents, if already in memory (only used by the fallback)
+    """
+    src, dst = Path(src), Path(dst)
+    tmp = _temp_path(dst)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        write_bytes(dst, src.read_bytes() if data is None else data)
+        return
+    try:
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_json(path: PathLike, obj: Any):
+    """
+    Write a JSON file atomically (temp file + os.replace).
+
+    Args:
+        path: File to write
+        obj: JSON-serializable data
+    """
+    write_bytes(path, dumps_json(obj))
+
+
+def append_json_line(path: PathLike, obj: Any):
+    """
+    Append one JSON record to a JSON Lines file.
+
+    Args:
+        path: File to append to (created if missing)
+        obj: JSON-serializable data
+    """
+    with open(path, "ab") as f:
+        f.write(_dumps_json_line(obj))
+
+
+def read_json_lines(path: PathLike) -> list:
+    """
+    Read every record of a JSON Lines file.
+
+    A truncated last line (from a crash mid-append) is skipped.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Parsed records, in file order ([] if the file doesn't exist)
+    """
+    try:
+        with open(path, "rb") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return []
+    records = []
+    for i, line in enumerate(lines):
+        if not line:
+            continue
+        try:
+            records.append(loads_json(line))
+        except ValueError:
+            if i != len(lines) - 1:
+                raise
+    return records
+
+
+async def read_json_async(path: PathLike) -> Any:
+    """
+    Read a JSON file without blocking the event loop.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Parsed JSON data
+    """
+    async with aiofiles.open(path, "rb") as f:
+        return loads_json(await f.read())
+
+
+async def write_json_async(path: PathLike, obj: Any):
+    """
+    Write a JSON file atomically without blocking the event loop.
+
+    Args:
+        path: File to write
+        obj: JSON-serializable data
+    """
+    path = Path(path)
+    tmp = _temp_path(path)
+    try:
+        async with aiofiles.open(tmp, "wb") as f:
+            await f.write(dumps_json(obj))
+            await f.flush()
+            await asyncio.to_thread(os.fsync, f.fileno())
+        await aiofiles.os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -2,13 +2,17 @@
 Issue model for review agents
 """
 
-from pydantic import BaseModel
-from typing import Optional
+import sys
+import weakref
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
+from typing import List, Optional
 
 
 class Issue(BaseModel):
     """Represents an issue found during review"""
     
+    model_config = ConfigDict(frozen=True)
+    
     id: int
     stage: str  # developmental, line, copy, proof
     severity: str  # critical, major, minor
@@ -20,10 +24,42 @@ class Issue(BaseModel):
     bible_conflict: bool = False  # True if conflicts with Series Bible
     status: str = "open"  # open, applied, ignored
     
+    @field_validator("stage", "severity", "category", "status", mode="before")
+    @classmethod
+    def _intern_vocabulary(cls, value):
+        """Share one string object per value for these small vocabularies"""
+        return sys.intern(value) if isinstance(value, str) else value
+    
     def __str__(self):
         conflict_marker = "⚠️ BIBLE CONFLICT: " if self.bible_conflict else ""
         return f"[{self.severity.upper()}] {conflict_marker}{self.description}"
     
     def to_dict(self):
         """Convert Issue to dictionary for API responses"""
-        return self.model_dump()
+        cached = _ISSUE_DICTS.get(self)
+        if cached is None:
+            cached = _ISSUE_DICTS[self] = self.model_dump()
+        # Shallow copy: callers update fields like "status" on the result
+        return dict(cached)
+
+
+# Memoized model_dump() per issue. Issues are frozen (and hash by value), so a
+# cached dump never goes stale; entries drop when the issue is collected
+_ISSUE_DICTS = weakref.WeakKeyDictionary()
+
+# Pydantic fields live in the instance __dict__, so Issue can't take __slots__;
+# validating a whole batch through one adapter call is the cheaper path instead
+_ISSUE_LIST_ADAPTER = TypeAdapter(List[Issue])
+
+
+def issues_from_dicts(items: List[dict]) -> List[Issue]:
+    """
+    Validate a batch of issue dicts into Issue objects in a single call.
+    
+    Args:
+        items: Issue dicts with the model's field names
+        
+    Returns:
+        List of Issue objects
+    """
+    return _ISSUE_LIST_ADAPTER.validate_python(items)
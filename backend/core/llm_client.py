@@ -3,19 +3,142 @@ LLM Client for EditScribe - Multi-Provider Support
 Supports: Google Gemini, Anthropic Claude, OpenRouter
 """
 
+import openai
 from openai import OpenAI, AsyncOpenAI
 import anthropic
+import asyncio
+import functools
+import hashlib
+import json
 import logging
-from tenacity import retry, stop_after_attempt, wait_random_exponential
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from dotenv import load_dotenv
 import os
-from typing import Optional
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
 from enum import Enum
+from core.cancellation import cancellation_manager
+from core.io import read_text, write_bytes
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Sync SDK clients shared across LLMClient instances and provider switches,
+# keyed by their constructor settings. Each SDK client owns an HTTP connection
+# pool, so reusing them keeps keep-alive connections instead of new TCP/TLS
+# handshakes
+_sdk_clients: Dict[tuple, Any] = {}
+
+
+def _shared_sdk_client(client_cls, **kwargs):
+    """Return the shared client_cls(**kwargs), creating it on first use"""
+    key = (client_cls, repr(sorted(kwargs.items())))
+    client = _sdk_clients.get(key)
+    if client is None:
+        client = _sdk_clients[key] = client_cls(**kwargs)
+    return client
+
+
+# Async SDK clients can't be shared the same way: their connection pools are
+# bound to the event loop that first uses them, and a pool from a finished
+# loop (an earlier asyncio.run) fails with "Event loop is closed". They are
+# shared per running loop instead, and dropped with it
+_loop_sdk_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _loop_sdk_client(client_cls, **kwargs):
+    """Return the running event loop's client_cls(**kwargs), creating it on first use"""
+    clients = _loop_sdk_clients.setdefault(asyncio.get_running_loop(), {})
+    key = (client_cls, repr(sorted(kwargs.items())))
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = client_cls(**kwargs)
+    return client
+
+
+# Optional on-disk response cache. When enabled (LLM_CACHE_DIR, or an
+# LLMClient cache_dir), responses are stored by a hash of everything that
+# shapes them (provider, model, sampling settings and the full prompt, which
+# already embeds the manuscript chunk and Style Sheet), so re-running an
+# unchanged review skips the provider call
+_RESPONSE_CACHE_DIR = os.getenv("LLM_CACHE_DIR")
+_RESPONSE_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "86400"))
+
+# Cache used by get_llm_client() when LLM_CACHE_DIR isn't set, and the
+# highest temperature it caches: only near-deterministic calls are replayed
+_SCRIPT_CACHE_DIR = ".llm_cache"
+_SCRIPT_CACHE_MAX_TEMPERATURE = 0.1
+
+
+def _response_cache_path(cache_dir: str, key_parts: tuple) -> Path:
+    """Cache file for a request"""
+    key = hashlib.sha256(json.dumps(key_parts).encode("utf-8")).hexdigest()
+    return Path(cache_dir) / key[:2] / f"{key}.txt"
+
+
+def _response_cache_get(path: Optional[Path]) -> Optional[str]:
+    """Cached response text, or None if missing or older than the TTL"""
+    if path is None:
+        return None
+    try:
+        if time.time() - path.stat().st_mtime > _RESPONSE_CACHE_TTL:
+            return None
+        return read_text(path)
+    except OSError:
+        return None
+
+
+def _response_cache_put(path: Optional[Path], text: str):
+    """Store a response; failed (empty) responses aren't cached"""
+    if path is None or not text:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_bytes(path, text.encode("utf-8"))
+    except OSError as e:
+        logger.warning(f"Couldn't write LLM response cache {path}: {e}")
+
+
+class CancelledException(Exception):
+    pass
+
+
+# Provider errors worth retrying (rate limits, dropped connections/timeouts,
+# 5xx/overloaded). Anything else, e.g. auth or bad requests, fails immediately
+_TRANSIENT_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError,
+)
+
+_retry_transient = retry(
+    retry=retry_if_exception_type(_TRANSIENT_ERRORS),
+    wait=wait_random_exponential(min=1, max=60),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+
+
+def _anthropic_usage(message) -> tuple:
+    """(input_tokens, output_tokens) from an Anthropic message"""
+    usage = message.usage
+    return (usage.input_tokens, usage.output_tokens) if usage else (0, 0)
+
+
+def _openai_usage(response) -> tuple:
+    """(input_tokens, output_tokens) from an OpenAI-compatible completion"""
+    usage = response.usage
+    return (usage.prompt_tokens, usage.completion_tokens) if usage else (0, 0)
+
 
 class LLMProvider(Enum):
     GEMINI = "gemini"
@@ -33,8 +156,24 @@ class LLMClient:
         LLMProvider.OPENROUTER: "anthropic/claude-opus-4.5",
     }
     
-    def __init__(self, provider: str = None, model: str = None):
-        """Initialize LLM client with specified provider"""
+    def __init__(
+        self,
+        provider: str = None,
+        model: str = None,
+        cache_dir: str = None,
+        cache_max_temperature: float = None
+    ):
+        """
+        Initialize LLM client with specified provider.
+        
+        Args:
+            provider: Provider name (default: DEFAULT_LLM_PROVIDER or gemini)
+            model: Model name (default: the provider's default model)
+            cache_dir: Response cache directory (default: LLM_CACHE_DIR; no
+                caching when neither is set)
+            cache_max_temperature: Only cache calls at or below this
+                temperature (default: cache every call)
+        """
         provider_str = provider or os.getenv("DEFAULT_LLM_PROVIDER", "gemini")
         
         try:
@@ -45,10 +184,15 @@ class LLMClient:
         
         self.model = model or self.DEFAULT_MODELS[self.provider]
         
+        self.cache_dir = cache_dir or _RESPONSE_CACHE_DIR
+        self.cache_max_temperature = cache_max_temperature
+        
         # Token tracking
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.total_requests = 0
+        # Counters are updated from worker threads (sync agents) and the loop
+        self._usage_lock = threading.Lock()
         
         self._init_client()
         
@@ -62,12 +206,15 @@ class LLMClient:
             if not api_key:
                 raise ValueError("GOOGLE_API_KEY not found in environment")
             
-            self.client = OpenAI(
+            self.client = _shared_sdk_client(
+                OpenAI,
                 api_key=api_key,
                 base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
                 timeout=300.0
             )
-            self.async_client = AsyncOpenAI(
+            self._async_client_factory = functools.partial(
+                _loop_sdk_client,
+                AsyncOpenAI,
                 api_key=api_key,
                 base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
                 timeout=300.0
@@ -79,8 +226,8 @@ class LLMClient:
             if not api_key:
                 raise ValueError("ANTHROPIC_API_KEY not found in environment")
             
-            self.anthropic_client = anthropic.Anthropic(api_key=api_key)
-            self.async_anthropic_client = anthropic.AsyncAnthropic(api_key=api_key)
+            self.anthropic_client = _shared_sdk_client(anthropic.Anthropic, api_key=api_key)
+            self._async_client_factory = functools.partial(_loop_sdk_client, anthropic.AsyncAnthropic, api_key=api_key)
             self._use_anthropic_sdk = True
             
         elif self.provider == LLMProvider.OPENROUTER:
@@ -90,7 +237,8 @@ class LLMClient:
             
             base_url = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
             
-            self.client = OpenAI(
+            self.client = _shared_sdk_client(
+                OpenAI,
                 api_key=api_key,
                 base_url=base_url,
                 timeout=300.0,
@@ -99,7 +247,9 @@ class LLMClient:
                     "X-Title": "EditScribe"
                 }
             )
-            self.async_client = AsyncOpenAI(
+            self._async_client_factory = functools.partial(
+                _loop_sdk_client,
+                AsyncOpenAI,
                 api_key=api_key,
                 base_url=base_url,
                 timeout=300.0,
@@ -109,6 +259,25 @@ class LLMClient:
                 }
             )
             self._use_anthropic_sdk = False
+        
+        self._usage_extractor = _anthropic_usage if self._use_anthropic_sdk else _openai_usage
+    
+    @property
+    def async_client(self):
+        """The provider's async SDK client for the running event loop"""
+        return self._async_client_factory()
+    
+    def _count_request(self):
+        """Count one request attempt (including ones that end up failing)"""
+        with self._usage_lock:
+            self.total_requests += 1
+    
+    def _record_usage(self, response):
+        """Add a response's token usage to the running totals"""
+        input_tokens, output_tokens = self._usage_extractor(response)
+        with self._usage_lock:
+            self.total_input_tokens += input_tokens or 0
+            self.total_output_tokens += output_tokens or 0
     
     def switch_provider(self, provider: str, model: str = None):
         """Switch to a different provider"""
@@ -122,62 +291,136 @@ class LLMClient:
         logger.info(f"Switched to: {self.provider.value} → {self.model}")
         print(f"🔄 Switched LLM: {self.provider.value} → {self.model}")
     
-from core.cancellation import cancellation_manager
-
-class CancelledException(Exception):
-    pass
-
-# ... imports ...
-
-    @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(5))
+    def _chat_messages(self, prompt: str, system_prompt: str = None, shared_context: str = None) -> list:
+        """Build the message list for OpenAI-compatible providers"""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        if shared_context:
+            # Own message ahead of the instruction, so the provider's
+            # automatic prefix caching covers it
+            messages.append({"role": "user", "content": shared_context})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
+    def _anthropic_messages(self, prompt: str, shared_context: str = None) -> list:
+        """Build the message list for Anthropic, marking shared_context cacheable"""
+        if not shared_context:
+            return [{"role": "user", "content": prompt}]
+        return [{"role": "user", "content": [
+            {"type": "text", "text": shared_context, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": prompt},
+        ]}]
+    
+    def _build_request(self, prompt: str, max_tokens: int, temperature: float, system_prompt: str = None,
+                       shared_context: str = None, stream: bool = False) -> dict:
+        """Build the provider's create-request keyword arguments"""
+        if self._use_anthropic_sdk:
+            request = {
+                "model": self.model,
+                "max_tokens": max_tokens,
+                "system": system_prompt or "You are a professional manuscript editor.",
+                "messages": self._anthropic_messages(prompt, shared_context),
+                "temperature": temperature,
+            }
+            if stream:
+                request["stream"] = True
+            return request
+        request = {
+            "model": self.model,
+            "messages": self._chat_messages(prompt, system_prompt, shared_context),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if stream:
+            request["stream"] = True
+            request["stream_options"] = {"include_usage": True}
+        return request
+    
+    def _create_method(self, client):
+        """The provider's create-a-response method on an SDK client"""
+        return client.messages.create if self._use_anthropic_sdk else client.chat.completions.create
+    
+    @_retry_transient
+    def _create(self, prompt: str, max_tokens: int, temperature: float, system_prompt: str = None,
+                shared_context: str = None):
+        """Send one request to the provider, retrying transient errors"""
+        client = self.anthropic_client if self._use_anthropic_sdk else self.client
+        return self._create_method(client)(
+            **self._build_request(prompt, max_tokens, temperature, system_prompt, shared_context)
+        )
+    
+    @_retry_transient
+    async def _acreate(self, prompt: str, max_tokens: int, temperature: float, system_prompt: str = None,
+                       shared_context: str = None):
+        """Async version of _create"""
+        return await self._create_method(self.async_client)(
+            **self._build_request(prompt, max_tokens, temperature, system_prompt, shared_context)
+        )
+    
+    @_retry_transient
+    async def _aopen_stream(self, prompt: str, max_tokens: int, temperature: float, system_prompt: str = None,
+                            shared_context: str = None):
+        """Open a streaming response, retrying transient errors"""
+        return await self._create_method(self.async_client)(
+            **self._build_request(prompt, max_tokens, temperature, system_prompt, shared_context, stream=True)
+        )
+    
+    def _cache_path(self, prompt: str, max_tokens: int, temperature: float, system_prompt: str = None,
+                    shared_context: str = None) -> Optional[Path]:
+        """Response cache file for a request (None when it isn't cached)"""
+        if not self.cache_dir:
+            return None
+        if self.cache_max_temperature is not None and temperature > self.cache_max_temperature:
+            return None
+        return _response_cache_path(
+            self.cache_dir,
+            (self.provider.value, self.model, max_tokens, temperature, system_prompt, shared_context, prompt)
+        )
+    
     def generate_content(
         self,
         prompt: str,
         max_tokens: int = 8192,
         temperature: float = 0.7,
         system_prompt: str = None,
-        context_id: str = None
+        context_id: str = None,
+        shared_context: str = None
     ) -> str:
-        """Generate content using configured provider"""
+        """
+        Generate content using configured provider.
+        
+        shared_context is sent ahead of prompt as a separate cacheable block.
+        Put large text that several calls share (a manuscript chunk) there and
+        the call-specific instruction in prompt, so providers' prompt caching
+        reuses the prefix across calls.
+        """
         # Check cancellation
         if context_id and cancellation_manager.is_cancelled(context_id):
             print(f"🛑 Operation cancelled for {context_id}")
             raise CancelledException("Operation cancelled by user")
-
+        
+        cache_path = self._cache_path(prompt, max_tokens, temperature, system_prompt, shared_context)
+        cached = _response_cache_get(cache_path)
+        if cached is not None:
+            return cached
+        
+        text = self._generate_content(prompt, max_tokens, temperature, system_prompt, shared_context)
+        _response_cache_put(cache_path, text)
+        return text
+    
+    def _generate_content(self, prompt: str, max_tokens: int, temperature: float, system_prompt: str = None,
+                          shared_context: str = None) -> str:
+        """Call the provider for generate_content ("" on failure)"""
         try:
-            self.total_requests += 1
+            self._count_request()
+            
+            response = self._create(prompt, max_tokens, temperature, system_prompt, shared_context)
+            self._record_usage(response)
             
             if self._use_anthropic_sdk:
-                # Anthropic SDK
-                message = self.anthropic_client.messages.create(
-                    model=self.model,
-                    max_tokens=max_tokens,
-                    system=system_prompt or "You are a professional manuscript editor.",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=temperature
-                )
-                # Track tokens (Anthropic returns usage)
-                if hasattr(message, 'usage'):
-                    self.total_input_tokens += getattr(message.usage, 'input_tokens', 0)
-                    self.total_output_tokens += getattr(message.usage, 'output_tokens', 0)
-                return message.content[0].text.strip()
+                return response.content[0].text.strip()
             else:
-                # OpenAI-compatible (Gemini, OpenRouter)
-                messages = []
-                if system_prompt:
-                    messages.append({"role": "system", "content": system_prompt})
-                messages.append({"role": "user", "content": prompt})
-                
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                )
-                # Track tokens (OpenAI-compatible returns usage)
-                if hasattr(response, 'usage') and response.usage:
-                    self.total_input_tokens += getattr(response.usage, 'prompt_tokens', 0)
-                    self.total_output_tokens += getattr(response.usage, 'completion_tokens', 0)
                 return response.choices[0].message.content.strip()
         
         except CancelledException:
@@ -187,44 +430,43 @@ class CancelledException(Exception):
             print(f"❌ LLM Error: {e}")
             return ""
 
-    @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(5))
     async def agenerate_content(
         self,
         prompt: str,
         max_tokens: int = 8192,
         temperature: float = 0.7,
         system_prompt: str = None,
-        context_id: str = None
+        context_id: str = None,
+        shared_context: str = None
     ) -> str:
         """Async version of generate_content"""
         # Check cancellation
         if context_id and cancellation_manager.is_cancelled(context_id):
             raise CancelledException("Operation cancelled by user")
-            
+        
+        cache_path = self._cache_path(prompt, max_tokens, temperature, system_prompt, shared_context)
+        if cache_path is not None:
+            cached = await asyncio.to_thread(_response_cache_get, cache_path)
+            if cached is not None:
+                return cached
+        
+        text = await self._agenerate_content(prompt, max_tokens, temperature, system_prompt, shared_context)
+        if cache_path is not None:
+            await asyncio.to_thread(_response_cache_put, cache_path, text)
+        return text
+    
+    async def _agenerate_content(self, prompt: str, max_tokens: int, temperature: float, system_prompt: str = None,
+                                 shared_context: str = None) -> str:
+        """Async version of _generate_content"""
         try:
+            self._count_request()
+            
+            response = await self._acreate(prompt, max_tokens, temperature, system_prompt, shared_context)
+            self._record_usage(response)
+            
             if self._use_anthropic_sdk:
-                # Anthropic SDK (async)
-                message = await self.async_anthropic_client.messages.create(
-                    model=self.model,
-                    max_tokens=max_tokens,
-                    system=system_prompt or "You are a professional manuscript editor.",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=temperature
-                )
-                return message.content[0].text.strip()
+                return response.content[0].text.strip()
             else:
-                # OpenAI-compatible (async)
-                messages = []
-                if system_prompt:
-                    messages.append({"role": "system", "content": system_prompt})
-                messages.append({"role": "user", "content": prompt})
-                
-                response = await self.async_client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                )
                 return response.choices[0].message.content.strip()
         
         except CancelledException:
@@ -234,16 +476,218 @@ class CancelledException(Exception):
             print(f"❌ Async LLM Error: {e}")
             return ""
     
+    async def astream(
+        self,
+        prompt: str,
+        max_tokens: int = 8192,
+        temperature: float = 0.7,
+        system_prompt: str = None,
+        context_id: str = None,
+        shared_context: str = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response as text chunks, as the provider produces them.
+        
+        Errors are logged and end the stream early, as generate_content
+        returns "" on failure. Streamed responses aren't cached.
+        
+        Args:
+            prompt: Prompt to send
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system_prompt: Optional system prompt
+            context_id: Cancellation context
+            shared_context: Cacheable text sent ahead of prompt (see
+                generate_content)
+            
+        Yields:
+            Response text chunks
+        """
+        if context_id and cancellation_manager.is_cancelled(context_id):
+            raise CancelledException("Operation cancelled by user")
+        
+        input_tokens = output_tokens = 0
+        try:
+            self._count_request()
+            stream = await self._aopen_stream(prompt, max_tokens, temperature, system_prompt, shared_context)
+            async for event in stream:
+                if self._use_anthropic_sdk:
+                    if event.type == "message_start":
+                        input_tokens = event.message.usage.input_tokens
+                    elif event.type == "message_delta":
+                        output_tokens = event.usage.output_tokens
+                    elif event.type == "content_block_delta" and event.delta.type == "text_delta":
+                        yield event.delta.text
+                else:
+                    if event.usage:
+                        input_tokens, output_tokens = event.usage.prompt_tokens, event.usage.completion_tokens
+                    if event.choices and event.choices[0].delta.content:
+                        yield event.choices[0].delta.content
+        except CancelledException:
+            raise
+        except Exception as e:
+            logger.exception(f"Streaming LLM API error: {e}")
+            print(f"❌ Streaming LLM Error: {e}")
+        finally:
+            with self._usage_lock:
+                self.total_input_tokens += input_tokens or 0
+                self.total_output_tokens += output_tokens or 0
+    
+    async def agenerate_batch(
+        self,
+        prompts: List[str],
+        max_concurrency: int = 8,
+        **kwargs
+    ) -> List[str]:
+        """
+        Run several prompts concurrently through agenerate_content.
+        
+        Args:
+            prompts: Prompts to send
+            max_concurrency: Maximum requests in flight at once (keep this
+                within the provider's rate limit)
+            **kwargs: Passed through to agenerate_content
+            
+        Returns:
+            Responses in the same order as prompts
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _generate_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate_content(prompt, **kwargs)
+        
+        return await asyncio.gather(*[_generate_one(p) for p in prompts])
+
+    async def arun_batch_job(
+        self,
+        prompts: Dict[str, str],
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        poll_interval: float = 30.0
+    ) -> Dict[str, str]:
+        """
+        Run prompts as one offline Batch API job (half price, and outside the
+        per-minute rate limits) and wait for it to finish.
+
+        Uses Anthropic Message Batches or the OpenAI-compatible Batch API.
+        OpenRouter has no batch API, so there the prompts run concurrently
+        through agenerate_batch instead. A batch job can take up to 24h, so
+        use this for non-interactive runs.
+
+        Args:
+            prompts: Prompts keyed by a caller-chosen custom id
+            max_tokens: Maximum tokens per response
+            temperature: Sampling temperature
+            poll_interval: Seconds between job status checks
+
+        Returns:
+            Responses keyed by custom id ("" for requests that failed)
+        """
+        if self._use_anthropic_sdk:
+            return await self._arun_anthropic_batch(prompts, max_tokens, temperature, poll_interval)
+        if self.provider == LLMProvider.OPENROUTER:
+            responses = await self.agenerate_batch(
+                list(prompts.values()), max_concurrency=10, max_tokens=max_tokens, temperature=temperature
+            )
+            return dict(zip(prompts, responses))
+
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_request(prompt, max_tokens, temperature),
+            })
+            for custom_id, prompt in prompts.items()
+        ]
+        input_file = await self.async_client.files.create(
+            file=("input.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await self.async_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"📦 Batch job {batch.id} submitted ({len(prompts)} requests)")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await self.async_client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch job {batch.id} ended with status {batch.status}")
+
+        results = dict.fromkeys(prompts, "")
+        if not batch.output_file_id:
+            return results
+        output = await self.async_client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.error(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                continue
+            body = response["body"]
+            usage = body.get("usage") or {}
+            with self._usage_lock:
+                self.total_requests += 1
+                self.total_input_tokens += usage.get("prompt_tokens") or 0
+                self.total_output_tokens += usage.get("completion_tokens") or 0
+            results[record["custom_id"]] = (body["choices"][0]["message"]["content"] or "").strip()
+        return results
+
+    async def _arun_anthropic_batch(
+        self,
+        prompts: Dict[str, str],
+        max_tokens: int,
+        temperature: float,
+        poll_interval: float
+    ) -> Dict[str, str]:
+        """arun_batch_job through Anthropic Message Batches"""
+        # Anthropic custom ids only allow [a-zA-Z0-9_-], so send positional ids
+        custom_ids = list(prompts)
+        batch = await self.async_client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": f"req-{i}",
+                    "params": self._build_request(prompt, max_tokens, temperature),
+                }
+                for i, prompt in enumerate(prompts.values())
+            ]
+        )
+        print(f"📦 Batch job {batch.id} submitted ({len(prompts)} requests)")
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(poll_interval)
+            batch = await self.async_client.messages.batches.retrieve(batch.id)
+
+        results = dict.fromkeys(prompts, "")
+        async for entry in await self.async_client.messages.batches.results(batch.id):
+            custom_id = custom_ids[int(entry.custom_id[len("req-"):])]
+            if entry.result.type != "succeeded":
+                logger.error(f"Batch request {custom_id} {entry.result.type}")
+                continue
+            message = entry.result.message
+            self._count_request()
+            self._record_usage(message)
+            results[custom_id] = message.content[0].text.strip()
+        return results
+
     def generate(
         self,
         agent_name: str,
         prompt: str,
         max_tokens: int = 4000,
         temperature: float = 0.7,
-        context_id: str = None
+        context_id: str = None,
+        shared_context: str = None
     ) -> str:
         """Generate content (legacy compatibility method)"""
-        return self.generate_content(prompt, max_tokens, temperature, context_id=context_id)
+        return self.generate_content(prompt, max_tokens, temperature, context_id=context_id,
+                                     shared_context=shared_context)
     
     @property
     def current_provider(self) -> str:
@@ -257,17 +701,34 @@ class CancelledException(Exception):
     
     def get_usage_stats(self) -> dict:
         """Get token usage statistics"""
-        return {
-            "provider": self.provider.value,
-            "model": self.model,
-            "total_input_tokens": self.total_input_tokens,
-            "total_output_tokens": self.total_output_tokens,
-            "total_tokens": self.total_input_tokens + self.total_output_tokens,
-            "total_requests": self.total_requests
-        }
+        with self._usage_lock:
+            return {
+                "provider": self.provider.value,
+                "model": self.model,
+                "total_input_tokens": self.total_input_tokens,
+                "total_output_tokens": self.total_output_tokens,
+                "total_tokens": self.total_input_tokens + self.total_output_tokens,
+                "total_requests": self.total_requests
+            }
     
     def reset_usage_stats(self):
         """Reset token counters"""
-        self.total_input_tokens = 0
-        self.total_output_tokens = 0
-        self.total_requests = 0
+        with self._usage_lock:
+            self.total_input_tokens = 0
+            self.total_output_tokens = 0
+            self.total_requests = 0
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm_client() -> LLMClient:
+    """
+    Shared LLMClient for scripts and tests, created on first use.
+    
+    Near-deterministic calls (temperature <= 0.1) are answered from the
+    response cache (LLM_CACHE_DIR, else .llm_cache), so re-running a script
+    doesn't repeat them. Set LLM_CACHE_DIR to cache every call instead.
+    Callers that switch providers (e.g. the API) should own their client.
+    """
+    if _RESPONSE_CACHE_DIR:
+        return LLMClient()
+    return LLMClient(cache_dir=_SCRIPT_CACHE_DIR, cache_max_temperature=_SCRIPT_CACHE_MAX_TEMPERATURE)
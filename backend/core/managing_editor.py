@@ -53,6 +53,17 @@ class WorkflowState(BaseModel):
         return self.model_dump(mode='json')
 
 
+# WorkflowState field holding each stage's status
+_STAGE_STATUS_FIELD = {
+    EditingStage.ACQUISITIONS: "acquisitions_status",
+    EditingStage.DEVELOPMENTAL: "developmental_status",
+    EditingStage.LINE: "line_status",
+    EditingStage.COPY: "copy_status",
+    EditingStage.PROOF: "proof_status",
+    EditingStage.COLD_READ: "cold_read_status"
+}
+
+
 class ManagingEditor:
     """
     Managing Editor - Traffic Controller for Editorial Workflow
@@ -76,6 +87,7 @@ class ManagingEditor:
         EditingStage.PROOF,
         EditingStage.COLD_READ
     ]
+    _STAGE_INDEX = {stage: i for i, stage in enumerate(STAGE_ORDER)}
     
     def __init__(self):
         self.workflows: Dict[str, WorkflowState] = {}
@@ -116,9 +128,8 @@ class ManagingEditor:
         workflow = self.workflows[manuscript_id]
         
         # Get the index of the requested stage
-        try:
-            stage_index = self.STAGE_ORDER.index(stage)
-        except ValueError:
+        stage_index = self._STAGE_INDEX.get(stage)
+        if stage_index is None:
             return False, f"Invalid stage: {stage}"
         
         # Check if all previous stages are completed
@@ -142,6 +153,25 @@ class ManagingEditor:
             issues_found: Number of issues found
             fixes_applied: Number of fixes applied
             
+        Returns:
+            Updated workflow state
+        """
+        return self.mark_stages_complete(manuscript_id, [stage], issues_found, fixes_applied)
+    
+    def mark_stages_complete(self, manuscript_id: str, stages: List[EditingStage],
+                             issues_found: int = 0, fixes_applied: int = 0) -> WorkflowState:
+        """
+        Mark several stages complete in one update.
+        
+        Same result as calling mark_stage_complete for each stage in order,
+        but the workflow advances once, past the last stage.
+        
+        Args:
+            manuscript_id: Manuscript ID
+            stages: Stages to mark complete, in order
+            issues_found: Number of issues found (across all the stages)
+            fixes_applied: Number of fixes applied (across all the stages)
+            
         Returns:
             Updated workflow state
         """
@@ -149,16 +179,19 @@ class ManagingEditor:
             raise ValueError("Workflow not started")
         
         workflow = self.workflows[manuscript_id]
+        if not stages:
+            return workflow
         
-        # Update stage status
-        self._set_stage_status(workflow, stage, StageStatus.COMPLETED)
+        # Update stage statuses
+        for stage in stages:
+            self._set_stage_status(workflow, stage, StageStatus.COMPLETED)
         
         # Update totals
         workflow.total_issues_found += issues_found
         workflow.total_fixes_applied += fixes_applied
         
-        # Advance to next stage
-        next_stage = self._get_next_stage(stage)
+        # Advance to the stage after the last one completed
+        next_stage = self._get_next_stage(stages[-1])
         if next_stage:
             workflow.current_stage = next_stage
         else:
@@ -214,39 +247,17 @@ class ManagingEditor:
     
     def _get_stage_status(self, workflow: WorkflowState, stage: EditingStage) -> StageStatus:
         """Get status of a specific stage"""
-        status_map = {
-            EditingStage.ACQUISITIONS: workflow.acquisitions_status,
-            EditingStage.DEVELOPMENTAL: workflow.developmental_status,
-            EditingStage.LINE: workflow.line_status,
-            EditingStage.COPY: workflow.copy_status,
-            EditingStage.PROOF: workflow.proof_status,
-            EditingStage.COLD_READ: workflow.cold_read_status
-        }
-        return status_map[stage]
+        return getattr(workflow, _STAGE_STATUS_FIELD[stage])
     
     def _set_stage_status(self, workflow: WorkflowState, stage: EditingStage, status: StageStatus):
         """Set status of a specific stage"""
-        if stage == EditingStage.ACQUISITIONS:
-            workflow.acquisitions_status = status
-        elif stage == EditingStage.DEVELOPMENTAL:
-            workflow.developmental_status = status
-        elif stage == EditingStage.LINE:
-            workflow.line_status = status
-        elif stage == EditingStage.COPY:
-            workflow.copy_status = status
-        elif stage == EditingStage.PROOF:
-            workflow.proof_status = status
-        elif stage == EditingStage.COLD_READ:
-            workflow.cold_read_status = status
+        setattr(workflow, _STAGE_STATUS_FIELD[stage], status)
     
     def _get_next_stage(self, current_stage: EditingStage) -> Optional[EditingStage]:
         """Get the next stage in sequence"""
-        try:
-            current_index = self.STAGE_ORDER.index(current_stage)
-            if current_index < len(self.STAGE_ORDER) - 1:
-                return self.STAGE_ORDER[current_index + 1]
-        except ValueError:
-            pass
+        current_index = self._STAGE_INDEX.get(current_stage)
+        if current_index is not None and current_index < len(self.STAGE_ORDER) - 1:
+            return self.STAGE_ORDER[current_index + 1]
         return None
     
     def generate_workflow_report(self, manuscript_id: str) -> dict:
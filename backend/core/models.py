@@ -3,11 +3,13 @@ Data models for Series Bible
 """
 
 from typing import List, Optional, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Character(BaseModel):
     """Character entity"""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     age: Optional[int] = None
     eye_color: Optional[str] = None
@@ -21,6 +23,8 @@ class Character(BaseModel):
 
 class Location(BaseModel):
     """Location entity"""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     type: Optional[str] = None  # e.g., "Police Station", "Residence"
     description: Optional[str] = None
@@ -30,6 +34,8 @@ class Location(BaseModel):
 
 class TimelineEvent(BaseModel):
     """Timeline event"""
+    model_config = ConfigDict(frozen=True)
+    
     date: Optional[str] = None  # e.g., "2023-10-15"
     day_of_week: Optional[str] = None  # e.g., "Monday"
     events: List[str] = Field(default_factory=list)
@@ -39,6 +45,8 @@ class TimelineEvent(BaseModel):
 
 class Object(BaseModel):
     """Important object/item"""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     description: Optional[str] = None
     color: Optional[str] = None
@@ -4,11 +4,169 @@ Manages all project files, reports, versions, and metadata
 """
 
 import os
+import sys
 import json
+import asyncio
+import shutil
 import difflib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from operator import attrgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, NamedTuple
+
+try:
+    from diff_match_patch import diff_match_patch
+except ImportError:
+    diff_match_patch = None
+
+from core.io import (
+    loads_json, read_json, write_json, read_json_async, read_text, write_bytes, link_or_write,
+    append_json_line, read_json_lines,
+)
+from core.document_parser import DocumentParser
+
+
+# Subdirectories created for every new project, relative to its root
+_PROJECT_SUBDIRS = (
+    "manuscript/versions",
+    "reports/acquisitions",
+    "reports/developmental",
+    "reports/line",
+    "reports/copy",
+    "reports/proof",
+    "style_sheet",
+    "workflow",
+)
+
+# Stages with a reports/ subdirectory in every project
+_REPORT_STAGES = ("acquisitions", "developmental", "line", "copy", "proof")
+
+
+class _ProjectPaths(NamedTuple):
+    """Precomputed file paths for one project"""
+    root: str
+    manuscript_dir: str
+    versions_dir: str
+    original_txt: str
+    current_txt: str
+    metadata_json: str
+    workflow_json: str
+    style_sheet_json: str
+    style_sheet_log: str
+    reports_dir: str
+    reports: Dict[str, str]
+
+    def stage_dir(self, stage: str) -> str:
+        """Report directory for a stage"""
+        return self.reports.get(stage) or os.path.join(self.reports_dir, stage)
+
+
+class VersionInfo(NamedTuple):
+    """One saved manuscript version, as returned by list_versions"""
+    version: str
+    filename: str
+    created_at: str
+    size: int
+
+
+# Style sheet patch logs bigger than this are folded back into style_sheet.json
+_STYLE_SHEET_LOG_LIMIT = 64 * 1024
+
+# Most projects whose paths _paths keeps
+_PATH_CACHE_SIZE = 256
+
+# Most JSON files _load_json_cached keeps in memory
+_JSON_CACHE_SIZE = 64
+
+# Severity sections of a stage report, in order (other severities are omitted)
+_SEVERITY_ORDER = ("critical", "major", "minor")
+
+# ioctl request number for FICLONE (linux/fs.h)
+_FICLONE = 0x40049409
+
+# macOS clonefile(2), resolved on first use
+_clonefile = None
+
+
+def _clone_file(src: str, dst: str):
+    """Clone src to dst copy-on-write; raises OSError if the filesystem can't"""
+    global _clonefile
+    if sys.platform.startswith("linux"):
+        import fcntl
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    elif sys.platform == "darwin":
+        import ctypes
+        if _clonefile is None:
+            libc = ctypes.CDLL(None, use_errno=True)
+            _clonefile = libc.clonefile
+            _clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+        if _clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), src)
+    else:
+        raise OSError(f"No copy-on-write clone on {sys.platform}")
+
+
+# diff_match_patch op codes -> compare_versions change types
+_DMP_CHANGE_TYPES = {-1: "removed", 0: "unchanged", 1: "added"}
+
+
+def _diff_lines_myers(text1: str, text2: str) -> List[Dict[str, Any]]:
+    """Line diff with diff-match-patch: each line is mapped to one character
+    so the Myers diff runs over a string as short as the line count"""
+    # Split like str.splitlines and end every line with "\n", so a missing
+    # final newline or a different line separator doesn't count as a change
+    text1 = "".join(line + "\n" for line in text1.splitlines())
+    text2 = "".join(line + "\n" for line in text2.splitlines())
+    
+    dmp = diff_match_patch()
+    chars1, chars2, line_array = dmp.diff_linesToChars(text1, text2)
+    diffs = dmp.diff_main(chars1, chars2, False)
+    dmp.diff_charsToLines(diffs, line_array)
+    
+    changes = []
+    for op, chunk in diffs:
+        change_type = _DMP_CHANGE_TYPES[op]
+        changes.extend({'type': change_type, 'content': line} for line in chunk.splitlines())
+    return changes
+
+
+def _diff_lines_difflib(text1: str, text2: str) -> List[Dict[str, Any]]:
+    """Line diff with difflib, used when diff-match-patch isn't installed"""
+    lines1 = text1.splitlines()
+    lines2 = text2.splitlines()
+    
+    # Opcodes give the same added/removed/unchanged tags as ndiff without
+    # its per-line fuzzy matching and "?" hint generation
+    matcher = difflib.SequenceMatcher(a=lines1, b=lines2, autojunk=False)
+    changes = []
+    
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            changes.extend({'type': 'unchanged', 'content': line} for line in lines1[i1:i2])
+            continue
+        if tag in ('delete', 'replace'):
+            changes.extend({'type': 'removed', 'content': line} for line in lines1[i1:i2])
+        if tag in ('insert', 'replace'):
+            changes.extend({'type': 'added', 'content': line} for line in lines2[j1:j2])
+    return changes
+
+
+def _reflink_copy(src: str, dst: str) -> str:
+    """
+    copy_function for shutil.copytree: clone the file (APFS, Btrfs, XFS,
+    ...) so no data is copied, falling back to shutil.copy2.
+    """
+    try:
+        _clone_file(src, dst)
+    except OSError:
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
 
 
 class ProjectManager:
@@ -39,6 +197,10 @@ class ProjectManager:
                 status.json
                 history.json
             metadata.json
+        projects_index.json
+    
+    projects_index.json maps manuscript_id to each project's metadata, so
+    list_projects reads one file instead of every metadata.json.
     """
     
     def __init__(self, base_dir: str = None):
@@ -49,184 +211,281 @@ class ProjectManager:
             base_dir = backend_dir / "projects"
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.base_dir / "projects_index.json"
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._index_lock = threading.Lock()
+        # Report files are independent, so their writes overlap
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="project-io")
+        # manuscript_id -> _ProjectPaths, for _paths
+        self._path_cache: Dict[str, _ProjectPaths] = {}
+        # path -> ((mtime_ns, size, inode), raw JSON bytes) for _load_json_cached,
+        # least recently used first
+        self._json_cache: Dict[str, tuple] = {}
+    
+    def _scan_metadata(self) -> Dict[str, Dict[str, Any]]:
+        """Read every project's metadata.json (used to build the index)"""
+        index = {}
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                try:
+                    index[entry.name] = read_json(os.path.join(entry.path, "metadata.json"))
+                except FileNotFoundError:
+                    pass
+        return index
+    
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Return the projects index, building it from disk on first run"""
+        if self._index is None:
+            try:
+                self._index = read_json(self._index_path)
+            except FileNotFoundError:
+                self._index = self._scan_metadata()
+                write_json(self._index_path, self._index)
+        return self._index
+    
+    def _write_index_entry(self, manuscript_id: str, entry: Optional[Dict[str, Any]]):
+        """Set (or remove, if entry is None) a project's index entry and save the index"""
+        with self._index_lock:
+            index = self._load_index()
+            if entry is None:
+                if index.pop(manuscript_id, None) is None:
+                    return
+            else:
+                index[manuscript_id] = entry
+            write_json(self._index_path, index)
+    
+    def _paths(self, manuscript_id: str) -> _ProjectPaths:
+        """File paths for a project, built once per manuscript_id"""
+        paths = self._path_cache.get(manuscript_id)
+        if paths is None:
+            if len(self._path_cache) >= _PATH_CACHE_SIZE:
+                # Drop the oldest entry
+                self._path_cache.pop(next(iter(self._path_cache)), None)
+            paths = self._path_cache[manuscript_id] = self._build_paths(manuscript_id)
+        return paths
+    
+    def _build_paths(self, manuscript_id: str) -> _ProjectPaths:
+        """Compute a project's file paths"""
+        root = os.path.join(str(self.base_dir), manuscript_id)
+        manuscript_dir = os.path.join(root, "manuscript")
+        reports_dir = os.path.join(root, "reports")
+        return _ProjectPaths(
+            root=root,
+            manuscript_dir=manuscript_dir,
+            versions_dir=os.path.join(manuscript_dir, "versions"),
+            original_txt=os.path.join(manuscript_dir, "original.txt"),
+            current_txt=os.path.join(manuscript_dir, "current.txt"),
+            metadata_json=os.path.join(root, "metadata.json"),
+            workflow_json=os.path.join(root, "workflow", "status.json"),
+            style_sheet_json=os.path.join(root, "style_sheet", "style_sheet.json"),
+            style_sheet_log=os.path.join(root, "style_sheet", "style_sheet.log"),
+            reports_dir=reports_dir,
+            reports={stage: os.path.join(reports_dir, stage) for stage in _REPORT_STAGES},
+        )
     
     def create_project(self, manuscript_id: str, title: str, original_text: str) -> Dict[str, Any]:
         """Create new project structure"""
-        project_dir = self.base_dir / manuscript_id
+        paths = self._paths(manuscript_id)
         
         # Create directory structure
-        (project_dir / "manuscript" / "versions").mkdir(parents=True, exist_ok=True)
-        (project_dir / "reports" / "acquisitions").mkdir(parents=True, exist_ok=True)
-        (project_dir / "reports" / "developmental").mkdir(parents=True, exist_ok=True)
-        (project_dir / "reports" / "line").mkdir(parents=True, exist_ok=True)
-        (project_dir / "reports" / "copy").mkdir(parents=True, exist_ok=True)
-        (project_dir / "reports" / "proof").mkdir(parents=True, exist_ok=True)
-        (project_dir / "style_sheet").mkdir(parents=True, exist_ok=True)
-        (project_dir / "workflow").mkdir(parents=True, exist_ok=True)
+        root = paths.root
+        os.makedirs(root, exist_ok=True)
+        for sub in _PROJECT_SUBDIRS:
+            os.makedirs(os.path.join(root, sub), exist_ok=True)
         
         # Save original manuscript
-        with open(project_dir / "manuscript" / "original.txt", "w", encoding="utf-8") as f:
-            f.write(original_text)
+        data = original_text.encode("utf-8")
+        write_bytes(paths.original_txt, data)
         
         # Save current manuscript (same as original initially)
-        with open(project_dir / "manuscript" / "current.txt", "w", encoding="utf-8") as f:
-            f.write(original_text)
+        link_or_write(paths.original_txt, paths.current_txt, data)
         
         # Create metadata
+        now = datetime.now().isoformat()
         metadata = {
             "manuscript_id": manuscript_id,
             "title": title,
-            "created_at": datetime.now().isoformat(),
-            "last_modified": datetime.now().isoformat(),
-            "word_count": len(original_text.split()),
+            "created_at": now,
+            "last_modified": now,
+            "word_count": DocumentParser.get_word_count(original_text),
             "stages_completed": []
         }
         
-        with open(project_dir / "metadata.json", "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
+        write_json(paths.metadata_json, metadata)
+        self._write_index_entry(manuscript_id, metadata)
         
         return metadata
     
     def save_manuscript_version(self, manuscript_id: str, stage: str, text: str):
         """Save manuscript version after a stage"""
-        project_dir = self.base_dir / manuscript_id
-        version_file = project_dir / "manuscript" / "versions" / f"v_{stage}.txt"
+        paths = self._paths(manuscript_id)
+        version_file = os.path.join(paths.versions_dir, f"v_{stage}.txt")
         
-        with open(version_file, "w", encoding="utf-8") as f:
-            f.write(text)
+        data = text.encode("utf-8")
+        write_bytes(version_file, data)
         
-        # Update current manuscript
-        with open(project_dir / "manuscript" / "current.txt", "w", encoding="utf-8") as f:
-            f.write(text)
+        # Update current manuscript. current.txt is a hard link to the latest
+        # version, so it must only ever be replaced, never written in place
+        link_or_write(version_file, paths.current_txt, data)
 
-    def list_versions(self, manuscript_id: str) -> list:
-        """List all available manuscript versions"""
-        project_dir = self.base_dir / manuscript_id
-        versions_dir = project_dir / "manuscript" / "versions"
+    def list_versions(self, manuscript_id: str) -> List[VersionInfo]:
+        """List all available manuscript versions, newest first"""
+        paths = self._paths(manuscript_id)
+        versions_dir = paths.versions_dir
         
         versions = []
-        if versions_dir.exists():
-            for file in versions_dir.glob("v_*.txt"):
-                stage = file.stem[2:] # remove 'v_'
-                stats = file.stat()
-                versions.append({
-                    "version": stage,
-                    "filename": file.name,
-                    "created_at": datetime.fromtimestamp(stats.st_mtime).isoformat(),
-                    "size": stats.st_size
-                })
+        if os.path.exists(versions_dir):
+            # DirEntry.stat() is cached from the directory scan
+            with os.scandir(versions_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith("v_") and name.endswith(".txt")):
+                        continue
+                    stats = entry.stat()
+                    versions.append(VersionInfo(
+                        name[2:-4], # remove 'v_' and '.txt'
+                        name,
+                        datetime.fromtimestamp(stats.st_mtime).isoformat(),
+                        stats.st_size
+                    ))
         
         # Add original if exists
-        original = project_dir / "manuscript" / "original.txt"
-        if original.exists():
-            stats = original.stat()
-            versions.append({
-                "version": "original",
-                "filename": "original.txt",
-                "created_at": datetime.fromtimestamp(stats.st_mtime).isoformat(),
-                "size": stats.st_size
-            })
+        original = paths.original_txt
+        if os.path.exists(original):
+            stats = os.stat(original)
+            versions.append(VersionInfo(
+                "original",
+                "original.txt",
+                datetime.fromtimestamp(stats.st_mtime).isoformat(),
+                stats.st_size
+            ))
             
-        return sorted(versions, key=lambda x: x["created_at"], reverse=True)
+        return sorted(versions, key=attrgetter("created_at"), reverse=True)
 
     def restore_version(self, manuscript_id: str, version_name: str) -> bool:
         """Restore specific version as current"""
-        project_dir = self.base_dir / manuscript_id
+        paths = self._paths(manuscript_id)
         
         if version_name == "original":
-            src = project_dir / "manuscript" / "original.txt"
+            src = paths.original_txt
         else:
             # Handle both 'stage' and full filename cases
-            src = project_dir / "manuscript" / "versions" / f"v_{version_name}.txt"
-            if not src.exists():
-                 src = project_dir / "manuscript" / "versions" / f"{version_name}"
+            src = os.path.join(paths.versions_dir, f"v_{version_name}.txt")
+            if not os.path.exists(src):
+                 src = os.path.join(paths.versions_dir, version_name)
         
-        if not src.exists():
+        if not os.path.exists(src):
             return False
             
         # Create backup of current before restoring
-        current = project_dir / "manuscript" / "current.txt"
-        if current.exists():
+        current = paths.current_txt
+        if os.path.exists(current):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup = project_dir / "manuscript" / "versions" / f"v_pre_restore_{timestamp}.txt"
+            backup = os.path.join(paths.versions_dir, f"v_pre_restore_{timestamp}.txt")
             import shutil
             shutil.copy2(current, backup)
             
-        # Restore
-        with open(src, "r", encoding="utf-8") as f:
-            text = f.read()
-            
-        with open(current, "w", encoding="utf-8") as f:
-            f.write(text)
+        # Restore (replaces current.txt rather than writing through a link)
+        link_or_write(src, current)
             
         return True
     
     def save_acquisitions_report(self, manuscript_id: str, report: Dict[str, Any]):
         """Save Acquisitions Editor report"""
-        project_dir = self.base_dir / manuscript_id / "reports" / "acquisitions"
+        report_dir = self._paths(manuscript_id).reports["acquisitions"]
         
         # Save JSON
-        with open(project_dir / "editorial_letter.json", "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2)
+        writes = [self._io_pool.submit(write_json, os.path.join(report_dir, "editorial_letter.json"), report)]
         
         # Save Markdown
-        md_content = self._format_acquisitions_markdown(report)
-        with open(project_dir / "editorial_letter.md", "w", encoding="utf-8") as f:
-            f.write(md_content)
+        md_content = self._format_acquisitions_markdown(report).encode("utf-8")
+        writes.append(self._io_pool.submit(write_bytes, os.path.join(report_dir, "editorial_letter.md"), md_content))
+        
+        for write in writes:
+            write.result()
     
     def save_stage_report(self, manuscript_id: str, stage: str, issues: list, report_data: Optional[Dict] = None):
         """Save report for developmental/line/copy/proof stages"""
-        project_dir = self.base_dir / manuscript_id / "reports" / stage
+        report_dir = self._paths(manuscript_id).stage_dir(stage)
         
         # Save issues JSON
-        with open(project_dir / "issues.json", "w", encoding="utf-8") as f:
-            json.dump(issues, f, indent=2)
+        writes = [self._io_pool.submit(write_json, os.path.join(report_dir, "issues.json"), issues)]
         
         # Save report JSON if provided
         if report_data:
-            with open(project_dir / "report.json", "w", encoding="utf-8") as f:
-                json.dump(report_data, f, indent=2)
+            writes.append(self._io_pool.submit(write_json, os.path.join(report_dir, "report.json"), report_data))
         
         # Save Markdown summary
-        md_content = self._format_stage_markdown(stage, issues)
-        with open(project_dir / "report.md", "w", encoding="utf-8") as f:
-            f.write(md_content)
+        md_content = self._format_stage_markdown(stage, issues).encode("utf-8")
+        writes.append(self._io_pool.submit(write_bytes, os.path.join(report_dir, "report.md"), md_content))
+        
+        # Wait for every write, re-raising the first failure
+        for write in writes:
+            write.result()
     
     def save_style_sheet(self, manuscript_id: str, style_sheet: Dict[str, Any]):
         """Save Style Sheet"""
-        project_dir = self.base_dir / manuscript_id / "style_sheet"
+        paths = self._paths(manuscript_id)
+        write_json(paths.style_sheet_json, style_sheet)
+        # The full sheet supersedes any logged patches
+        try:
+            os.remove(paths.style_sheet_log)
+        except FileNotFoundError:
+            pass
+    
+    def save_style_sheet_patch(self, manuscript_id: str, patch: Dict[str, Any]) -> bool:
+        """
+        Save changed top-level Style Sheet fields without rewriting the sheet.
         
-        with open(project_dir / "style_sheet.json", "w", encoding="utf-8") as f:
-            json.dump(style_sheet, f, indent=2)
+        The patch is appended to style_sheet.log and applied on load. Once
+        the log passes _STYLE_SHEET_LOG_LIMIT it is compacted.
+        
+        Args:
+            manuscript_id: Project ID
+            patch: Field name -> new (JSON-serializable) value
+            
+        Returns:
+            False if there is no saved style sheet to patch (save the full
+            sheet with save_style_sheet instead)
+        """
+        paths = self._paths(manuscript_id)
+        if not os.path.exists(paths.style_sheet_json):
+            return False
+        append_json_line(paths.style_sheet_log, patch)
+        if os.path.getsize(paths.style_sheet_log) > _STYLE_SHEET_LOG_LIMIT:
+            self.compact_style_sheet(manuscript_id)
+        return True
+    
+    def compact_style_sheet(self, manuscript_id: str):
+        """Fold logged Style Sheet patches into style_sheet.json and clear the log"""
+        style_sheet = self.load_style_sheet(manuscript_id)
+        if style_sheet is not None:
+            self.save_style_sheet(manuscript_id, style_sheet)
     
     def save_workflow_status(self, manuscript_id: str, workflow: Dict[str, Any]):
         """Save workflow status"""
-        project_dir = self.base_dir / manuscript_id / "workflow"
-        
-        with open(project_dir / "status.json", "w", encoding="utf-8") as f:
-            json.dump(workflow, f, indent=2)
+        write_json(self._paths(manuscript_id).workflow_json, workflow)
     
     def load_project(self, manuscript_id: str) -> Optional[Dict[str, Any]]:
         """Load complete project data"""
-        project_dir = self.base_dir / manuscript_id
+        paths = self._paths(manuscript_id)
         
-        if not project_dir.exists():
+        if not os.path.exists(paths.root):
             return None
         
         # Load metadata
-        with open(project_dir / "metadata.json", "r", encoding="utf-8") as f:
-            metadata = json.load(f)
+        metadata = read_json(paths.metadata_json)
         
         # Load current manuscript
-        with open(project_dir / "manuscript" / "current.txt", "r", encoding="utf-8") as f:
-            current_text = f.read()
+        current_text = read_text(paths.current_txt)
         
         # Load workflow status
-        workflow_file = project_dir / "workflow" / "status.json"
+        workflow_file = paths.workflow_json
         workflow = None
-        if workflow_file.exists():
-            with open(workflow_file, "r", encoding="utf-8") as f:
-                workflow = json.load(f)
+        if os.path.exists(workflow_file):
+            workflow = read_json(workflow_file)
         
         return {
             "metadata": metadata,
@@ -234,73 +493,109 @@ class ProjectManager:
             "workflow": workflow
         }
 
+    def _load_json_cached(self, path: str) -> Optional[Any]:
+        """
+        Read a JSON file, skipping the read while the file is unchanged.
+        
+        Writes always replace the file (new inode), so (mtime, size, inode)
+        changes on every save. Only the raw bytes are cached and every call
+        parses its own copy, so callers may mutate the result.
+        
+        Returns:
+            Parsed JSON, or None if the file doesn't exist
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self._json_cache.pop(path, None)
+            return None
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._json_cache.pop(path, None)
+        if cached is None or cached[0] != stamp:
+            with open(path, "rb") as f:
+                cached = (stamp, f.read())
+        # Re-insert as the most recently used entry, evicting the least
+        self._json_cache[path] = cached
+        if len(self._json_cache) > _JSON_CACHE_SIZE:
+            self._json_cache.pop(next(iter(self._json_cache)), None)
+        return loads_json(cached[1])
+    
     def load_style_sheet(self, manuscript_id: str) -> Optional[Dict[str, Any]]:
-        """Load style sheet from disk"""
-        style_sheet_file = self.base_dir / manuscript_id / "style_sheet" / "style_sheet.json"
-        if style_sheet_file.exists():
-            with open(style_sheet_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return None
+        """Load style sheet from disk, with any logged patches applied"""
+        paths = self._paths(manuscript_id)
+        style_sheet = self._load_json_cached(paths.style_sheet_json)
+        patches = read_json_lines(paths.style_sheet_log)
+        if style_sheet is None or not patches:
+            return style_sheet
+        for patch in patches:
+            style_sheet.update(patch)
+        return style_sheet
 
     def load_workflow_status(self, manuscript_id: str) -> Optional[Dict[str, Any]]:
         """Load workflow status from disk"""
-        workflow_file = self.base_dir / manuscript_id / "workflow" / "status.json"
-        if workflow_file.exists():
-            with open(workflow_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return None
+        return self._load_json_cached(self._paths(manuscript_id).workflow_json)
 
     def load_acquisitions_report(self, manuscript_id: str) -> Optional[Dict[str, Any]]:
         """Load acquisitions report from disk"""
-        report_file = self.base_dir / manuscript_id / "reports" / "acquisitions" / "editorial_letter.json"
-        if report_file.exists():
-            with open(report_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return None
+        return self._load_json_cached(
+            os.path.join(self._paths(manuscript_id).reports["acquisitions"], "editorial_letter.json")
+        )
 
     def load_stage_report(self, manuscript_id: str, stage: str) -> Optional[Dict[str, Any]]:
         """Load stage report from disk"""
         # For micro stages, we primarily look for issues.json, but also report.json if it exists
-        project_dir = self.base_dir / manuscript_id / "reports" / stage
+        report_dir = self._paths(manuscript_id).stage_dir(stage)
         
         result = {}
         
-        issues_file = project_dir / "issues.json"
-        if issues_file.exists():
-            with open(issues_file, "r", encoding="utf-8") as f:
-                result["issues"] = json.load(f)
+        issues = self._load_json_cached(os.path.join(report_dir, "issues.json"))
+        if issues is not None:
+            result["issues"] = issues
                 
-        report_file = project_dir / "report.json"
-        if report_file.exists():
-            with open(report_file, "r", encoding="utf-8") as f:
-                result["report"] = json.load(f)
+        report = self._load_json_cached(os.path.join(report_dir, "report.json"))
+        if report is not None:
+            result["report"] = report
+                
+        return result if result else None
+    
+    async def load_stage_report_async(self, manuscript_id: str, stage: str) -> Optional[Dict[str, Any]]:
+        """Load stage report from disk without blocking the event loop"""
+        report_dir = self._paths(manuscript_id).stage_dir(stage)
+        
+        result = {}
+        
+        issues_file = os.path.join(report_dir, "issues.json")
+        if os.path.exists(issues_file):
+            result["issues"] = await read_json_async(issues_file)
+                
+        report_file = os.path.join(report_dir, "report.json")
+        if os.path.exists(report_file):
+            result["report"] = await read_json_async(report_file)
                 
         return result if result else None
     
     def list_projects(self) -> list:
         """List all projects"""
-        projects = []
-        
-        for project_dir in self.base_dir.iterdir():
-            if project_dir.is_dir():
-                metadata_file = project_dir / "metadata.json"
-                if metadata_file.exists():
-                    with open(metadata_file, "r", encoding="utf-8") as f:
-                        metadata = json.load(f)
-                        projects.append(metadata)
+        with self._index_lock:
+            projects = list(self._load_index().values())
         
         return sorted(projects, key=lambda x: x["last_modified"], reverse=True)
     
     def delete_project(self, manuscript_id: str) -> bool:
         """Delete a project and all its files"""
         import shutil
-        project_dir = self.base_dir / manuscript_id
+        project_dir = self._paths(manuscript_id).root
         
-        if not project_dir.exists():
+        if not os.path.exists(project_dir):
             return False
         
         try:
             shutil.rmtree(project_dir)
+            self._write_index_entry(manuscript_id, None)
+            self._path_cache.pop(manuscript_id, None)
+            prefix = project_dir + os.sep
+            for path in [p for p in self._json_cache if p.startswith(prefix)]:
+                self._json_cache.pop(path, None)
             return True
         except Exception as e:
             print(f"Error deleting project {manuscript_id}: {e}")
@@ -321,40 +616,30 @@ class ProjectManager:
         
         try:
             # Copy entire directory
-            shutil.copytree(source_dir, dest_dir)
+            shutil.copytree(source_dir, dest_dir, copy_function=_reflink_copy)
             
             # Update metadata with new ID and title
             metadata_file = dest_dir / "metadata.json"
             if metadata_file.exists():
-                with open(metadata_file, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
+                metadata = read_json(metadata_file)
                 
                 metadata["manuscript_id"] = new_id
                 metadata["title"] = f"{metadata.get('title', 'Untitled')} (Copy)"
-                metadata["created_at"] = datetime.now().isoformat()
-                metadata["last_modified"] = datetime.now().isoformat()
+                now = datetime.now().isoformat()
+                metadata["created_at"] = now
+                metadata["last_modified"] = now
                 
-                with open(metadata_file, "w", encoding="utf-8") as f:
-                    json.dump(metadata, f, indent=2)
+                write_json(metadata_file, metadata)
             
-            # Update style sheet ID if exists
-            style_sheet_file = dest_dir / "style_sheet" / "style_sheet.json"
-            if style_sheet_file.exists():
-                with open(style_sheet_file, "r", encoding="utf-8") as f:
-                    style_data = json.load(f)
-                style_data["manuscript_id"] = new_id
-                with open(style_sheet_file, "w", encoding="utf-8") as f:
-                    json.dump(style_data, f, indent=2)
-            
-            # Update workflow ID if exists
-            workflow_file = dest_dir / "workflow" / "status.json"
-            if workflow_file.exists():
-                with open(workflow_file, "r", encoding="utf-8") as f:
-                    workflow_data = json.load(f)
-                workflow_data["manuscript_id"] = new_id
-                with open(workflow_file, "w", encoding="utf-8") as f:
-                    json.dump(workflow_data, f, indent=2)
+            # Point the style sheet and workflow at the new ID. Swap the quoted
+            # ID as bytes rather than parsing and re-serializing each file
+            old_value = f'"{manuscript_id}"'.encode()
+            new_value = f'"{new_id}"'.encode()
+            for id_file in (dest_dir / "style_sheet" / "style_sheet.json", dest_dir / "workflow" / "status.json"):
+                if id_file.exists():
+                    write_bytes(id_file, id_file.read_bytes().replace(old_value, new_value))
 
+            self._write_index_entry(new_id, metadata)
             return metadata
         except Exception as e:
             print(f"Error duplicating project {manuscript_id}: {e}")
@@ -365,67 +650,136 @@ class ProjectManager:
 
     def rename_project(self, manuscript_id: str, new_title: str) -> bool:
         """Rename a project"""
-        project_dir = self.base_dir / manuscript_id
-        if not project_dir.exists():
+        paths = self._paths(manuscript_id)
+        if not os.path.exists(paths.root):
             return False
             
-        metadata_file = project_dir / "metadata.json"
+        metadata_file = paths.metadata_json
         
         try:
-            if metadata_file.exists():
-                with open(metadata_file, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
+            if os.path.exists(metadata_file):
+                metadata = read_json(metadata_file)
                 
                 metadata["title"] = new_title
                 metadata["last_modified"] = datetime.now().isoformat()
                 
-                with open(metadata_file, "w", encoding="utf-8") as f:
-                    json.dump(metadata, f, indent=2)
+                write_json(metadata_file, metadata)
+                self._write_index_entry(manuscript_id, metadata)
                 return True
             return False
         except Exception as e:
             print(f"Error renaming project {manuscript_id}: {e}")
             return False
     
-    def generate_complete_report(self, manuscript_id: str) -> str:
-        """Generate complete editorial package"""
-        project_dir = self.base_dir / manuscript_id
-        reports_dir = project_dir / "reports"
+    # Stage report markdown files, in the order they appear in the complete report
+    COMPLETE_REPORT_SECTIONS = [
+        ("acquisitions", "Acquisitions Editor Report", "editorial_letter.md"),
+        ("developmental", "Developmental Editor Report", "report.md"),
+        ("line", "Line Editor Report", "report.md"),
+        ("copy", "Copy Editor Report", "report.md"),
+        ("proof", "Proof Editor Report", "report.md"),
+    ]
+    
+    def load_all_reports(self, manuscript_id: str) -> Dict[str, bytes]:
+        """
+        Read every stage's markdown report in one pass over reports/.
         
-        sections = []
+        Report files are found from the directory listings, so only files
+        that exist are opened and nothing is stat'ed.
+        
+        Args:
+            manuscript_id: Project to read
+            
+        Returns:
+            Dict of stage -> report markdown as UTF-8 bytes, for the
+            COMPLETE_REPORT_SECTIONS stages that have a report
+        """
+        filenames = {stage: filename for stage, _, filename in self.COMPLETE_REPORT_SECTIONS}
+        reports = {}
+        try:
+            stage_entries = os.scandir(self._paths(manuscript_id).reports_dir)
+        except FileNotFoundError:
+            return reports
+        
+        with stage_entries:
+            for stage_entry in stage_entries:
+                filename = filenames.get(stage_entry.name)
+                if filename is None or not stage_entry.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(stage_entry.path) as file_entries:
+                    for entry in file_entries:
+                        if entry.name == filename:
+                            with open(entry.path, "rb") as f:
+                                reports[stage_entry.name] = f.read()
+                            break
+        return reports
+    
+    async def load_all_stage_reports(self, manuscript_id: str) -> Dict[str, Optional[str]]:
+        """
+        Read every stage's markdown report without blocking the event loop.
+        
+        Args:
+            manuscript_id: Project to read
+            
+        Returns:
+            Dict of stage -> markdown (None for stages without a report)
+        """
+        reports = await asyncio.to_thread(self.load_all_reports, manuscript_id)
+        return {
+            stage: reports[stage].decode("utf-8") if stage in reports else None
+            for stage, _, _ in self.COMPLETE_REPORT_SECTIONS
+        }
+    
+    def generate_complete_report(
+        self,
+        manuscript_id: str,
+        stage_reports: Optional[Dict[str, Optional[str]]] = None
+    ) -> str:
+        """
+        Generate complete editorial package.
+        
+        Args:
+            manuscript_id: Project to report on
+            stage_reports: Pre-loaded output of load_all_stage_reports; when
+                omitted, the stage files are read with load_all_reports
+            
+        Returns:
+            Complete report as Markdown
+        """
+        paths = self._paths(manuscript_id)
+        
+        # Stage report bodies as UTF-8 bytes (None where missing), in section order
+        if stage_reports is None:
+            reports = self.load_all_reports(manuscript_id)
+            contents = [reports.get(stage) for stage, _, _ in self.COMPLETE_REPORT_SECTIONS]
+        else:
+            contents = [
+                None if stage_reports.get(stage) is None else stage_reports[stage].encode("utf-8")
+                for stage, _, _ in self.COMPLETE_REPORT_SECTIONS
+            ]
         
         # Header
-        with open(project_dir / "metadata.json", "r", encoding="utf-8") as f:
-            metadata = json.load(f)
-        
-        sections.append(f"# Complete Editorial Report: {metadata['title']}\n")
-        sections.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
-        sections.append("---\n\n")
-        
-        # Acquisitions
-        acq_file = reports_dir / "acquisitions" / "editorial_letter.md"
-        if acq_file.exists():
-            with open(acq_file, "r", encoding="utf-8") as f:
-                sections.append("## Acquisitions Editor Report\n\n")
-                sections.append(f.read())
-                sections.append("\n\n---\n\n")
-        
-        # Other stages
-        for stage in ["developmental", "line", "copy", "proof"]:
-            stage_file = reports_dir / stage / "report.md"
-            if stage_file.exists():
-                with open(stage_file, "r", encoding="utf-8") as f:
-                    sections.append(f"## {stage.title()} Editor Report\n\n")
-                    sections.append(f.read())
-                    sections.append("\n\n---\n\n")
-        
-        complete_report = "".join(sections)
-        
-        # Save complete report
-        with open(reports_dir / "complete_report.md", "w", encoding="utf-8") as f:
-            f.write(complete_report)
-        
-        return complete_report
+        metadata = read_json(paths.metadata_json)
+        
+        # Write sections straight to the file rather than joining them in memory
+        complete_path = os.path.join(paths.reports_dir, "complete_report.md")
+        with open(complete_path, "wb") as out:
+            header = (
+                f"# Complete Editorial Report: {metadata['title']}\n"
+                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
+                "---\n\n"
+            )
+            out.write(header.encode("utf-8"))
+            
+            # Stage reports
+            for (_, heading, _), content in zip(self.COMPLETE_REPORT_SECTIONS, contents):
+                if content is None:
+                    continue
+                out.write(f"## {heading}\n\n".encode("utf-8"))
+                out.write(content)
+                out.write(b"\n\n---\n\n")
+        
+        return read_text(complete_path)
     
     def _format_acquisitions_markdown(self, report: Dict[str, Any]) -> str:
         """Format acquisitions report as Markdown"""
@@ -454,26 +808,54 @@ class ProjectManager:
         sections.append(f"**Total Issues Found:** {len(issues)}\n\n")
         
         # Group by severity
-        by_severity = {}
+        by_severity = defaultdict(list)
         for issue in issues:
-            severity = issue.get("severity", "unknown")
-            if severity not in by_severity:
-                by_severity[severity] = []
-            by_severity[severity].append(issue)
-        
-        for severity in ["critical", "major", "minor"]:
-            if severity in by_severity:
-                sections.append(f"## {severity.upper()} Issues ({len(by_severity[severity])})\n\n")
+            by_severity[issue.get("severity", "unknown")].append(issue)
+        
+        for severity in _SEVERITY_ORDER:
+            bucket = by_severity.get(severity)
+            if bucket:
+                sections.append(f"## {severity.upper()} Issues ({len(bucket)})\n\n")
                 
-                for issue in by_severity[severity]:
-                    sections.append(f"### {issue.get('category', 'Unknown').title()}\n")
-                    sections.append(f"**Location:** {issue.get('location', 'Unknown')}\n\n")
-                    sections.append(f"**Description:** {issue.get('description', 'N/A')}\n\n")
-                    sections.append(f"**Suggestion:** {issue.get('suggestion', 'N/A')}\n\n")
-                    sections.append("---\n\n")
+                sections.append("".join(
+                    f"### {issue.get('category', 'Unknown').title()}\n"
+                    f"**Location:** {issue.get('location', 'Unknown')}\n\n"
+                    f"**Description:** {issue.get('description', 'N/A')}\n\n"
+                    f"**Suggestion:** {issue.get('suggestion', 'N/A')}\n\n"
+                    "---\n\n"
+                    for issue in bucket
+                ))
         
         return "".join(sections)
 
+    def get_manuscript_version(self, manuscript_id: str, version_name: str) -> Optional[str]:
+        """
+        Read a manuscript version's text.
+        
+        Args:
+            manuscript_id: Project ID
+            version_name: 'original', 'current', a stage name or a version filename
+            
+        Returns:
+            Version text, or None if the version doesn't exist
+        """
+        paths = self._paths(manuscript_id)
+        
+        if version_name in ("original", "current"):
+            candidates = [os.path.join(paths.manuscript_dir, f"{version_name}.txt")]
+        else:
+            versions_dir = paths.versions_dir
+            candidates = [
+                os.path.join(versions_dir, f"v_{version_name}.txt"),
+                os.path.join(versions_dir, f"{version_name}.txt"),
+                os.path.join(versions_dir, version_name),
+            ]
+        
+        for version_file in candidates:
+            if os.path.isfile(version_file):
+                return read_text(version_file)
+        return None
+    
     def compare_versions(self, manuscript_id: str, v1: str, v2: str) -> List[Dict[str, Any]]:
         """
         Compare two versions of a manuscript and return line-by-line diffs.
@@ -493,20 +875,7 @@ class ProjectManager:
             text1 = ""
         if text2 is None:
             text2 = ""
-            
-        lines1 = text1.splitlines()
-        lines2 = text2.splitlines()
-        
-        diff = difflib.ndiff(lines1, lines2)
-        changes = []
-        
-        for line in diff:
-            if line.startswith('  '):
-                changes.append({'type': 'unchanged', 'content': line[2:]})
-            elif line.startswith('- '):
-                changes.append({'type': 'removed', 'content': line[2:]})
-            elif line.startswith('+ '):
-                changes.append({'type': 'added', 'content': line[2:]})
-            # ? lines are hints, we skip them for simple display
-            
-        return changes
+        
+        if diff_match_patch is not None:
+            return _diff_lines_myers(text1, text2)
+        return _diff_lines_difflib(text1, text2)
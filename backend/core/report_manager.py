@@ -1,13 +1,20 @@
 """
 Report Manager - Save and retrieve editing reports
+
+Standalone writer for the flat backend/reports/ layout. The API persists
+stage reports through ProjectManager only; don't add ReportManager saves
+alongside ProjectManager ones, or every report is written twice.
 """
 
 import json
 import os
+import shutil
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional
 
+from core.io import write_bytes, write_json
+
 
 class ReportManager:
     """Manages saving and loading of editing reports"""
@@ -15,38 +22,50 @@ class ReportManager:
     def __init__(self, reports_dir: str = "backend/reports"):
         self.reports_dir = Path(reports_dir)
         self.reports_dir.mkdir(exist_ok=True)
+        # Manuscript directories already created by this instance
+        self._ensured_dirs: set = set()
+    
+    def _manuscript_dir(self, manuscript_id: str) -> Path:
+        """Report directory for a manuscript, created on first use"""
+        manuscript_dir = self.reports_dir / manuscript_id
+        key = str(manuscript_dir)
+        if key not in self._ensured_dirs:
+            manuscript_dir.mkdir(exist_ok=True)
+            self._ensured_dirs.add(key)
+        return manuscript_dir
     
     def save_acquisitions_report(self, manuscript_id: str, report: Dict):
         """Save Acquisitions Editor report"""
-        manuscript_dir = self.reports_dir / manuscript_id
-        manuscript_dir.mkdir(exist_ok=True)
+        manuscript_dir = self._manuscript_dir(manuscript_id)
         
         # Save editorial letter as markdown
         editorial_letter_path = manuscript_dir / "acquisitions_editorial_letter.md"
-        with open(editorial_letter_path, "w", encoding="utf-8") as f:
-            f.write(f"# Acquisitions Editor Report\n\n")
-            f.write(f"**Manuscript ID:** {manuscript_id}\n\n")
-            f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write("---\n\n")
-            f.write("## Editorial Letter\n\n")
-            f.write(report.get("editorial_letter", ""))
+        now = datetime.now()
+        md_content = (
+            f"# Acquisitions Editor Report\n\n"
+            f"**Manuscript ID:** {manuscript_id}\n\n"
+            f"**Date:** {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            "---\n\n"
+            "## Editorial Letter\n\n"
+            f"{report.get('editorial_letter', '')}"
+        )
+        write_bytes(editorial_letter_path, md_content.encode("utf-8"))
         
         # Save full report as JSON
         report_path = manuscript_dir / "acquisitions_report.json"
-        with open(report_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        write_json(report_path, report)
         
         print(f"✅ Saved Acquisitions report to {manuscript_dir}")
     
     def save_stage_report(self, manuscript_id: str, stage: str, issues: list, fixes_applied: int = 0):
         """Save review stage report (Developmental, Line, Copy, Proof)"""
-        manuscript_dir = self.reports_dir / manuscript_id
-        manuscript_dir.mkdir(exist_ok=True)
+        manuscript_dir = self._manuscript_dir(manuscript_id)
         
+        now = datetime.now()
         report_data = {
             "manuscript_id": manuscript_id,
             "stage": stage,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "total_issues": len(issues),
             "fixes_applied": fixes_applied,
             "issues": issues
@@ -54,33 +73,28 @@ class ReportManager:
         
         # Save as JSON
         report_path = manuscript_dir / f"{stage}_report.json"
-        with open(report_path, "w", encoding="utf-8") as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        write_json(report_path, report_data)
         
         # Save as Markdown
         md_path = manuscript_dir / f"{stage}_report.md"
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write(f"# {stage.title()} Editor Report\n\n")
-            f.write(f"**Manuscript ID:** {manuscript_id}\n\n")
-            f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"**Total Issues Found:** {len(issues)}\n\n")
-            f.write(f"**Fixes Applied:** {fixes_applied}\n\n")
-            f.write("---\n\n")
-            f.write("## Issues\n\n")
-            
-            for i, issue in enumerate(issues, 1):
-                severity = issue.get("severity", "unknown").upper()
-                category = issue.get("category", "unknown")
-                location = issue.get("location", "Unknown")
-                description = issue.get("description", "")
-                suggestion = issue.get("suggestion", "")
-                
-                f.write(f"### Issue {i}: {category}\n\n")
-                f.write(f"**Severity:** {severity}\n\n")
-                f.write(f"**Location:** {location}\n\n")
-                f.write(f"**Description:** {description}\n\n")
-                f.write(f"**Suggestion:** {suggestion}\n\n")
-                f.write("---\n\n")
+        md_content = (
+            f"# {stage.title()} Editor Report\n\n"
+            f"**Manuscript ID:** {manuscript_id}\n\n"
+            f"**Date:** {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            f"**Total Issues Found:** {len(issues)}\n\n"
+            f"**Fixes Applied:** {fixes_applied}\n\n"
+            "---\n\n"
+            "## Issues\n\n"
+        ) + "".join(
+            f"### Issue {i}: {issue.get('category', 'unknown')}\n\n"
+            f"**Severity:** {issue.get('severity', 'unknown').upper()}\n\n"
+            f"**Location:** {issue.get('location', 'Unknown')}\n\n"
+            f"**Description:** {issue.get('description', '')}\n\n"
+            f"**Suggestion:** {issue.get('suggestion', '')}\n\n"
+            "---\n\n"
+            for i, issue in enumerate(issues, 1)
+        )
+        write_bytes(md_path, md_content.encode("utf-8"))
         
         print(f"✅ Saved {stage} report to {manuscript_dir}")
     
@@ -116,23 +130,30 @@ class ReportManager:
         if not manuscript_dir.exists():
             return "No reports found"
         
-        complete_report = f"# Complete Editorial Report\n\n"
-        complete_report += f"**Manuscript ID:** {manuscript_id}\n\n"
-        complete_report += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        complete_report += "---\n\n"
-        
-        # Combine all markdown reports
-        for md_file in sorted(manuscript_dir.glob("*.md")):
-            with open(md_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                # Skip the header from individual reports
-                if "# " in content:
-                    content = content.split("\n", 1)[1]
-                complete_report += content + "\n\n"
-        
-        # Save complete report
         complete_path = manuscript_dir / "complete_report.md"
-        with open(complete_path, "w", encoding="utf-8") as f:
-            f.write(complete_report)
         
-        return complete_report
+        # Write straight to the file rather than building the report in memory
+        with open(complete_path, "w", encoding="utf-8") as out:
+            out.write(f"# Complete Editorial Report\n\n")
+            out.write(f"**Manuscript ID:** {manuscript_id}\n\n")
+            out.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            out.write("---\n\n")
+            
+            # Combine all markdown reports (not the complete report itself)
+            for md_file in sorted(manuscript_dir.glob("*.md")):
+                if md_file.name == complete_path.name:
+                    continue
+                with open(md_file, "r", encoding="utf-8") as f:
+                    # Skip the header from individual reports
+                    first_line = f.readline()
+                    if "# " in first_line:
+                        shutil.copyfileobj(f, out, length=65536)
+                    else:
+                        content = first_line + f.read()
+                        if "# " in content:
+                            content = content.split("\n", 1)[1]
+                        out.write(content)
+                out.write("\n\n")
+        
+        with open(complete_path, "r", encoding="utf-8") as f:
+            return f.read()
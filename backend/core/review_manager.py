@@ -4,111 +4,314 @@ Orchestrates all review agents to analyze manuscripts
 """
 
 import asyncio
-from typing import List, Dict, Any
-from pathlib import Path
-import json
+import functools
+import re
+from typing import List, Dict, Any, Tuple, Callable, Awaitable, Optional
 
-from agents.consistency_agent import ConsistencyAgent
-from agents.developmental_agent import DevelopmentalReviewAgent
-from agents.grammar_agent import GrammarAgent
-from agents.prose_quality_agent import ProseQualityAgent
-from agents.proofreading_agent import ProofreadingAgent
-from core.models import SeriesBible
+from agents.developmental_editor import DevelopmentalEditor
+from agents.line_editor import LineEditor
+from agents.copy_editor import CopyEditor
+from agents.proofreader import Proofreader
+from core.style_sheet import StyleSheet
 from core.issue import Issue
 from core.llm_client import LLMClient
 
 
+# Maximum agent LLM calls in flight at once
+REVIEW_CONCURRENCY = 8
+
+# Chapter heading lines, e.g. "# Chapter 3" or "CHAPTER ONE: The Storm"
+# (the chapter number/word may be followed by a ":", "." or dash and a title)
+_CHAPTER_HEADING_RE = re.compile(
+    r'(?im)^([ \t]*(?:#+[ \t]*)?chapter[ \t]+(?:\d+|[a-z]+(?:-[a-z]+)?)(?:[ \t]*[:.\-\u2013\u2014][^\n]*)?)[ \t]*$'
+)
+
+# (result key, agent attribute, progress message, issue label), in report order
+REVIEW_STAGES = (
+    ('developmental', 'developmental_editor', "📚 Analyzing story development...", "developmental"),
+    ('line', 'line_editor', "✍️  Evaluating prose and voice...", "line edit"),
+    ('copy', 'copy_editor', "📝 Checking grammar and consistency...", "copy edit"),
+    ('proof', 'proofreader', "🔎 Final proofreading pass...", "proofreading"),
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _split_chapters(manuscript_text: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Split a manuscript on its chapter headings.
+    
+    Cached, so re-reviewing the same text (retries, live and batch runs)
+    splits it once; the result is a tuple so it can be shared safely.
+    
+    Args:
+        manuscript_text: Full manuscript text
+        
+    Returns:
+        (chapter id, chapter text) pairs in manuscript order. Text before the
+        first heading is its own "Front matter" chunk; a manuscript without
+        headings is returned whole as a single "Manuscript" chunk.
+    """
+    parts = _CHAPTER_HEADING_RE.split(manuscript_text)
+    if len(parts) == 1:
+        return (("Manuscript", manuscript_text),)
+    
+    chapters = []
+    if parts[0].strip():
+        chapters.append(("Front matter", parts[0]))
+    # split() alternates heading, body after the leading text
+    for heading, body in zip(parts[1::2], parts[2::2]):
+        chapters.append((heading.strip().lstrip('#').strip(), heading + body))
+    return tuple(chapters)
+
+
 class MultiStageReviewManager:
     """Manages the multi-stage manuscript review process"""
     
-    def __init__(self):
-        llm_client = LLMClient()
-        self.consistency_agent = ConsistencyAgent(llm_client)
-        self.developmental_agent = DevelopmentalReviewAgent(llm_client)
-        self.grammar_agent = GrammarAgent(llm_client)
-        self.prose_agent = ProseQualityAgent(llm_client)
-        self.proofreading_agent = ProofreadingAgent(llm_client)
+    def __init__(self, llm_client: Optional[LLMClient] = None):
+        """
+        Initialize the review agents.
+        
+        Args:
+            llm_client: LLM client the agents share; a new one when None
+        """
+        if llm_client is None:
+            llm_client = LLMClient()
+        self.llm_client = llm_client
+        self.developmental_editor = DevelopmentalEditor(llm_client)
+        self.line_editor = LineEditor(llm_client)
+        self.copy_editor = CopyEditor(llm_client)
+        self.proofreader = Proofreader(llm_client)
     
     async def review_manuscript(
         self,
         manuscript_text: str,
-        bible: SeriesBible,
-        manuscript_id: str
+        style_sheet: StyleSheet,
+        manuscript_id: str,
+        on_progress: Optional[Callable[[str, int], Awaitable[None]]] = None
     ) -> Dict[str, Any]:
         """
         Run all review agents on the manuscript.
         
         Args:
             manuscript_text: Full manuscript text
-            bible: Series Bible for consistency checking
+            style_sheet: Style Sheet for consistency checking
             manuscript_id: Unique manuscript identifier
+            on_progress: Optional async callback(message, percent), called as
+                issues stream in and as each (stage, chapter) call finishes
             
         Returns:
             Dictionary with all issues found by all agents
         """
         print(f"\n🔍 Starting multi-stage review for manuscript {manuscript_id}")
         
+        # Each agent reviews one chapter per call, so prompts stay chapter
+        # sized and a stage takes as long as its longest chapter. All
+        # (stage, chapter) calls are independent and run at once
+        chapters = _split_chapters(manuscript_text)
+        print(f"\n🚀 Running all review stages in parallel over {len(chapters)} chapter(s)...")
+        for _, _, description, _ in REVIEW_STAGES:
+            print(f"   {description}")
+        
+        bible_prompts = self._render_bible_prompts(style_sheet)
+        semaphore = asyncio.Semaphore(REVIEW_CONCURRENCY)
+        total_calls = len(REVIEW_STAGES) * len(chapters)
+        completed_calls = 0
+        issues_found = 0
+        
+        async def run_chunk(agent_attr: str, chapter_text: str) -> List[Issue]:
+            nonlocal completed_calls, issues_found
+            agent = getattr(self, agent_attr)
+            issues = []
+            try:
+                async with semaphore:
+                    # Streamed, so progress reports issues as they're parsed
+                    async for issue in agent.astream_execute(chapter_text, style_sheet, **bible_prompts.get(agent_attr, {})):
+                        issues.append(issue)
+                        issues_found += 1
+                        if on_progress:
+                            await on_progress(
+                                f"Found {issues_found} issues so far",
+                                completed_calls * 100 // total_calls
+                            )
+                return issues
+            finally:
+                completed_calls += 1
+                if on_progress:
+                    await on_progress(
+                        f"Reviewed {completed_calls}/{total_calls} chapter passes",
+                        completed_calls * 100 // total_calls
+                    )
+        
+        results = await asyncio.gather(
+            *[
+                run_chunk(agent_attr, chapter_text)
+                for _, agent_attr, _, _ in REVIEW_STAGES
+                for _, chapter_text in chapters
+            ],
+            return_exceptions=True
+        )
+        
+        return self._collect_results(manuscript_id, chapters, results)
+    
+    async def review_manuscript_batch(
+        self,
+        manuscript_text: str,
+        style_sheet: StyleSheet,
+        manuscript_id: str
+    ) -> Dict[str, Any]:
+        """
+        Run all review agents on the manuscript, with the single-prompt
+        stages sent as one offline Batch API job.
+        
+        Batched calls cost about half as much and sit outside the provider's
+        rate limits, but the job can take hours, so this is for
+        non-interactive runs (CI, corpus regression reviews). Only agents
+        with a single-prompt form (build_prompt/parse_response) can be
+        batched; the multi-prompt stages run live while the job is pending.
+        
+        Args:
+            manuscript_text: Full manuscript text
+            style_sheet: Style Sheet for consistency checking
+            manuscript_id: Unique manuscript identifier
+            
+        Returns:
+            Dictionary with all issues found by all agents
+        """
+        print(f"\n🔍 Starting batch multi-stage review for manuscript {manuscript_id}")
+        
+        chapters = _split_chapters(manuscript_text)
+        batch_attrs = [
+            agent_attr for _, agent_attr, _, _ in REVIEW_STAGES
+            if hasattr(getattr(self, agent_attr), 'build_prompt')
+        ]
+        bible_prompts = self._render_bible_prompts(style_sheet)
+        prompts = {}
+        for agent_attr in batch_attrs:
+            agent = getattr(self, agent_attr)
+            for chapter_index, (_, chapter_text) in enumerate(chapters):
+                prompts[f"{agent_attr}:{chapter_index}"] = agent.build_prompt(
+                    chapter_text, style_sheet, **bible_prompts.get(agent_attr, {})
+                )
+        
+        semaphore = asyncio.Semaphore(REVIEW_CONCURRENCY)
+        
+        async def run_live(agent_attr: str, chapter_text: str) -> List[Issue]:
+            async with semaphore:
+                return await getattr(self, agent_attr).aexecute(
+                    chapter_text, style_sheet, **bible_prompts.get(agent_attr, {})
+                )
+        
+        live_calls = [
+            run_live(agent_attr, chapter_text)
+            for _, agent_attr, _, _ in REVIEW_STAGES
+            if agent_attr not in batch_attrs
+            for _, chapter_text in chapters
+        ]
+        responses, live_results = await asyncio.gather(
+            self.llm_client.arun_batch_job(prompts, temperature=0.3),
+            asyncio.gather(*live_calls, return_exceptions=True)
+        )
+        
+        # Route each response back to the agent that built its prompt
+        results = []
+        live_results = iter(live_results)
+        for _, agent_attr, _, _ in REVIEW_STAGES:
+            if agent_attr not in batch_attrs:
+                results.extend(next(live_results) for _ in chapters)
+                continue
+            agent = getattr(self, agent_attr)
+            for chapter_index in range(len(chapters)):
+                try:
+                    results.append(agent.parse_response(responses[f"{agent_attr}:{chapter_index}"]))
+                except Exception as e:
+                    results.append(e)
+        
+        return self._collect_results(manuscript_id, chapters, results)
+
+    def _render_bible_prompts(self, style_sheet: StyleSheet) -> Dict[str, Dict[str, str]]:
+        """
+        Render each stage's Style Sheet prompt fragment once per review.
+
+        The fragment is the same for every chapter, so it's rendered here
+        rather than in every (stage, chapter) call. Only agents with a
+        render_bible_prompt take one.
+
+        Args:
+            style_sheet: Style Sheet for consistency checking
+
+        Returns:
+            Agent attribute -> keyword arguments for its execute calls
+        """
+        bible_prompts = {}
+        for _, agent_attr, _, _ in REVIEW_STAGES:
+            agent = getattr(self, agent_attr)
+            if hasattr(agent, 'render_bible_prompt'):
+                bible_prompts[agent_attr] = {'bible_prompt': agent.render_bible_prompt(style_sheet)}
+        return bible_prompts
+
+    def _collect_results(
+        self,
+        manuscript_id: str,
+        chapters: Tuple[Tuple[str, str], ...],
+        results: List[Any]
+    ) -> Dict[str, Any]:
+        """
+        Build the review result from per-(stage, chapter) issue lists.
+        
+        Args:
+            manuscript_id: Unique manuscript identifier
+            chapters: Chapters from _split_chapters
+            results: Issue lists (or the exception a call raised), stage-major
+                in REVIEW_STAGES order, one per chapter
+            
+        Returns:
+            Dictionary with all issues found by all agents
+        """
         all_issues = []
         agent_results = {}
         
-        # Stage 1: Consistency Check (uses Bible)
-        print("\n📖 Stage 1: Checking consistency against Series Bible...")
-        consistency_issues = self.consistency_agent.execute(manuscript_text, bible)
-        all_issues.extend(consistency_issues)
-        agent_results['consistency'] = {
-            'count': len(consistency_issues),
-            'issues': [self._issue_to_dict(i) for i in consistency_issues]
-        }
-        print(f"   Found {len(consistency_issues)} consistency issues")
-        
-        # Stage 2: Developmental Review
-        print("\n📚 Stage 2: Analyzing story development...")
-        developmental_issues = self.developmental_agent.execute(manuscript_text, bible)
-        all_issues.extend(developmental_issues)
-        agent_results['developmental'] = {
-            'count': len(developmental_issues),
-            'issues': [self._issue_to_dict(i) for i in developmental_issues]
-        }
-        print(f"   Found {len(developmental_issues)} developmental issues")
-        
-        # Stage 3: Prose Quality
-        print("\n✍️  Stage 3: Evaluating prose quality...")
-        prose_issues = self.prose_agent.execute(manuscript_text, bible)
-        all_issues.extend(prose_issues)
-        agent_results['prose'] = {
-            'count': len(prose_issues),
-            'issues': [self._issue_to_dict(i) for i in prose_issues]
-        }
-        print(f"   Found {len(prose_issues)} prose quality issues")
-        
-        # Stage 4: Grammar Check
-        print("\n📝 Stage 4: Checking grammar and mechanics...")
-        grammar_issues = self.grammar_agent.execute(manuscript_text, bible)
-        all_issues.extend(grammar_issues)
-        agent_results['grammar'] = {
-            'count': len(grammar_issues),
-            'issues': [self._issue_to_dict(i) for i in grammar_issues]
-        }
-        print(f"   Found {len(grammar_issues)} grammar issues")
-        
-        # Stage 5: Final Proofreading
-        print("\n🔎 Stage 5: Final proofreading pass...")
-        proofreading_issues = self.proofreading_agent.execute(manuscript_text, bible)
-        all_issues.extend(proofreading_issues)
-        agent_results['proofreading'] = {
-            'count': len(proofreading_issues),
-            'issues': [self._issue_to_dict(i) for i in proofreading_issues]
-        }
-        print(f"   Found {len(proofreading_issues)} proofreading issues")
+        for stage_index, (name, _, _, label) in enumerate(REVIEW_STAGES):
+            stage_results = results[stage_index * len(chapters):(stage_index + 1) * len(chapters)]
+            stage_issues = []
+            failed = 0
+            for (chapter_id, _), issues in zip(chapters, stage_results):
+                if isinstance(issues, BaseException):
+                    # One failed chunk shouldn't discard the others' results,
+                    # but cancellation still propagates
+                    if not isinstance(issues, Exception):
+                        raise issues
+                    print(f"   ❌ {label.capitalize()} review failed for {chapter_id}: {issues}")
+                    failed += 1
+                    continue
+                # Tag each issue with the chapter it was found in, and number
+                # the stage's issues afresh: chapters run concurrently on one
+                # agent, so its own counter can repeat IDs across chapters
+                for issue in issues:
+                    issue_dict = self._issue_to_dict(issue)
+                    issue_dict['id'] = len(stage_issues) + 1
+                    issue_dict['chapter'] = chapter_id
+                    stage_issues.append((issue, issue_dict))
+            print(f"   Found {len(stage_issues)} {label} issues"
+                  + (f" ({failed} chapter(s) failed)" if failed else ""))
+            all_issues.extend(stage_issues)
+            agent_results[name] = {
+                'count': len(stage_issues),
+                'issues': [issue_dict for _, issue_dict in stage_issues]
+            }
         
-        # Calculate statistics
+        # Calculate statistics and categorize by severity in one pass
         total_issues = len(all_issues)
-        bible_conflicts = len([i for i in all_issues if i.is_bible_conflict])
-        
-        # Categorize by severity
-        critical = len([i for i in all_issues if i.severity == 'critical'])
-        major = len([i for i in all_issues if i.severity == 'major'])
-        minor = len([i for i in all_issues if i.severity == 'minor'])
+        bible_conflicts = critical = major = minor = 0
+        for issue, _ in all_issues:
+            if issue.bible_conflict:
+                bible_conflicts += 1
+            severity = issue.severity
+            if severity == 'critical':
+                critical += 1
+            elif severity == 'major':
+                major += 1
+            elif severity == 'minor':
+                minor += 1
         
         print(f"\n✅ Review complete!")
         print(f"   Total issues: {total_issues}")
@@ -125,19 +328,9 @@ class MultiStageReviewManager:
                 'minor': minor
             },
             'agent_results': agent_results,
-            'all_issues': [self._issue_to_dict(i) for i in all_issues]
+            'all_issues': [issue_dict for _, issue_dict in all_issues]
         }
     
     def _issue_to_dict(self, issue: Issue) -> Dict[str, Any]:
         """Convert Issue object to dictionary"""
-        return {
-            'type': issue.type,
-            'severity': issue.severity,
-            'chapter': issue.chapter,
-            'paragraph': issue.paragraph,
-            'line': issue.line,
-            'original_text': issue.original_text,
-            'suggestion': issue.suggestion,
-            'explanation': issue.explanation,
-            'is_bible_conflict': issue.is_bible_conflict
-        }
+        return issue.to_dict()
@@ -3,10 +3,12 @@ Style Sheet Model - Professional publishing style guide
 Replaces Series Bible with industry-standard style sheet
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from core.io import loads_json
+
 
 class CharacterStyle(BaseModel):
     """Character consistency rules"""
@@ -21,6 +23,9 @@ class CharacterStyle(BaseModel):
 
 class LocationStyle(BaseModel):
     """Location consistency rules"""
+    
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     description: str
     atmosphere: str = ""
@@ -29,6 +34,9 @@ class LocationStyle(BaseModel):
 
 class TimelineEvent(BaseModel):
     """Timeline consistency"""
+    
+    model_config = ConfigDict(frozen=True)
+    
     date: str
     day_of_week: Optional[str] = None
     event: str
@@ -37,6 +45,9 @@ class TimelineEvent(BaseModel):
 
 class ObjectStyle(BaseModel):
     """Object consistency rules"""
+    
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     description: str
     color: Optional[str] = None
@@ -107,12 +118,35 @@ class StyleSheet(BaseModel):
     editor_notes: str = ""
     
     # Timestamps
-    created_at: datetime = datetime.now()
-    updated_at: datetime = datetime.now()
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+    
+    # Memoized JSON serialization behind to_dict(), dropped on any attribute
+    # assignment
+    _json_cache: Optional[str] = PrivateAttr(default=None)
+    
+    # Lowercase character name -> index of its first match in characters.
+    # Checked against the list on every hit and rebuilt on a miss or a stale
+    # hit, so direct edits to characters never give wrong answers
+    _name_index: Dict[str, int] = PrivateAttr(default_factory=dict)
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name != "_json_cache":
+            self._json_cache = None
     
     def to_dict(self) -> dict:
-        """Convert to dictionary for API responses"""
-        return self.model_dump(mode='json')
+        """
+        Convert to dictionary for API responses.
+        
+        The serialized JSON is cached until the next attribute assignment and
+        each call parses a fresh dict from it, so callers may modify the
+        result. In-place edits to nested lists must be followed by an
+        assignment (e.g. updated_at) to be picked up.
+        """
+        if self._json_cache is None:
+            self._json_cache = self.model_dump_json()
+        return loads_json(self._json_cache)
     
     @classmethod
     def from_dict(cls, data: dict) -> "StyleSheet":
@@ -121,16 +155,52 @@ class StyleSheet(BaseModel):
     
     def update_character(self, name: str, **kwargs):
         """Update character style rules"""
-        for char in self.characters:
-            if char.name == name:
-                for key, value in kwargs.items():
+        self._apply_character_update(name, kwargs)
+        self.updated_at = datetime.now()
+    
+    def update_characters_bulk(self, updates: List[dict]):
+        """
+        Update several characters, refreshing updated_at once at the end.
+        
+        Args:
+            updates: One dict per character, with "name" plus the fields to
+                set (as update_character's keyword arguments)
+        """
+        for update in updates:
+            fields = dict(update)
+            self._apply_character_update(fields.pop("name"), fields)
+        self.updated_at = datetime.now()
+    
+    def _apply_character_update(self, name: str, fields: dict):
+        """Set fields on the named character, adding it if not found"""
+        index = self._character_index(name)
+        if index is not None:
+            char = self.characters[index]
+            if char.name != name:
+                # Indexed match differs in case; update needs the exact name
+                char = next((c for c in self.characters if c.name == name), None)
+            if char is not None:
+                for key, value in fields.items():
                     setattr(char, key, value)
-                self.updated_at = datetime.now()
                 return
         
         # Add new character if not found
-        self.characters.append(CharacterStyle(name=name, **kwargs))
-        self.updated_at = datetime.now()
+        self.characters.append(CharacterStyle(name=name, **fields))
+        self._name_index.setdefault(name.lower(), len(self.characters) - 1)
+    
+    def _character_index(self, name: str) -> Optional[int]:
+        """Index of the first character whose name matches case-insensitively"""
+        key = name.lower()
+        index = self._name_index
+        characters = self.characters
+        i = index.get(key)
+        if i is None or i >= len(characters) or characters[i].name.lower() != key:
+            # Rebuild in place (assigning would drop the to_dict() cache)
+            index.clear()
+            for j, char in enumerate(characters):
+                index.setdefault(char.name.lower(), j)
+            i = index.get(key)
+        return i
     
     def add_timeline_event(self, date: str, event: str, **kwargs):
         """Add timeline event"""
@@ -143,7 +213,5 @@ class StyleSheet(BaseModel):
     
     def get_character(self, name: str) -> Optional[CharacterStyle]:
         """Get character by name"""
-        for char in self.characters:
-            if char.name.lower() == name.lower():
-                return char
-        return None
+        i = self._character_index(name)
+        return self.characters[i] if i is not None else None
@@ -1,5 +1,5 @@
+import json
 import requests
-import time
 import sys
 
 BASE_URL = "http://localhost:8000"
@@ -18,28 +18,29 @@ def reproduce():
         task_id = data["task_id"]
         print(f"Started task: {task_id}")
         
-        # Poll
-        while True:
-            status_resp = requests.get(f"{BASE_URL}/tasks/{task_id}")
-            if status_resp.status_code != 200:
-                print(f"Failed to get status: {status_resp.text}")
-                break
-                
-            task_data = status_resp.json()
-            status = task_data.get("status")
-            progress = task_data.get("progress", 0)
-            message = task_data.get("message", "")
-            
-            print(f"Status: {status} | Progress: {progress}% | Message: {message}")
+        # Follow status changes over one Server-Sent Events connection
+        with requests.get(f"{BASE_URL}/tasks/{task_id}/stream", stream=True) as stream_resp:
+            if stream_resp.status_code != 200:
+                print(f"Failed to get status: {stream_resp.text}")
+                return
             
-            if status == "completed":
-                print("SUCCESS: Task completed!")
-                break
-            elif status == "failed":
-                print(f"FAILURE: Task failed with error: {task_data.get('error')}")
-                break
+            for line in stream_resp.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data: "):
+                    continue
+                
+                task_data = json.loads(line[len("data: "):])
+                status = task_data.get("status")
+                progress = task_data.get("progress", 0)
+                message = task_data.get("message", "")
+                
+                print(f"Status: {status} | Progress: {progress}% | Message: {message}")
                 
-            time.sleep(2)
+                if status == "completed":
+                    print("SUCCESS: Task completed!")
+                    break
+                elif status == "failed":
+                    print(f"FAILURE: Task failed with error: {task_data.get('error')}")
+                    break
             
     except Exception as e:
         print(f"Error: {e}")
@@ -3,7 +3,6 @@ CLI tool for reviewing and editing Series Bible
 Interactive terminal interface
 """
 
-import json
 import sys
 from pathlib import Path
 from rich.console import Console
@@ -14,6 +13,7 @@ from rich.panel import Panel
 sys.path.append('.')
 
 from core.models import SeriesBible, Character, Location, TimelineEvent, Object
+from core.io import read_json, write_json
 
 console = Console()
 
@@ -23,9 +23,7 @@ class BibleReviewer:
     
     def __init__(self, bible_path: str):
         """Load Bible from JSON file"""
-        with open(bible_path, 'r') as f:
-            data = json.load(f)
-        self.bible = SeriesBible.from_dict(data)
+        self.bible = SeriesBible.from_dict(read_json(bible_path))
         self.bible_path = bible_path
         self.modified = False
     
@@ -120,17 +118,20 @@ class BibleReviewer:
         char = self.bible.characters[idx]
         console.print(f"\n[bold]Editing: {char.name}[/bold]")
         
-        # Edit fields
-        char.name = Prompt.ask("Name", default=char.name)
+        # Edit fields (Character is frozen, so build an updated copy)
+        name = Prompt.ask("Name", default=char.name)
         
         age_str = Prompt.ask("Age", default=str(char.age) if char.age else "")
-        char.age = int(age_str) if age_str else None
         
-        char.eye_color = Prompt.ask("Eye color", default=char.eye_color or "")
-        char.hair = Prompt.ask("Hair", default=char.hair or "")
-        char.occupation = Prompt.ask("Occupation", default=char.occupation or "")
-        char.personality_traits = Prompt.ask("Personality traits", default=char.personality_traits or "")
-        char.first_appears = Prompt.ask("First appears", default=char.first_appears or "")
+        self.bible.characters[idx] = char.model_copy(update={
+            "name": name,
+            "age": int(age_str) if age_str else None,
+            "eye_color": Prompt.ask("Eye color", default=char.eye_color or ""),
+            "hair": Prompt.ask("Hair", default=char.hair or ""),
+            "occupation": Prompt.ask("Occupation", default=char.occupation or ""),
+            "personality_traits": Prompt.ask("Personality traits", default=char.personality_traits or ""),
+            "first_appears": Prompt.ask("First appears", default=char.first_appears or ""),
+        })
         
         self.modified = True
         console.print("[green]Character updated[/green]")
@@ -215,8 +216,7 @@ class BibleReviewer:
     def save(self):
         """Save changes to Bible"""
         if self.modified:
-            with open(self.bible_path, 'w') as f:
-                json.dump(self.bible.to_dict(), f, indent=2)
+            write_json(self.bible_path, self.bible.to_dict())
             console.print(f"\n[green]✅ Changes saved to {self.bible_path}[/green]")
         else:
             console.print("\n[yellow]No changes to save[/yellow]")
@@ -6,9 +6,9 @@ Run this to test the Bible extraction on a sample manuscript
 import sys
 sys.path.append('.')
 
-from core.llm_client import LLMClient
+from core.llm_client import get_llm_client
 from agents.series_bible_manager import SeriesBibleManager
-import json
+from core.io import write_json
 
 
 # Sample manuscript for testing
@@ -58,7 +58,7 @@ def main():
     
     # Initialize LLM client
     print("Initializing LLM client...")
-    llm_client = LLMClient()
+    llm_client = get_llm_client()
     
     # Initialize Series Bible Manager
     print("Initializing Series Bible Manager...")
@@ -130,8 +130,7 @@ def main():
     
     # Save to JSON
     output_file = "test_bible.json"
-    with open(output_file, 'w') as f:
-        json.dump(bible.to_dict(), f, indent=2)
+    write_json(output_file, bible.to_dict())
     
     print(f"\n\n✅ Series Bible saved to: {output_file}")
     print("\n" + "=" * 60)
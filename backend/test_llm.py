@@ -5,10 +5,10 @@ Quick test to verify LLM is working
 import sys
 sys.path.append('.')
 
-from core.llm_client import LLMClient
+from core.llm_client import get_llm_client
 
 # Test LLM
-llm = LLMClient()
+llm = get_llm_client()
 
 prompt = """Return ONLY a JSON array with one test issue:
 [
@@ -6,14 +6,14 @@ import sys
 sys.path.append('.')
 
 from agents.base import Agent
-from core.llm_client import LLMClient
+from core.llm_client import get_llm_client
 
 class TestAgent(Agent):
     def execute(self):
         pass
 
 # Test the parse_json_response method
-llm = LLMClient()
+llm = get_llm_client()
 agent = TestAgent("test", llm)
 
 # Test with markdown fence
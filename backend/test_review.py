@@ -1,84 +1,85 @@
 """
 Test script for review agents
+
+Pass --batch to submit the developmental review as a Batch API job.
 """
 
+import asyncio
 import sys
 sys.path.append('.')
 
-from core.llm_client import LLMClient
-from agents.series_bible_manager import SeriesBibleManager
-from agents.consistency_agent import ConsistencyAgent
-from agents.developmental_agent import DevelopmentalReviewAgent
-from agents.grammar_agent import GrammarAgent
-
-
-SAMPLE_MANUSCRIPT = """
-# Chapter 1
-
-Detective Sarah Martinez, 28, walked into the precinct. Her blue eyes scanned the room.
-
-"Morning," said her partner Mike Chen, 35.
-
-Sarah hung up her red wool coat.
+from core.llm_client import get_llm_client
+from core.style_sheet import StyleSheet
+from agents.style_sheet_extractor import StyleSheetExtractor
+from agents.developmental_editor import DevelopmentalEditor
+from agents.line_editor import LineEditor
+from agents.copy_editor import CopyEditor
+from tests.fixtures import MANUSCRIPTS
 
-# Chapter 10
 
-On Wednesday, October 18th, Sarah pulled her blue coat tighter. Her brown eyes looked tired.
-
-Mike, now 36, handed her coffee.
-"""
+SAMPLE_MANUSCRIPT = MANUSCRIPTS["mystery_sarah"]
 
 
-def main():
+async def main():
     print("=" * 60)
     print("EditScribe - Review Agents Test")
     print("=" * 60)
     
-    llm_client = LLMClient()
-    
-    # 1. Extract Bible
-    print("\n1. Extracting Series Bible...")
-    bible_manager = SeriesBibleManager(llm_client)
-    bible = bible_manager.execute(SAMPLE_MANUSCRIPT, "test_002")
+    llm_client = get_llm_client()
     
-    print(f"   Characters: {[c.name for c in bible.characters]}")
+    # 1. Extract Style Sheet
+    print("\n1. Extracting Style Sheet...")
+    extractor = StyleSheetExtractor(llm_client)
+    style_sheet = await extractor.extract(SAMPLE_MANUSCRIPT, StyleSheet(manuscript_id="test_002"))
     
-    # 2. Run Consistency Agent
-    print("\n2. Running Consistency Agent...")
-    consistency_agent = ConsistencyAgent(llm_client)
-    consistency_issues = consistency_agent.execute(SAMPLE_MANUSCRIPT, bible)
+    print(f"   Characters: {[c.name for c in style_sheet.characters]}")
     
-    print(f"\n   Found {len(consistency_issues)} consistency issues:")
-    for issue in consistency_issues:
-        print(f"   {issue}")
-    
-    # 3. Run Developmental Agent
-    print("\n3. Running Developmental Agent...")
-    dev_agent = DevelopmentalReviewAgent(llm_client)
-    dev_issues = dev_agent.execute(SAMPLE_MANUSCRIPT, bible)
+    # 2-4. Run the review agents. They only read the manuscript and Style
+    # Sheet, so all three run at once and the test waits for the slowest
+    print("\n2-4. Running Developmental, Line and Copy Editors in parallel...")
+    dev_agent = DevelopmentalEditor(llm_client)
+    line_editor = LineEditor(llm_client)
+    copy_editor = CopyEditor(llm_client)
+    if "--batch" in sys.argv:
+        # Bulk/CI runs: the developmental prompt goes in a Batch API job at
+        # half the cost. The Line and Copy Editors make several calls each,
+        # so they have no single prompt to batch and run live meanwhile
+        responses, line_issues, copy_issues = await asyncio.gather(
+            llm_client.arun_batch_job({
+                "developmental": dev_agent.build_prompt(SAMPLE_MANUSCRIPT, style_sheet),
+            }, temperature=0.3),
+            line_editor.aexecute(SAMPLE_MANUSCRIPT, style_sheet),
+            copy_editor.aexecute(SAMPLE_MANUSCRIPT, style_sheet)
+        )
+        dev_issues = dev_agent.parse_response(responses["developmental"])
+    else:
+        dev_issues, line_issues, copy_issues = await asyncio.gather(
+            dev_agent.aexecute(SAMPLE_MANUSCRIPT, style_sheet),
+            line_editor.aexecute(SAMPLE_MANUSCRIPT, style_sheet),
+            copy_editor.aexecute(SAMPLE_MANUSCRIPT, style_sheet)
+        )
     
     print(f"\n   Found {len(dev_issues)} developmental issues:")
     for issue in dev_issues:
         print(f"   {issue}")
     
-    # 4. Run Grammar Agent
-    print("\n4. Running Grammar Agent...")
-    grammar_agent = GrammarAgent(llm_client)
-    grammar_issues = grammar_agent.execute(SAMPLE_MANUSCRIPT)
+    print(f"\n   Found {len(line_issues)} line edit issues:")
+    for issue in line_issues:
+        print(f"   {issue}")
     
-    print(f"\n   Found {len(grammar_issues)} grammar issues:")
-    for issue in grammar_issues:
+    print(f"\n   Found {len(copy_issues)} copy edit issues:")
+    for issue in copy_issues:
         print(f"   {issue}")
     
     # Summary
-    total = len(consistency_issues) + len(dev_issues) + len(grammar_issues)
+    total = len(dev_issues) + len(line_issues) + len(copy_issues)
     print(f"\n{'=' * 60}")
     print(f"TOTAL ISSUES FOUND: {total}")
-    print(f"  - Consistency (Bible conflicts): {len(consistency_issues)}")
     print(f"  - Developmental: {len(dev_issues)}")
-    print(f"  - Grammar: {len(grammar_issues)}")
+    print(f"  - Line edit: {len(line_issues)}")
+    print(f"  - Copy edit (incl. Style Sheet conflicts): {len(copy_issues)}")
     print(f"{'=' * 60}")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,7 +1,14 @@
 import requests
 import os
 
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
 BASE_URL = "http://localhost:8000"
+# (connect, read) seconds, so a dead backend fails fast instead of hanging
+TIMEOUT = (5, 60)
 
 def test_upload():
     # Create a dummy md file
@@ -12,8 +19,16 @@ def test_upload():
     print(f"Uploading {filename}...")
     try:
         with open(filename, "rb") as f:
-            files = {"file": (filename, f, "text/markdown")}
-            resp = requests.post(f"{BASE_URL}/upload", files=files)
+            if MultipartEncoder:
+                # Streams the file from disk instead of building the whole
+                # multipart body in memory
+                encoder = MultipartEncoder(fields={"file": (filename, f, "text/markdown")})
+                resp = requests.post(f"{BASE_URL}/upload", data=encoder,
+                                     headers={"Content-Type": encoder.content_type},
+                                     timeout=TIMEOUT)
+            else:
+                files = {"file": (filename, f, "text/markdown")}
+                resp = requests.post(f"{BASE_URL}/upload", files=files, timeout=TIMEOUT)
             
         if resp.status_code == 200:
             print("SUCCESS: Upload completed!")
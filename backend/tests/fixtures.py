@@ -0,0 +1,53 @@
+"""
+Sample manuscripts shared by the test and verification scripts
+"""
+
+MANUSCRIPTS = {
+    # Short thriller opening with a deliberate typo ("recieved") for the
+    # Copy Editor to find and fix
+    "thriller_typo": """
+Chapter 1
+
+The elevator descended down in a smooth, expensive silence that was characteristic of German engineering. Max leaned against the back wall, his blue eyes scanning the floor numbers. He recieved the letter yesterday. It was Monday, March 15th.
+
+"I don't know," Sarah said. She walked into the room.
+"You don't know what?" Max asked.
+"Anything."
+
+The room was filled with a bluish light that had a pallor that reminded Max of a morgue.
+""",
+    # Two chapters with Bible conflicts (coat colour, eye colour, ages)
+    "mystery_sarah": """
+# Chapter 1
+
+Detective Sarah Martinez, 28, walked into the precinct. Her blue eyes scanned the room.
+
+"Morning," said her partner Mike Chen, 35.
+
+Sarah hung up her red wool coat.
+
+# Chapter 10
+
+On Wednesday, October 18th, Sarah pulled her blue coat tighter. Her brown eyes looked tired.
+
+Mike, now 36, handed her coffee.
+""",
+    # mystery_sarah plus telling-not-showing prose for the prose agents
+    "mystery_sarah_prose": """
+# Chapter 1
+
+Detective Sarah Martinez, 28, walked into the precinct. Her blue eyes scanned the room.
+
+"Morning," said her partner Mike Chen, 35.
+
+Sarah hung up her red wool coat.
+
+She was angry about the case. She felt frustrated.
+
+# Chapter 10
+
+On Wednesday, October 18th, Sarah pulled her blue coat tighter. Her brown eyes looked tired.
+
+Mike, now 36, handed her coffee. "We need to talk," he said quietly.
+""",
+}
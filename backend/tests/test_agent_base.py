@@ -0,0 +1,72 @@
+"""
+Test the Agent base class's streamed JSON array parsing
+"""
+
+import sys
+import os
+import asyncio
+import json
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.base import Agent
+
+
+class EchoAgent(Agent):
+    """Minimal concrete agent; only the base class's helpers are tested"""
+
+    def __init__(self):
+        super().__init__("test", llm_client=None)
+
+    def execute(self, *args, **kwargs):
+        return []
+
+
+ITEMS = [
+    {"quote": "She said, \"Stop]\" and left.", "description": "Comma, [bracket] and \\ backslash"},
+    {"line": 12345, "score": -0.75e2, "flags": [True, False, None]},
+    "café — 📖",
+    987654321,
+    [],
+]
+
+
+def parse_chunks(chunks):
+    """Run aiter_json_items over the given chunks and collect the items"""
+    async def source():
+        for chunk in chunks:
+            yield chunk
+
+    async def collect():
+        return [item async for item in EchoAgent().aiter_json_items(source())]
+
+    return asyncio.run(collect())
+
+
+def test_aiter_json_items_every_split():
+    """Test that splitting the response at any point gives the same items"""
+    response = "```json\n" + json.dumps(ITEMS, indent=2) + "\n```"
+    escaped = "```json\n" + json.dumps(ITEMS, ensure_ascii=True) + "\n```"
+
+    for text in (response, escaped):
+        for i in range(len(text) + 1):
+            # One split anywhere: inside strings, escapes, numbers and literals
+            assert parse_chunks([text[:i], text[i:]]) == ITEMS, f"Split at {i}: {text[i - 5:i + 5]!r}"
+
+    print(f"✓ All {len(response) + len(escaped) + 2} splits parsed")
+
+
+def test_aiter_json_items_char_by_char():
+    """Test one-character chunks, and that items arrive before the array closes"""
+    text = json.dumps(ITEMS)
+    assert parse_chunks(list(text)) == ITEMS
+
+    # Everything but the last element is yielded once its "," has arrived
+    assert parse_chunks([text[:text.rindex(",")] + ","]) == ITEMS[:-1]
+
+
+def test_aiter_json_items_no_array():
+    """Test that a response without a JSON array yields nothing"""
+    assert parse_chunks(["I found ", "no issues."]) == []
+    assert parse_chunks(["[", "]"]) == []
@@ -1,9 +1,13 @@
 """
 Test Cold Reader integration and sequential workflow enforcement
+
+The tests are independent, so they can run in parallel with pytest-xdist:
+    pytest -n 3 tests/test_cold_reader_flow.py
 """
 
 import sys
 import os
+import uuid
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -19,7 +23,7 @@ def test_cold_reader_sequential_enforcement():
     print("\n=== Testing Sequential Enforcement ===")
     
     managing_editor = ManagingEditor()
-    manuscript_id = "test_manuscript_001"
+    manuscript_id = f"test_manuscript_{uuid.uuid4().hex}"
     
     # Start workflow
     workflow = managing_editor.start_workflow(manuscript_id)
@@ -41,9 +45,8 @@ def test_cold_reader_sequential_enforcement():
         EditingStage.PROOF
     ]
     
-    for stage in stages_to_complete:
-        workflow = managing_editor.mark_stage_complete(manuscript_id, stage, issues_found=0)
-        print(f"✓ Completed {stage.value}, next: {workflow.current_stage.value if workflow.current_stage else 'None'}")
+    workflow = managing_editor.mark_stages_complete(manuscript_id, stages_to_complete, issues_found=0)
+    print(f"✓ Completed {', '.join(stage.value for stage in stages_to_complete)}, next: {workflow.current_stage.value if workflow.current_stage else 'None'}")
     
     # Now Cold Read should be available
     can_run, reason = managing_editor.can_run_stage(manuscript_id, EditingStage.COLD_READ)
@@ -82,11 +85,13 @@ def test_cold_reader_agent_execution():
     )
     
     try:
-        llm_client = LLMClient()
+        # The manuscript is fixed, so cache every response (not just the
+        # low-temperature ones) and only the first run calls the LLM
+        llm_client = LLMClient(cache_dir=".llm_cache")
         agent = ColdReader(llm_client)
         
         print("✓ Cold Reader agent initialized")
-        print("✓ Running agent execution (this will call LLM)...")
+        print("✓ Running agent execution (this will call LLM unless cached)...")
         
         result = agent.execute(test_manuscript, style_sheet)
         
@@ -121,7 +126,7 @@ def test_workflow_completion():
     print("\n=== Testing Workflow Completion ===")
     
     managing_editor = ManagingEditor()
-    manuscript_id = "test_manuscript_002"
+    manuscript_id = f"test_manuscript_{uuid.uuid4().hex}"
     
     # Start and complete all stages
     workflow = managing_editor.start_workflow(manuscript_id)
@@ -135,8 +140,7 @@ def test_workflow_completion():
         EditingStage.COLD_READ
     ]
     
-    for stage in all_stages:
-        workflow = managing_editor.mark_stage_complete(manuscript_id, stage, issues_found=0)
+    workflow = managing_editor.mark_stages_complete(manuscript_id, all_stages, issues_found=0)
     
     # Check workflow is complete
     assert workflow.completed_at is not None, "Workflow should be marked complete"
@@ -147,30 +151,3 @@ def test_workflow_completion():
     
     print("\n✅ Workflow completion test PASSED")
 
-
-if __name__ == "__main__":
-    print("="*60)
-    print("COLD READER INTEGRATION TESTS")
-    print("="*60)
-    
-    try:
-        # Test 1: Sequential enforcement
-        test_cold_reader_sequential_enforcement()
-        
-        # Test 2: Agent execution
-        test_cold_reader_agent_execution()
-        
-        # Test 3: Workflow completion
-        test_workflow_completion()
-        
-        print("\n" + "="*60)
-        print("ALL TESTS PASSED ✅")
-        print("="*60)
-        
-    except Exception as e:
-        print("\n" + "="*60)
-        print("TESTS FAILED ❌")
-        print("="*60)
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
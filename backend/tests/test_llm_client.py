@@ -0,0 +1,115 @@
+"""
+Test LLMClient request building and its Anthropic batch job (no API calls)
+"""
+
+import sys
+import os
+import asyncio
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.llm_client import LLMClient
+
+
+class FakeBatches:
+    """Message Batches stand-in: answers each request with its own prompt"""
+
+    def __init__(self, fail_prompt):
+        self.fail_prompt = fail_prompt
+        self.requests = []
+
+    async def create(self, requests):
+        self.requests = requests
+        return SimpleNamespace(id="batch_1", processing_status="in_progress")
+
+    async def retrieve(self, batch_id):
+        return SimpleNamespace(id=batch_id, processing_status="ended")
+
+    async def results(self, batch_id):
+        async def entries():
+            # Results come back in no particular order
+            for request in reversed(self.requests):
+                prompt = request["params"]["messages"][0]["content"]
+                if prompt == self.fail_prompt:
+                    result = SimpleNamespace(type="errored")
+                else:
+                    result = SimpleNamespace(type="succeeded", message=SimpleNamespace(
+                        content=[SimpleNamespace(text=f" answer to {prompt} ")],
+                        usage=SimpleNamespace(input_tokens=10, output_tokens=5)
+                    ))
+                yield SimpleNamespace(custom_id=request["custom_id"], result=result)
+        return entries()
+
+
+def test_anthropic_batch_maps_results_by_custom_id(monkeypatch):
+    """Test that responses come back under the caller's ids, whatever their order"""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    llm_client = LLMClient(provider="anthropic")
+    batches = FakeBatches(fail_prompt="prompt 2")
+    llm_client._async_client_factory = lambda: SimpleNamespace(messages=SimpleNamespace(batches=batches))
+
+    # Caller ids with characters Anthropic doesn't allow in custom ids
+    prompts = {
+        "developmental_editor:0": "prompt 0",
+        "developmental_editor:1": "prompt 1",
+        "line editor/2": "prompt 2",
+    }
+    results = asyncio.run(llm_client.arun_batch_job(prompts, poll_interval=0))
+
+    assert [request["custom_id"] for request in batches.requests] == ["req-0", "req-1", "req-2"]
+    assert results == {
+        "developmental_editor:0": "answer to prompt 0",
+        "developmental_editor:1": "answer to prompt 1",
+        "line editor/2": "",
+    }
+    assert llm_client.total_requests == 2
+    assert (llm_client.total_input_tokens, llm_client.total_output_tokens) == (20, 10)
+
+
+def test_async_client_per_event_loop(monkeypatch):
+    """Test that each event loop gets its own async SDK client, shared within it"""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    llm_client = LLMClient(provider="gemini")
+    other_client = LLMClient(provider="gemini")
+
+    async def clients():
+        return llm_client.async_client, llm_client.async_client, other_client.async_client
+
+    first = asyncio.run(clients())
+    second = asyncio.run(clients())
+
+    # Shared within a loop (and across LLMClients), never reused by a later loop
+    assert first[0] is first[1] is first[2]
+    assert second[0] is second[1] is second[2]
+    assert first[0] is not second[0]
+    # Sync clients are still shared for the whole process
+    assert llm_client.client is other_client.client
+
+
+def test_build_request(monkeypatch):
+    """Test the request kwargs each provider gets, streamed or not"""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+
+    anthropic_request = LLMClient(provider="anthropic")._build_request(
+        "prompt", 100, 0.3, shared_context="MANUSCRIPT", stream=True
+    )
+    assert anthropic_request["system"] == "You are a professional manuscript editor."
+    assert anthropic_request["messages"][0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert anthropic_request["stream"] is True
+    assert "stream_options" not in anthropic_request
+
+    llm_client = LLMClient(provider="gemini")
+    assert llm_client._build_request("prompt", 100, 0.3, system_prompt="Be brief") == {
+        "model": llm_client.model,
+        "messages": [
+            {"role": "system", "content": "Be brief"},
+            {"role": "user", "content": "prompt"},
+        ],
+        "max_tokens": 100,
+        "temperature": 0.3,
+    }
+    stream_request = llm_client._build_request("prompt", 100, 0.3, stream=True)
+    assert stream_request["stream_options"] == {"include_usage": True}
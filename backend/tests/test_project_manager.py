@@ -0,0 +1,73 @@
+"""
+Test ProjectManager's cached JSON loads and report loading
+"""
+
+import sys
+import os
+import asyncio
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core import project_manager as pm
+from core.project_manager import ProjectManager
+
+
+def test_cached_loads_return_independent_copies(tmp_path):
+    """Test that mutating a loaded report doesn't leak into the next load"""
+    manager = ProjectManager(base_dir=tmp_path)
+    manager.create_project("book", "Book", "Chapter 1\n\nText.")
+    manager.save_stage_report("book", "line", [{"id": 1, "status": "open"}])
+
+    first = manager.load_stage_report("book", "line")
+    first["issues"][0]["status"] = "applied"
+    first["issues"].append({"id": 2})
+
+    assert manager.load_stage_report("book", "line")["issues"] == [{"id": 1, "status": "open"}]
+
+    # Saving replaces the file, so the next load sees the new content
+    manager.save_stage_report("book", "line", [{"id": 3, "status": "open"}])
+    assert manager.load_stage_report("book", "line")["issues"] == [{"id": 3, "status": "open"}]
+
+
+def test_json_cache_is_bounded(tmp_path, monkeypatch):
+    """Test that the cache evicts the least recently used file"""
+    monkeypatch.setattr(pm, "_JSON_CACHE_SIZE", 2)
+    manager = ProjectManager(base_dir=tmp_path)
+    for manuscript_id in ("a", "b", "c"):
+        manager.create_project(manuscript_id, manuscript_id.upper(), "Text.")
+        manager.save_workflow_status(manuscript_id, {"manuscript_id": manuscript_id})
+
+    manager.load_workflow_status("a")
+    manager.load_workflow_status("b")
+    manager.load_workflow_status("a")
+    manager.load_workflow_status("c")
+
+    cached = [os.path.basename(os.path.dirname(os.path.dirname(path))) for path in manager._json_cache]
+    assert cached == ["a", "c"]
+    assert manager.load_workflow_status("b") == {"manuscript_id": "b"}
+
+
+def test_load_all_reports_and_complete_report(tmp_path):
+    """Test that the one-pass loader finds only existing reports, in both report paths"""
+    manager = ProjectManager(base_dir=tmp_path)
+    manager.create_project("book", "Book", "Chapter 1\n\nText.")
+    assert manager.load_all_reports("book") == {}
+
+    manager.save_stage_report("book", "line", [{"id": 1, "severity": "minor", "description": "Wordy"}])
+    manager.save_stage_report("book", "proof", [])
+
+    reports = manager.load_all_reports("book")
+    assert sorted(reports) == ["line", "proof"]
+    assert all(isinstance(body, bytes) for body in reports.values())
+
+    stage_reports = asyncio.run(manager.load_all_stage_reports("book"))
+    assert stage_reports["line"] == reports["line"].decode("utf-8")
+    assert stage_reports["developmental"] is None
+
+    report = manager.generate_complete_report("book")
+    assert "## Line Editor Report" in report and "## Proof Editor Report" in report
+    assert "## Developmental Editor Report" not in report
+    # Pre-loaded and self-loaded reports agree, apart from the timestamp line
+    strip = lambda text: [line for line in text.splitlines() if not line.startswith("Generated:")]
+    assert strip(manager.generate_complete_report("book", stage_reports)) == strip(report)
@@ -0,0 +1,33 @@
+"""
+Test StyleSheet's memoized to_dict
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.style_sheet import StyleSheet, CharacterStyle
+
+
+def test_to_dict_returns_independent_copies():
+    """Test that to_dict matches model_dump and callers can't corrupt the cache"""
+    style_sheet = StyleSheet(
+        manuscript_id="test_style",
+        characters=[CharacterStyle(name="Sarah", personality_traits=["stubborn"])],
+        preferred_terms={"e-mail": "email"}
+    )
+
+    first = style_sheet.to_dict()
+    assert first == style_sheet.model_dump(mode='json')
+
+    first["characters"][0]["personality_traits"].append("reckless")
+    first["preferred_terms"].clear()
+    second = style_sheet.to_dict()
+    assert second["characters"][0]["personality_traits"] == ["stubborn"]
+    assert second["preferred_terms"] == {"e-mail": "email"}
+
+    # Assignment drops the cache
+    style_sheet.title = "Renamed"
+    assert style_sheet.to_dict()["title"] == "Renamed"
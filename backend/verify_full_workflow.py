@@ -4,21 +4,22 @@ import os
 import sys
 import json
 
+sys.path.append('.')
+from core.io import loads_json
+from tests.fixtures import MANUSCRIPTS
+
+# uvloop (installed with uvicorn[standard] on Linux/macOS) is a faster event loop
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Base URL
 BASE_URL = "http://localhost:8000"
 
 # Dummy Manuscript Content
-MANUSCRIPT_CONTENT = """
-Chapter 1
-
-The elevator descended down in a smooth, expensive silence that was characteristic of German engineering. Max leaned against the back wall, his blue eyes scanning the floor numbers. He recieved the letter yesterday. It was Monday, March 15th.
-
-"I don't know," Sarah said. She walked into the room.
-"You don't know what?" Max asked.
-"Anything."
-
-The room was filled with a bluish light that had a pallor that reminded Max of a morgue.
-"""
+MANUSCRIPT_CONTENT = MANUSCRIPTS["thriller_typo"]
 
 async def run_verification():
     print("🚀 Starting Full Workflow Verification...")
@@ -33,7 +34,7 @@ async def run_verification():
             print(f"❌ Upload failed: {response.text}")
             return
         
-        data = response.json()
+        data = loads_json(response.content)
         manuscript_id = data["manuscript_id"]
         print(f"✅ Upload successful. ID: {manuscript_id}")
         
@@ -52,7 +53,7 @@ async def run_verification():
             print(f"❌ Acquisitions failed: {response.text}")
             return
         
-        acq_data = response.json()
+        acq_data = loads_json(response.content)
         if "marketing_blurb" in acq_data["report"] and "synopsis" in acq_data["report"]:
              print("✅ Acquisitions Report valid (Blurb & Synopsis found).")
         else:
@@ -65,7 +66,7 @@ async def run_verification():
             print(f"❌ Developmental failed: {response.text}")
             return
         
-        dev_data = response.json()
+        dev_data = loads_json(response.content)
         issues = dev_data.get("issues", [])
         print(f"✅ Developmental complete. Found {len(issues)} issues.")
         if issues and "original_text" in issues[0]:
@@ -80,7 +81,7 @@ async def run_verification():
             print(f"❌ Line edit failed: {response.text}")
             return
             
-        line_data = response.json()
+        line_data = loads_json(response.content)
         issues = line_data.get("issues", [])
         print(f"✅ Line edit complete. Found {len(issues)} issues.")
         if issues and "original_text" in issues[0]:
@@ -93,7 +94,7 @@ async def run_verification():
             print(f"❌ Copy edit failed: {response.text}")
             return
             
-        copy_data = response.json()
+        copy_data = loads_json(response.content)
         issues = copy_data.get("issues", [])
         print(f"✅ Copy edit complete. Found {len(issues)} issues.")
         if issues and "original_text" in issues[0]:
@@ -106,7 +107,7 @@ async def run_verification():
             print(f"❌ Proofread failed: {response.text}")
             return
             
-        proof_data = response.json()
+        proof_data = loads_json(response.content)
         issues = proof_data.get("issues", [])
         print(f"✅ Proofread complete. Found {len(issues)} issues.")
         if issues and "original_text" in issues[0]:
@@ -122,7 +123,7 @@ async def run_verification():
             response = await client.post(f"{BASE_URL}/workflow/{manuscript_id}/proof/apply-fixes", json=payload)
             
             if response.status_code == 200:
-                fix_data = response.json()
+                fix_data = loads_json(response.content)
                 print(f"   ✅ Fix applied successfully. Fixes count: {fix_data['fixes_applied']}")
                 print(f"   📝 New Text Snippet: {fix_data['edited_text'][100:200]}...") # Print a snippet
             else:
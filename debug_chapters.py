@@ -1,24 +1,34 @@
 
+import logging
+import os
 import re
 
+logging.basicConfig(level=os.getenv("LOGLEVEL", "INFO"), format="%(message)s")
+log = logging.getLogger(__name__)
+
 file_path = r"c:\Users\3dmax\Libriscribe\manuscript_original.md"
 
-with open(file_path, 'r', encoding='utf-8') as f:
-    text = f.read()
+# Test DocumentParser logic
+chapter_pattern = re.compile(r'(?i)(chapter\s+\d+|#\s+chapter\s+\d+)')
 
-print(f"Total lines: {len(text.splitlines())}")
+# Stream the file line by line instead of reading it whole
+log.info("\n--- Lines containing 'Chapter' ---")
+matches = []
+total_lines = 0
+with open(file_path, 'r', encoding='utf-8') as f:
+    for i, line in enumerate(f, 1):
+        total_lines = i
+        line = line.rstrip('\n')
+        if "Chapter" in line:
+            # Lazy args: nothing is formatted when INFO is disabled
+            log.info("%d: %s", i, line)
+        # Cheap substring check first; the regex only runs on candidate lines
+        if "hapter" in line or "HAPTER" in line:
+            matches.extend(chapter_pattern.findall(line))
 
-# Find all lines with "Chapter"
-print("\n--- Lines containing 'Chapter' ---")
-lines = text.splitlines()
-for i, line in enumerate(lines):
-    if "Chapter" in line:
-        print(f"{i+1}: {line}")
+log.info("Total lines: %d", total_lines)
 
-# Test DocumentParser logic
-print("\n--- DocumentParser Logic ---")
-chapter_pattern = r'(?i)(chapter\s+\d+|#\s+chapter\s+\d+)'
-matches = re.findall(chapter_pattern, text)
-print(f"Matches found: {len(matches)}")
+log.info("\n--- DocumentParser Logic ---")
+log.info("Matches found: %d", len(matches))
 for m in matches:
-    print(f"Match: '{m}'")
+    log.info("Match: '%s'", m)
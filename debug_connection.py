@@ -1,5 +1,6 @@
 
-import requests
+import asyncio
+import httpx
 import socket
 
 def check_port(host, port):
@@ -12,21 +13,33 @@ def check_port(host, port):
     except:
         return False
 
-def check_url(url):
+async def check_url(client, url):
     try:
-        response = requests.get(url, timeout=2)
+        response = await client.get(url)
         return response.status_code, response.json()
     except Exception as e:
         return str(e)
 
-print("Diagnostic Report:")
-print(f"Checking 127.0.0.1:8000 directly via Socket: {check_port('127.0.0.1', 8000)}")
-print(f"Checking localhost:8000 directly via Socket: {check_port('localhost', 8000)}")
+async def main():
+    # All four probes run at once, so the report takes one timeout at worst
+    async with httpx.AsyncClient(timeout=2) as client:
+        port_ip, port_localhost, health_ip, health_localhost = await asyncio.gather(
+            asyncio.to_thread(check_port, '127.0.0.1', 8000),
+            asyncio.to_thread(check_port, 'localhost', 8000),
+            check_url(client, "http://127.0.0.1:8000/"),
+            check_url(client, "http://localhost:8000/")
+        )
 
-print("-" * 20)
-print("Checking API Health (127.0.0.1):")
-print(check_url("http://127.0.0.1:8000/"))
+    print("Diagnostic Report:")
+    print(f"Checking 127.0.0.1:8000 directly via Socket: {port_ip}")
+    print(f"Checking localhost:8000 directly via Socket: {port_localhost}")
 
-print("-" * 20)
-print("Checking API Health (localhost):")
-print(check_url("http://localhost:8000/"))
+    print("-" * 20)
+    print("Checking API Health (127.0.0.1):")
+    print(health_ip)
+
+    print("-" * 20)
+    print("Checking API Health (localhost):")
+    print(health_localhost)
+
+asyncio.run(main())
@@ -4,28 +4,114 @@ Simplifies running the complete editorial workflow
 """
 
 import requests
+import argparse
 import json
+import os
+import stat
 import sys
 import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Seconds a fetched workflow status is reused, so bursts of polls share a GET
+STATUS_CACHE_TTL = 0.2
+
+# (connect, read) timeout for the lightweight status GET
+STATUS_TIMEOUT = (2, 5)
+
+
+# Largest manuscript uploaded without complaint (override with --max-size-mb)
+DEFAULT_MAX_SIZE_MB = 100
+
+# Stage name -> workflow endpoint, in workflow order
+_ENDPOINTS = types.MappingProxyType({
+    'acquisitions': 'acquisitions',
+    'developmental': 'developmental',
+    'line': 'line',
+    'copy': 'copy',
+    'proof': 'proof',
+    'cold-read': 'cold-read'
+})
 
 
 class EditScribeClient:
     """Simple client for EditScribe API"""
     
+    # Editorial stages, in workflow order
+    STAGES = tuple(_ENDPOINTS)
+    
     def __init__(self, base_url="http://localhost:8000"):
         self.base_url = base_url
+        # (connect, read) seconds: stages run LLM calls, so reads can be slow,
+        # but a dead backend should fail fast instead of hanging the workflow
+        self.connect_timeout = 5
+        self.read_timeout = 600
+        # One session for every call, so the workflow reuses pooled
+        # keep-alive connections. Retry transient gateway errors; urllib3
+        # never retries POSTs, so stages can't run twice
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # manuscript_id -> (fetched at, status)
+        self._status_cache = {}
+    
+    @property
+    def _timeout(self):
+        return (self.connect_timeout, self.read_timeout)
+    
+    def _json(self, response):
+        """Parse a response body (orjson when available)"""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    def close(self):
+        """Close the session's pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
         
     def upload_manuscript(self, file_path):
         """Upload a manuscript file"""
         print(f"\n📤 Uploading manuscript: {file_path}")
         
         with open(file_path, 'rb') as f:
-            files = {'file': f}
-            response = requests.post(f"{self.base_url}/upload", files=files)
+            if MultipartEncoder:
+                # Streams the file from disk instead of building the whole
+                # multipart body in memory
+                encoder = MultipartEncoder(fields={'file': (Path(file_path).name, f, 'application/octet-stream')})
+                response = self.session.post(f"{self.base_url}/upload", data=encoder,
+                                             headers={'Content-Type': encoder.content_type},
+                                             timeout=self._timeout)
+            else:
+                files = {'file': f}
+                response = self.session.post(f"{self.base_url}/upload", files=files, timeout=self._timeout)
             
         if response.status_code == 200:
-            data = response.json()
+            data = self._json(response)
             print(f"✅ Upload successful!")
             print(f"   Manuscript ID: {data['manuscript_id']}")
             print(f"   Word count: {data['word_count']:,}")
@@ -38,24 +124,16 @@ class EditScribeClient:
         """Run a specific editorial stage"""
         print(f"\n🔄 Running {stage_name.upper()} stage...")
         
-        endpoint_map = {
-            'acquisitions': 'acquisitions',
-            'developmental': 'developmental',
-            'line': 'line',
-            'copy': 'copy',
-            'proof': 'proof',
-            'cold-read': 'cold-read'
-        }
-        
-        endpoint = endpoint_map.get(stage_name)
+        endpoint = _ENDPOINTS.get(stage_name)
         if not endpoint:
             print(f"❌ Unknown stage: {stage_name}")
             return False
         
-        response = requests.post(f"{self.base_url}/workflow/{manuscript_id}/{endpoint}")
+        response = self.session.post(f"{self.base_url}/workflow/{manuscript_id}/{endpoint}", timeout=self._timeout)
         
         if response.status_code == 200:
-            data = response.json()
+            data = self._json(response)
+            self._status_cache.pop(manuscript_id, None)
             print(f"✅ {stage_name.upper()} complete!")
             
             if 'total_issues' in data:
@@ -67,27 +145,33 @@ class EditScribeClient:
             return False
     
     def get_workflow_status(self, manuscript_id):
-        """Get current workflow status"""
-        response = requests.get(f"{self.base_url}/workflow/{manuscript_id}/status")
+        """Get current workflow status (cached for STATUS_CACHE_TTL seconds)"""
+        cached = self._status_cache.get(manuscript_id)
+        if cached and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+            return cached[1]
+        
+        response = self.session.get(f"{self.base_url}/workflow/{manuscript_id}/status", timeout=STATUS_TIMEOUT)
         
         if response.status_code == 200:
-            return response.json()
+            status = self._json(response)
+            self._status_cache[manuscript_id] = (time.monotonic(), status)
+            return status
         return None
     
     def get_stage_result(self, manuscript_id, stage_name):
         """Get results from a completed stage"""
-        response = requests.get(f"{self.base_url}/workflow/{manuscript_id}/{stage_name}/result")
+        response = self.session.get(f"{self.base_url}/workflow/{manuscript_id}/{stage_name}/result", timeout=self._timeout)
         
         if response.status_code == 200:
-            return response.json()
+            return self._json(response)
         return None
     
     def get_complete_report(self, manuscript_id):
         """Get complete editorial report"""
-        response = requests.get(f"{self.base_url}/projects/{manuscript_id}/complete-report")
+        response = self.session.get(f"{self.base_url}/projects/{manuscript_id}/complete-report", timeout=self._timeout)
         
         if response.status_code == 200:
-            return response.json()
+            return self._json(response)
         return None
 
 
@@ -102,116 +186,146 @@ def run_complete_workflow(client, manuscript_id, include_cold_read=True):
     """Run the complete editorial workflow"""
     
     stages = [
-        'acquisitions',
-        'developmental',
-        'line',
-        'copy',
-        'proof'
+        stage for stage in EditScribeClient.STAGES
+        if include_cold_read or stage != 'cold-read'
     ]
     
-    if include_cold_read:
-        stages.append('cold-read')
-    
     print(f"\n📋 Running {len(stages)} editorial stages...")
     
+    # Stages must run in order: the server rejects a stage until the previous
+    # one is complete, and each edits the text the next one reviews. Each POST
+    # returns when its stage is done, so no pause is needed between them
     for stage in stages:
         success = client.run_stage(manuscript_id, stage)
         if not success:
             print(f"\n⚠️  Workflow stopped at {stage}")
             return False
-        time.sleep(1)  # Brief pause between stages
     
     return True
 
 
-def save_results(client, manuscript_id, output_dir):
-    """Save all results to files"""
+def save_results(client, manuscript_id, output_dir, bundle=False):
+    """
+    Save all results to files.
+    
+    Args:
+        client: EditScribeClient to fetch results with
+        manuscript_id: Manuscript whose results to save
+        output_dir: Directory to write into
+        bundle: Write one reports.ndjson (a {"stage", "report"} record per
+            line) instead of a JSON file per report
+    """
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
     
     print(f"\n💾 Saving results to: {output_path}")
     
-    # Save complete report
-    report = client.get_complete_report(manuscript_id)
-    if report:
-        with open(output_path / "complete_report.json", 'w') as f:
-            json.dump(report, f, indent=2)
-        print(f"   ✅ Saved complete_report.json")
-    
-    # Save individual stage results
-    stages = ['acquisitions', 'developmental', 'line', 'copy', 'proof', 'cold-read']
+    # Fetch the complete report and every stage result at once over the
+    # client's pooled session, then write them in a fixed order
+    stages = EditScribeClient.STAGES
+    with ThreadPoolExecutor(max_workers=len(stages) + 1) as executor:
+        downloads = [("complete", executor.submit(client.get_complete_report, manuscript_id))]
+        downloads += [
+            (stage, executor.submit(client.get_stage_result, manuscript_id, stage))
+            for stage in stages
+        ]
+        
+        records = []
+        for name, future in downloads:
+            result = future.result()
+            if not result:
+                continue
+            if bundle:
+                records.append({"stage": name, "report": result})
+                continue
+            
+            filename = f"{name}_report.json"
+            if orjson is not None:
+                (output_path / filename).write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path / filename, 'w') as f:
+                    json.dump(result, f, indent=2)
+            print(f"   ✅ Saved {filename}")
     
-    for stage in stages:
-        result = client.get_stage_result(manuscript_id, stage)
-        if result:
-            with open(output_path / f"{stage}_report.json", 'w') as f:
-                json.dump(result, f, indent=2)
-            print(f"   ✅ Saved {stage}_report.json")
-
+    if bundle:
+        if orjson is not None:
+            lines = [orjson.dumps(record) for record in records]
+        else:
+            lines = [json.dumps(record).encode('utf-8') for record in records]
+        (output_path / "reports.ndjson").write_bytes(b"".join(line + b"\n" for line in lines))
+        print(f"   ✅ Saved reports.ndjson ({len(records)} reports)")
 
 def main():
     """Main entry point"""
     print_banner()
     
-    # Check if manuscript file provided
-    if len(sys.argv) < 2:
-        print("\n❌ Usage: python quick_start.py <manuscript_file.docx>")
-        print("\nExample:")
-        print("   python quick_start.py my_novel.docx")
-        print("\nOptions:")
-        print("   --no-cold-read    Skip the optional Cold Reader stage")
-        print("   --output-dir DIR  Save results to specific directory (default: ./results)")
-        sys.exit(1)
-    
-    manuscript_file = sys.argv[1]
-    include_cold_read = '--no-cold-read' not in sys.argv
+    parser = argparse.ArgumentParser(
+        description="Run the complete EditScribe editorial workflow on a manuscript",
+        epilog="Example: python quick_start.py my_novel.docx"
+    )
+    parser.add_argument("manuscript", help="Manuscript file to edit (e.g. my_novel.docx)")
+    parser.add_argument("--no-cold-read", action="store_true",
+                        help="Skip the optional Cold Reader stage")
+    parser.add_argument("--output-dir", default="./results",
+                        help="Save results to specific directory (default: ./results)")
+    parser.add_argument("--bundle", action="store_true",
+                        help="Save all reports to one reports.ndjson file")
+    parser.add_argument("--max-size-mb", type=float, default=DEFAULT_MAX_SIZE_MB,
+                        help=f"Refuse manuscripts larger than this many MB (default: {DEFAULT_MAX_SIZE_MB})")
+    args = parser.parse_args()
     
-    # Get output directory
-    output_dir = "./results"
-    if '--output-dir' in sys.argv:
-        idx = sys.argv.index('--output-dir')
-        if idx + 1 < len(sys.argv):
-            output_dir = sys.argv[idx + 1]
+    manuscript_file = args.manuscript
+    include_cold_read = not args.no_cold_read
+    bundle = args.bundle
+    output_dir = args.output_dir
+    max_size_mb = args.max_size_mb
     
-    # Check file exists
-    if not Path(manuscript_file).exists():
+    # Check the file once: it exists, is a regular file and isn't oversized
+    try:
+        st = os.stat(manuscript_file)
+    except FileNotFoundError:
         print(f"\n❌ File not found: {manuscript_file}")
         sys.exit(1)
-    
-    # Initialize client
-    client = EditScribeClient()
-    
-    # Upload manuscript
-    manuscript_id = client.upload_manuscript(manuscript_file)
-    if not manuscript_id:
+    if not stat.S_ISREG(st.st_mode):
+        print(f"\n❌ Not a file: {manuscript_file}")
+        sys.exit(1)
+    if st.st_size > max_size_mb * 1024 * 1024:
+        print(f"\n❌ File is {st.st_size / (1024 * 1024):.1f} MB, over the {max_size_mb:g} MB limit: {manuscript_file}")
         sys.exit(1)
     
-    # Run workflow
-    print(f"\n{'='*60}")
-    print("Starting Editorial Workflow")
-    print(f"{'='*60}")
-    
-    success = run_complete_workflow(client, manuscript_id, include_cold_read)
-    
-    if success:
+    # Initialize client
+    with EditScribeClient() as client:
+        # Upload manuscript
+        manuscript_id = client.upload_manuscript(manuscript_file)
+        if not manuscript_id:
+            sys.exit(1)
+        
+        # Run workflow
         print(f"\n{'='*60}")
-        print("✅ WORKFLOW COMPLETE!")
+        print("Starting Editorial Workflow")
         print(f"{'='*60}")
         
-        # Save results
-        save_results(client, manuscript_id, output_dir)
+        success = run_complete_workflow(client, manuscript_id, include_cold_read)
         
-        print(f"\n📊 Summary:")
-        print(f"   Manuscript ID: {manuscript_id}")
-        print(f"   Results saved to: {output_dir}")
-        print(f"\n💡 Next steps:")
-        print(f"   1. Review the complete_report.json")
-        print(f"   2. Check individual stage reports for detailed feedback")
-        print(f"   3. Review your manuscript in: backend/projects/{manuscript_id}/")
+        if success:
+            print(f"\n{'='*60}")
+            print("✅ WORKFLOW COMPLETE!")
+            print(f"{'='*60}")
+            
+            # Save results
+            save_results(client, manuscript_id, output_dir, bundle)
+            
+            print(f"\n📊 Summary:")
+            print(f"   Manuscript ID: {manuscript_id}")
+            print(f"   Results saved to: {output_dir}")
+            print(f"\n💡 Next steps:")
+            print(f"   1. Review the complete_report.json")
+            print(f"   2. Check individual stage reports for detailed feedback")
+            print(f"   3. Review your manuscript in: backend/projects/{manuscript_id}/")
         
-    else:
-        print(f"\n❌ Workflow failed. Check the error messages above.")
-        sys.exit(1)
+        else:
+            print(f"\n❌ Workflow failed. Check the error messages above.")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
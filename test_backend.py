@@ -1,12 +1,15 @@
 import requests
 
+# (connect, read) seconds, so a dead backend fails fast instead of hanging
+TIMEOUT = (5, 60)
+
 # Test the backend API
 print("Testing EditScribe Backend API...")
 print("="*50)
 
 # Test 1: Health check
 try:
-    response = requests.get("http://localhost:8000/")
+    response = requests.get("http://localhost:8000/", timeout=TIMEOUT)
     print(f"\n✓ Health Check: {response.status_code}")
     print(f"  Response: {response.json()}")
 except Exception as e:
@@ -21,7 +24,7 @@ The detective walked into the room.
 """
     
     files = {'file': ('test.txt', test_content, 'text/plain')}
-    response = requests.post("http://localhost:8000/upload", files=files)
+    response = requests.post("http://localhost:8000/upload", files=files, timeout=TIMEOUT)
     
     print(f"\n✓ Upload Test: {response.status_code}")
     if response.status_code == 200:
@@ -7,14 +7,16 @@ def test_download():
     
     print(f"Testing download from {url}")
     try:
-        response = requests.get(url)
-        print(f"Status Code: {response.status_code}")
-        print(f"Headers: {response.headers}")
-        if response.status_code == 200:
-            print("Look first 100 chars:")
-            print(response.text[:100])
-        else:
-            print(f"Error: {response.text}")
+        # Stream, so only the first chunk of the manuscript is downloaded
+        with requests.get(url, stream=True, timeout=10) as response:
+            print(f"Status Code: {response.status_code}")
+            print(f"Headers: {response.headers}")
+            if response.status_code == 200:
+                print("Look first 100 chars:")
+                head = next(response.iter_content(1024), b"")
+                print(head.decode(response.encoding or "utf-8", errors="replace")[:100])
+            else:
+                print(f"Error: {response.text}")
     except Exception as e:
         print(f"Request failed: {e}")
 
@@ -4,8 +4,9 @@ Test Style Sheet Extraction
 import sys
 sys.path.insert(0, 'backend')
 
-from core.llm_client import LLMClient
+from core.llm_client import get_llm_client
 from core.style_sheet import StyleSheet
+from core.document_parser import DocumentParser
 from agents.style_sheet_extractor import StyleSheetExtractor
 
 # Test text
@@ -23,13 +24,13 @@ print("Testing Style Sheet Extraction...")
 print("=" * 50)
 
 # Create LLM client
-llm = LLMClient()
+llm = get_llm_client()
 
 # Create empty style sheet
 style_sheet = StyleSheet(
     manuscript_id="test-123",
     title="Test Manuscript",
-    word_count=len(test_text.split())
+    word_count=DocumentParser.get_word_count(test_text)
 )
 
 # Extract entities
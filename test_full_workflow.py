@@ -3,6 +3,10 @@ import os
 
 BASE_URL = "http://localhost:8000"
 FILE_PATH = "sample_manuscript.txt"
+# (connect, read) seconds, so a dead backend fails fast instead of hanging;
+# stages run LLM calls, so they get a longer read timeout
+TIMEOUT = (5, 60)
+STAGE_TIMEOUT = (5, 600)
 
 def run_workflow():
     print(f"--- Simulating Author Workflow ---")
@@ -18,7 +22,7 @@ def run_workflow():
     with open(FILE_PATH, "rb") as f:
         files = {"file": (FILE_PATH, f, "text/plain")}
         try:
-            res = requests.post(f"{BASE_URL}/upload", files=files)
+            res = requests.post(f"{BASE_URL}/upload", files=files, timeout=TIMEOUT)
             if res.status_code != 200:
                 print(f"[!] Upload Failed: {res.status_code} - {res.text}")
                 return
@@ -35,7 +39,7 @@ def run_workflow():
 
     # 4. Check Initial Stage Status (Acquisitions)
     print(f"[ ] Checking initial stage status...")
-    res = requests.get(f"{BASE_URL}/workflow/{manuscript_id}/acquisitions/result")
+    res = requests.get(f"{BASE_URL}/workflow/{manuscript_id}/acquisitions/result", timeout=TIMEOUT)
     if res.status_code == 404:
         print(f"[x] Acquisitions stage is ready (No result yet).")
     else:
@@ -45,7 +49,7 @@ def run_workflow():
     print(f"[ ] Running Acquisitions Agent...")
     try:
         # Note: This might take time with a real LLM, but for dev we expect it to work
-        res = requests.post(f"{BASE_URL}/workflow/{manuscript_id}/acquisitions")
+        res = requests.post(f"{BASE_URL}/workflow/{manuscript_id}/acquisitions", timeout=STAGE_TIMEOUT)
         if res.status_code == 200:
             print(f"[x] Acquisitions Agent Completed Successfully.")
             result = res.json()
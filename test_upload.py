@@ -5,6 +5,8 @@ import requests
 import sys
 
 API_URL = "http://localhost:8000"
+# (connect, read) seconds, so a dead backend fails fast instead of hanging
+TIMEOUT = (5, 60)
 
 def test_upload():
     """Test uploading a file to EditScribe"""
@@ -33,7 +35,7 @@ Sarah's pulse quickened. "Let's go."
     # Test 1: Health check
     print("\n1. Testing API health...")
     try:
-        response = requests.get(f"{API_URL}/")
+        response = requests.get(f"{API_URL}/", timeout=TIMEOUT)
         print(f"   ✓ API is running: {response.json()}")
     except Exception as e:
         print(f"   ✗ API not responding: {e}")
@@ -46,7 +48,7 @@ Sarah's pulse quickened. "Let's go."
     print("\n2. Testing file upload...")
     try:
         files = {'file': ('test_manuscript.txt', test_content.encode(), 'text/plain')}
-        response = requests.post(f"{API_URL}/upload", files=files)
+        response = requests.post(f"{API_URL}/upload", files=files, timeout=TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
@@ -2,8 +2,7 @@
 Update all agents to use parse_json_response instead of json.loads
 """
 
-import os
-import re
+import ast
 
 # List of agent files to update
 agent_files = [
@@ -14,24 +13,58 @@ agent_files = [
     'backend/agents/proofreading_agent.py'
 ]
 
+REPLACEMENT = b'self.parse_json_response(response)'
+
+
+def find_json_loads_calls(tree):
+    """Yield the json.loads(response) calls in a parsed module, however they're spaced"""
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == 'loads'
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == 'json'
+            and len(node.args) == 1
+            and not node.keywords
+            and isinstance(node.args[0], ast.Name)
+            and node.args[0].id == 'response'
+        ):
+            yield node
+
+
 for filepath in agent_files:
     print(f"\nUpdating {filepath}...")
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
+
+    with open(filepath, 'rb') as f:
         content = f.read()
-    
-    # Replace json.loads(response) with self.parse_json_response(response)
-    updated_content = re.sub(
-        r'json\.loads\(response\)',
-        'self.parse_json_response(response)',
-        content
+
+    # Parse once and splice each matching call by position (ast offsets are
+    # UTF-8 byte columns, so work on the raw bytes)
+    lines = content.splitlines(keepends=True)
+    line_starts = [0]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line))
+
+    spans = sorted(
+        (
+            (line_starts[call.lineno - 1] + call.col_offset,
+             line_starts[call.end_lineno - 1] + call.end_col_offset)
+            for call in find_json_loads_calls(ast.parse(content, filepath))
+        ),
+        reverse=True
     )
-    
+
+    # Replace json.loads(response) with self.parse_json_response(response)
+    updated_content = content
+    for start, end in spans:
+        updated_content = updated_content[:start] + REPLACEMENT + updated_content[end:]
+
     # Check if anything changed
-    if updated_content != content:
-        with open(filepath, 'w', encoding='utf-8') as f:
+    if spans:
+        with open(filepath, 'wb') as f:
             f.write(updated_content)
-        print(f"✅ Updated {filepath}")
+        print(f"✅ Updated {filepath} ({len(spans)} call(s))")
     else:
         print(f"⏭️  No changes needed for {filepath}")
 